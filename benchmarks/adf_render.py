@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ADF renderer on large Jira-style documents.
+
+Builds documents shaped like real incident reports and design specs (headings,
+marked-up paragraphs with mentions and links, nested lists, task lists, wide
+tables, code blocks, panels) plus a 100-issue search response with comments,
+then reports the ADF JSON size against the Markdown and plain-text renderings
+and the render time. A pathologically deep document checks that rendering does
+not depend on the recursion limit.
+
+Usage:
+    python benchmarks/adf_render.py [--sections 40] [--repeat 20]
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from atlassian_mcp_server.clients.adf import render_adf
+from atlassian_mcp_server.clients.jira_client import JiraClient
+
+# Importing the package configures DEBUG logging for the server; keep output clean
+logging.getLogger().setLevel(logging.WARNING)
+
+WORDS = (
+    "service latency deploy rollback customer database index queue worker "
+    "timeout retry cache region cluster alert threshold owner dashboard "
+    "migration schema release window incident mitigation follow-up"
+).split()
+
+
+def words(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def text(value, *marks):
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+def paragraph(rng):
+    return {
+        "type": "paragraph",
+        "content": [
+            text(words(rng, 12) + " "),
+            text(words(rng, 2), {"type": "strong"}),
+            text(" " + words(rng, 6) + " "),
+            {
+                "type": "mention",
+                "attrs": {
+                    "id": f"5b10ac8d82e05b22cc7d{rng.randrange(9999):04d}",
+                    "text": "@Jordan Lee",
+                    "accessLevel": "",
+                },
+            },
+            text(" see "),
+            text(
+                "runbook",
+                {
+                    "type": "link",
+                    "attrs": {"href": "https://example.atlassian.net/wiki/x/AbCd"},
+                },
+            ),
+            text(" " + words(rng, 10) + "."),
+        ],
+    }
+
+
+def bullet_list(rng, depth=0):
+    items = []
+    for _ in range(4):
+        content = [paragraph(rng)]
+        if depth < 2 and rng.random() < 0.5:
+            content.append(bullet_list(rng, depth + 1))
+        items.append({"type": "listItem", "content": content})
+    return {"type": "bulletList", "content": items}
+
+
+def table(rng, rows=30, cols=6):
+    def cell(kind, value):
+        return {
+            "type": kind,
+            "attrs": {"colspan": 1, "rowspan": 1, "colwidth": [150]},
+            "content": [{"type": "paragraph", "content": [text(value)]}],
+        }
+
+    header = {
+        "type": "tableRow",
+        "content": [cell("tableHeader", f"Column {c}") for c in range(cols)],
+    }
+    body = [
+        {
+            "type": "tableRow",
+            "content": [cell("tableCell", words(rng, 3)) for _ in range(cols)],
+        }
+        for _ in range(rows)
+    ]
+    return {
+        "type": "table",
+        "attrs": {"isNumberColumnEnabled": False, "layout": "default"},
+        "content": [header, *body],
+    }
+
+
+def large_document(rng, sections):
+    content = []
+    for n in range(sections):
+        content.append(
+            {
+                "type": "heading",
+                "attrs": {"level": 2},
+                "content": [text(f"Section {n}: {words(rng, 3)}")],
+            }
+        )
+        content.extend(paragraph(rng) for _ in range(3))
+        content.append(bullet_list(rng))
+        content.append(
+            {
+                "type": "taskList",
+                "attrs": {"localId": "t"},
+                "content": [
+                    {
+                        "type": "taskItem",
+                        "attrs": {"localId": str(i), "state": "TODO"},
+                        "content": [text(words(rng, 8))],
+                    }
+                    for i in range(3)
+                ],
+            }
+        )
+        if n % 4 == 0:
+            content.append(table(rng))
+        if n % 3 == 0:
+            content.append(
+                {
+                    "type": "codeBlock",
+                    "attrs": {"language": "python"},
+                    "content": [text("\n".join(words(rng, 6) for _ in range(12)))],
+                }
+            )
+        content.append(
+            {
+                "type": "panel",
+                "attrs": {"panelType": "info"},
+                "content": [paragraph(rng)],
+            }
+        )
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def search_response(rng, issues=100, comments=10):
+    return [
+        {
+            "id": str(10000 + i),
+            "key": f"PROJ-{i}",
+            "fields": {
+                "summary": words(rng, 6),
+                "description": large_document(rng, 2),
+                "comment": {
+                    "comments": [
+                        {
+                            "id": str(c),
+                            "body": {
+                                "type": "doc",
+                                "version": 1,
+                                "content": [paragraph(rng), bullet_list(rng, 2)],
+                            },
+                        }
+                        for c in range(comments)
+                    ]
+                },
+            },
+        }
+        for i in range(issues)
+    ]
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples)
+
+
+def report(label, adf_bytes, rendered, seconds):
+    size = len(rendered.encode("utf-8")) if isinstance(rendered, str) else rendered
+    print(
+        f"  {label:<9} {size / 1024:9.1f} KiB  {adf_bytes / size:5.1f}x smaller  "
+        f"{seconds * 1000:8.2f} ms  {adf_bytes / seconds / 1e6:6.1f} MB/s of ADF"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sections", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    document = large_document(rng, args.sections)
+    adf_bytes = len(json.dumps(document, separators=(",", ":")))
+    print(f"Large document: {adf_bytes / 1024:.1f} KiB of ADF JSON")
+    for body_format in ("markdown", "text"):
+        rendered, seconds = timed(
+            lambda f=body_format: render_adf(document, f), args.repeat
+        )
+        report(body_format, adf_bytes, rendered, seconds)
+
+    issues = search_response(rng)
+    adf_bytes = len(json.dumps(issues, separators=(",", ":")))
+    print(f"\nSearch response: {len(issues)} issues, {adf_bytes / 1024:.1f} KiB")
+    for body_format in ("markdown", "text"):
+
+        def run(f=body_format):
+            copies = json.loads(json.dumps(issues))
+            start = time.perf_counter()
+            out = [JiraClient.shape_issue(issue, (f, "none")) for issue in copies]
+            return out, time.perf_counter() - start
+
+        samples = [run() for _ in range(max(3, args.repeat // 4))]
+        rendered = samples[0][0]
+        seconds = statistics.median(s for _, s in samples)
+        size = len(json.dumps(rendered, separators=(",", ":")))
+        report(body_format, adf_bytes, size, seconds)
+        print(f"  {'':<9} {seconds / len(issues) * 1e6:9.1f} us per issue")
+
+    depth = sys.getrecursionlimit() * 20
+    node = {"type": "paragraph", "content": [text("bottom")]}
+    for _ in range(depth):
+        node = {
+            "type": "listItem",
+            "content": [{"type": "bulletList", "content": [node]}],
+        }
+    deep = {"type": "doc", "content": [{"type": "bulletList", "content": [node]}]}
+    _, seconds = timed(lambda: render_adf(deep, "text"), 3)
+    print(
+        f"\nNesting depth {depth}: rendered in {seconds * 1000:.1f} ms "
+        f"(recursion limit {sys.getrecursionlimit()})"
+    )
+
+
+if __name__ == "__main__":
+    main()
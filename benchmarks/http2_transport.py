@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTTP/1.1 vs HTTP/2 transports for parallel tool workloads.
+
+Runs a local stand-in for api.atlassian.com (Hypercorn, cleartext HTTP/2 with
+prior knowledge) and drives it through ``BaseAtlassianClient.make_request``
+with a mix of Jira, Confluence and Assets calls. For each transport it reports
+wall time, per-request latency percentiles and the number of TCP connections
+the server saw.
+
+Requires the optional packages: pip install h2 hypercorn
+
+Usage:
+    python benchmarks/http2_transport.py [--calls 300] [--parallel 60]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from atlassian_mcp_server.clients import (
+    AtlassianConfig,
+    AtlassianSession,
+    BaseAtlassianClient,
+)
+
+# Importing the package configures DEBUG logging for the server; keep output clean
+logging.getLogger().setLevel(logging.WARNING)
+
+HOST = "127.0.0.1"
+PORT = 8765
+PATHS = [
+    "/ex/jira/cloud/rest/api/3/issue/PROJ-{n}",
+    "/ex/confluence/cloud/wiki/api/v2/pages/{n}",
+    "/ex/jira/cloud/rest/servicedeskapi/assets/workspace/{n}",
+]
+
+
+class StandInServer:
+    """Minimal ASGI app that simulates upstream latency and counts connections."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        self.connections.add(tuple(scope["client"]))
+        await asyncio.sleep(self.latency)
+        body = b'{"id": "1", "fields": {"summary": "stand-in"}}'
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def start_server(app: StandInServer) -> threading.Event:
+    """Serve ``app`` on a background thread; set the returned event to stop."""
+    # pylint: disable=import-outside-toplevel
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"{HOST}:{PORT}"]
+    config.loglevel = "WARNING"
+    stop = threading.Event()
+    ready = threading.Event()
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        shutdown = asyncio.Event()
+        threading.Thread(
+            target=lambda: (stop.wait(), loop.call_soon_threadsafe(shutdown.set)),
+            daemon=True,
+        ).start()
+        loop.call_later(0.2, ready.set)
+        await serve(app, config, shutdown_trigger=shutdown.wait)
+
+    threading.Thread(target=lambda: asyncio.run(run()), daemon=True).start()
+    ready.wait()
+    return stop
+
+
+def make_client(transport=None) -> BaseAtlassianClient:
+    """Client with client-side pacing disabled so only the transport differs."""
+    config = AtlassianConfig(
+        site_url="https://example.atlassian.net",
+        client_id="bench",
+        client_secret="bench",
+        access_token="bench-token",
+        rate_limit_per_second=0,
+        concurrency_max=0,
+    )
+    return BaseAtlassianClient(config, AtlassianSession(config, transport=transport))
+
+
+async def run_workload(clients, calls: int, parallel: int):
+    """Issue ``calls`` requests with at most ``parallel`` in flight."""
+    semaphore = asyncio.Semaphore(parallel)
+    latencies = []
+
+    async def call(n: int):
+        client = clients[n % len(clients)]
+        url = f"http://{HOST}:{PORT}" + PATHS[n % len(PATHS)].format(n=n)
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.make_request("GET", url)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(n) for n in range(calls)))
+    return time.perf_counter() - started, latencies
+
+
+async def benchmark(calls: int, parallel: int, latency: float):
+    """Run each transport scenario against a fresh stand-in server."""
+    limits = {"max_connections": 20, "max_keepalive_connections": 20}
+    scenarios = {
+        "HTTP/1.1, pool per product": lambda: [make_client() for _ in PATHS],
+        "HTTP/1.1, shared pool": lambda: [make_client()],
+        "HTTP/2, shared pool": lambda: [
+            make_client(
+                httpx.AsyncHTTPTransport(
+                    http1=False, http2=True, limits=httpx.Limits(**limits)
+                )
+            )
+        ],
+    }
+
+    print(f"{calls} calls, {parallel} parallel, {latency * 1000:.0f}ms upstream")
+    print(f"{'scenario':<30} {'wall s':>8} {'p50 ms':>8} {'p95 ms':>8} {'conns':>6}")
+    for name, build in scenarios.items():
+        app = StandInServer(latency)
+        stop = start_server(app)
+        clients = build()
+        try:
+            wall, latencies = await run_workload(clients, calls, parallel)
+        finally:
+            for client in clients:
+                await client.session.aclose()
+            stop.set()
+            await asyncio.sleep(0.3)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{name:<30} {wall:>8.2f} {statistics.median(latencies) * 1000:>8.1f} "
+            f"{p95 * 1000:>8.1f} {len(app.connections):>6}"
+        )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--parallel", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    try:
+        import h2  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+        import hypercorn  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        print("This benchmark needs the optional packages: pip install h2 hypercorn")
+        return 1
+
+    asyncio.run(benchmark(args.calls, args.parallel, args.latency))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
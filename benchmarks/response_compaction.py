@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Benchmark Jira response compaction on large search responses.
+
+Builds search results shaped like real ``/search/jql`` responses (users with
+four avatar sizes, status with status category, priority, issue type,
+project, components, versions, issue links and comments, all carrying
+``self`` links) and reports the JSON size and compaction time per issue in
+each mode, with and without rendering ADF bodies as Markdown.
+
+Usage:
+    python benchmarks/response_compaction.py [--issues 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from atlassian_mcp_server.clients.compaction import compact_response
+
+# Importing the package configures DEBUG logging for the server; keep output clean
+logging.getLogger().setLevel(logging.WARNING)
+
+SITE = "https://api.atlassian.com/ex/jira/0b5e7c2a-cloud/rest/api/3"
+STATUSES = [
+    ("To Do", "new", "blue-gray"),
+    ("In Progress", "indeterminate", "yellow"),
+    ("Done", "done", "green"),
+]
+
+
+def user(rng):
+    account_id = f"5b10ac8d82e05b22cc7d{rng.randrange(9999):04d}"
+    avatar = "https://avatar-management.example.net/avatars/" + account_id
+    return {
+        "self": f"{SITE}/user?accountId={account_id}",
+        "accountId": account_id,
+        "emailAddress": f"user{account_id[-4:]}@example.com",
+        "avatarUrls": {
+            size: f"{avatar}/{size}.png"
+            for size in ("48x48", "24x24", "16x16", "32x32")
+        },
+        "displayName": f"User {account_id[-4:]}",
+        "active": True,
+        "timeZone": "Europe/Berlin",
+        "accountType": "atlassian",
+    }
+
+
+def named(kind, rng, name, extra=None):
+    ident = str(rng.randrange(10000, 99999))
+    node = {
+        "self": f"{SITE}/{kind}/{ident}",
+        "id": ident,
+        "name": name,
+        "iconUrl": f"https://example.atlassian.net/images/icons/{kind}/{ident}.svg",
+    }
+    node.update(extra or {})
+    return node
+
+
+def status(rng):
+    name, key, color = rng.choice(STATUSES)
+    return named(
+        "status",
+        rng,
+        name,
+        {
+            "description": "",
+            "statusCategory": {
+                "self": f"{SITE}/statuscategory/{key}",
+                "id": 2,
+                "key": key,
+                "colorName": color,
+                "name": name,
+            },
+        },
+    )
+
+
+def doc(text):
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+def issue(rng, n, comments):
+    key = f"PROJ-{n}"
+    linked = f"PROJ-{rng.randrange(1, n + 2)}"
+    fields = {
+        "summary": f"Investigate latency regression {n}",
+        "status": status(rng),
+        "priority": named("priority", rng, rng.choice(["High", "Medium", "Low"])),
+        "issuetype": named(
+            "issuetype",
+            rng,
+            "Bug",
+            {"description": "A problem", "subtask": False, "avatarId": 10303},
+        ),
+        "project": {
+            "self": f"{SITE}/project/10000",
+            "id": "10000",
+            "key": "PROJ",
+            "name": "Project",
+            "projectTypeKey": "software",
+            "simplified": False,
+            "avatarUrls": {"48x48": f"{SITE}/avatar/10000?size=large"},
+        },
+        "assignee": user(rng),
+        "reporter": user(rng),
+        "creator": user(rng),
+        "created": "2026-05-01T10:00:00.000+0000",
+        "updated": "2026-05-02T11:30:00.000+0000",
+        "labels": ["backend", "latency"],
+        "components": [named("component", rng, "API"), named("component", rng, "DB")],
+        "fixVersions": [named("version", rng, "2.4.0", {"released": False})],
+        "watches": {"self": f"{SITE}/issue/{key}/watchers", "watchCount": 3},
+        "votes": {"self": f"{SITE}/issue/{key}/votes", "votes": 0, "hasVoted": False},
+        "issuelinks": [
+            {
+                "id": str(rng.randrange(10000)),
+                "self": f"{SITE}/issueLink/1",
+                "type": {
+                    "id": "10000",
+                    "name": "Blocks",
+                    "inward": "is blocked by",
+                    "outward": "blocks",
+                    "self": f"{SITE}/issueLinkType/10000",
+                },
+                "outwardIssue": {
+                    "id": "1",
+                    "key": linked,
+                    "self": f"{SITE}/issue/1",
+                    "fields": {
+                        "summary": "Linked issue",
+                        "status": status(rng),
+                        "priority": named("priority", rng, "Medium"),
+                        "issuetype": named("issuetype", rng, "Task"),
+                    },
+                },
+            }
+        ],
+        "description": doc("Requests to the search endpoint are slower. " * 8),
+        "comment": {
+            "comments": [
+                {
+                    "self": f"{SITE}/issue/{key}/comment/{c}",
+                    "id": str(c),
+                    "author": user(rng),
+                    "updateAuthor": user(rng),
+                    "body": doc("Reproduced on staging with the nightly build."),
+                    "created": "2026-05-01T12:00:00.000+0000",
+                    "updated": "2026-05-01T12:00:00.000+0000",
+                    "jsdPublic": True,
+                }
+                for c in range(comments)
+            ],
+            "maxResults": comments,
+            "total": comments,
+            "startAt": 0,
+            "self": f"{SITE}/issue/{key}/comment",
+        },
+    }
+    return {
+        "expand": "renderedFields,names,schema,operations,editmeta,changelog",
+        "id": str(10000 + n),
+        "self": f"{SITE}/issue/{10000 + n}",
+        "key": key,
+        "fields": fields,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--comments", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    issues = [issue(rng, n, args.comments) for n in range(args.issues)]
+    raw = json.dumps(issues, separators=(",", ":"))
+    print(
+        f"Search response: {len(issues)} issues, {args.comments} comments each, "
+        f"{len(raw) / 1024:.1f} KiB"
+    )
+    for compaction, body_format in (
+        ("prune", "adf"),
+        ("flatten", "adf"),
+        ("flatten", "markdown"),
+    ):
+        samples = []
+        for _ in range(args.repeat):
+            copies = json.loads(raw)
+            start = time.perf_counter()
+            compact_response(copies, compaction, body_format)
+            samples.append(time.perf_counter() - start)
+        size = len(json.dumps(copies, separators=(",", ":")))
+        seconds = statistics.median(samples)
+        print(
+            f"  {compaction:<8} {body_format:<9} {size / 1024:9.1f} KiB  "
+            f"{100 * (1 - size / len(raw)):5.1f}% smaller  "
+            f"{seconds / len(issues) * 1e6:7.1f} us per issue"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,24 @@ Atlassian client classes for different services.
 
 from .base_client import AtlassianConfig, AtlassianError, BaseAtlassianClient
 from .confluence_client import ConfluenceClient
+from .issue_graph import Traversal
 from .jira_client import JiraClient
+from .jira_core import IssueView
+from .jira_sync import JiraSync
+from .jira_write import NewIssue
 from .service_desk_client import ServiceDeskClient
+from .session import AtlassianSession
 
 __all__ = [
     "BaseAtlassianClient",
     "AtlassianConfig",
     "AtlassianError",
+    "AtlassianSession",
+    "IssueView",
     "JiraClient",
+    "JiraSync",
+    "NewIssue",
     "ConfluenceClient",
     "ServiceDeskClient",
+    "Traversal",
 ]
@@ -0,0 +1,194 @@
+"""
+Running aggregates over Jira changelogs and worklogs: time in status per issue
+and logged hours per user. Each issue's history or worklog is folded in as it
+arrives and then dropped, so reports over thousands of issues stay small.
+"""
+
+import math
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Jira writes offsets as +0000; datetime.fromisoformat before Python 3.11 only
+# reads +00:00 and no trailing Z
+_UTC_SUFFIX = re.compile(r"Z$", re.IGNORECASE)
+_COMPACT_OFFSET = re.compile(r"([+-]\d{2})(\d{2})$")
+
+
+def parse_time(value: str) -> datetime:
+    """Parse an ISO date or datetime, or a Jira timestamp, as an aware datetime.
+
+    Values without a timezone are taken as UTC.
+    """
+    try:
+        text = _UTC_SUFFIX.sub("+00:00", value.strip())
+        if "T" in text:
+            text = _COMPACT_OFFSET.sub(r"\1:\2", text)
+        parsed = datetime.fromisoformat(text)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid date '{value}'. Use YYYY-MM-DD or an ISO 8601 datetime"
+        ) from e
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def compact_history(history: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep a change history's timestamp and its changed values only."""
+    return {
+        "created": history.get("created"),
+        "items": [
+            {
+                "field": item.get("fieldId") or item.get("field"),
+                "from": item.get("fromString"),
+                "to": item.get("toString"),
+            }
+            for item in history.get("items") or []
+        ],
+    }
+
+
+def compact_worklog(worklog: Dict[str, Any], issue_key: str) -> Dict[str, Any]:
+    """Reduce a worklog to who logged how much time on which issue and when."""
+    author = worklog.get("author") or {}
+    return {
+        "id": str(worklog.get("id")),
+        "issue_key": issue_key,
+        "account_id": author.get("accountId"),
+        "author": author.get("displayName") or author.get("accountId"),
+        "started": worklog.get("started"),
+        "seconds": int(worklog.get("timeSpentSeconds") or 0),
+    }
+
+
+def status_durations(
+    created: str,
+    current_status: Optional[str],
+    histories: Iterable[Dict[str, Any]],
+    now: datetime,
+) -> Dict[str, float]:
+    """Seconds spent in each status from creation until ``now``.
+
+    ``histories`` are compacted change histories in any order. The status the
+    issue was created in is the ``from`` value of its first status change, or
+    its current status if it never changed.
+    """
+    transitions: List[Tuple[datetime, Optional[str], Optional[str]]] = sorted(
+        (
+            (parse_time(history["created"]), item["from"], item["to"])
+            for history in histories
+            if history.get("created")
+            for item in history["items"]
+            if item["field"] == "status"
+        ),
+        key=lambda transition: transition[0],
+    )
+    status = transitions[0][1] if transitions else current_status
+    since = parse_time(created)
+    durations: Dict[str, float] = {}
+    for changed, _, to_status in transitions:
+        key = status or "(unknown)"
+        durations[key] = durations.get(key, 0.0) + max(
+            0.0, (changed - since).total_seconds()
+        )
+        status, since = to_status, changed
+    key = status or "(unknown)"
+    durations[key] = durations.get(key, 0.0) + max(0.0, (now - since).total_seconds())
+    return durations
+
+
+def _hours(seconds: float) -> float:
+    return round(seconds / 3600, 2)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class StatusTimes:
+    """Time in status over many issues, with per-issue rows kept optionally.
+
+    Only one duration per issue and status is held, never the histories.
+    """
+
+    def __init__(self, keep_issues: bool = True):
+        self.keep_issues = keep_issues
+        self.issues: List[Dict[str, Any]] = []
+        self.count = 0
+        self._by_status: Dict[str, List[float]] = {}
+
+    def add(self, key: str, status: Optional[str], durations: Dict[str, float]) -> None:
+        """Fold in one issue's seconds per status."""
+        self.count += 1
+        for name, seconds in durations.items():
+            self._by_status.setdefault(name, []).append(seconds)
+        if self.keep_issues:
+            self.issues.append(
+                {
+                    "key": key,
+                    "status": status,
+                    "hours_in_status": {
+                        name: _hours(seconds) for name, seconds in durations.items()
+                    },
+                }
+            )
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Issues, total, mean, median and 85th percentile hours per status."""
+        report = {}
+        for name, values in self._by_status.items():
+            values.sort()
+            report[name] = {
+                "issues": len(values),
+                "total_hours": _hours(sum(values)),
+                "mean_hours": _hours(sum(values) / len(values)),
+                "median_hours": _hours(_percentile(values, 0.5)),
+                "p85_hours": _hours(_percentile(values, 0.85)),
+            }
+        return report
+
+
+class WorklogTotals:
+    """Logged time per user and per issue, folded in one worklog at a time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0
+        self._users: Dict[Any, Dict[str, Any]] = {}
+        self._issues: Dict[str, int] = {}
+
+    def add(self, worklog: Dict[str, Any]) -> None:
+        """Fold in one compacted worklog."""
+        self.count += 1
+        self.seconds += worklog["seconds"]
+        user = self._users.setdefault(
+            worklog["account_id"],
+            {"account_id": worklog["account_id"], "name": worklog["author"]},
+        )
+        user["seconds"] = user.get("seconds", 0) + worklog["seconds"]
+        user["worklogs"] = user.get("worklogs", 0) + 1
+        issue = worklog["issue_key"]
+        self._issues[issue] = self._issues.get(issue, 0) + worklog["seconds"]
+
+    def summary(self) -> Dict[str, Any]:
+        """Total hours, hours per user (most first) and hours per issue."""
+        users = sorted(self._users.values(), key=lambda u: -u["seconds"])
+        return {
+            "worklogs": self.count,
+            "total_hours": _hours(self.seconds),
+            "by_user": [
+                {
+                    "account_id": user["account_id"],
+                    "name": user["name"],
+                    "hours": _hours(user["seconds"]),
+                    "worklogs": user["worklogs"],
+                }
+                for user in users
+            ],
+            "by_issue": {
+                key: _hours(seconds)
+                for key, seconds in sorted(
+                    self._issues.items(), key=lambda item: -item[1]
+                )
+            },
+        }
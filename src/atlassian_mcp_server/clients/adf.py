@@ -0,0 +1,856 @@
+"""
+Atlassian Document Format (ADF) helpers.
+
+:func:`render_adf` turns ADF documents into compact Markdown or plain text.
+It walks the tree with an explicit stack instead of recursion, so arbitrarily
+deep documents cannot exhaust the interpreter's recursion limit.
+:func:`markdown_to_adf` goes the other way for write paths, turning Markdown
+into ADF in a single pass over the input lines.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BODY_FORMATS = ("adf", "markdown", "text")
+
+# Nodes that hold inline content and are emitted as one block of lines
+TEXT_BLOCKS = {"paragraph", "heading", "codeBlock"}
+# Nodes whose children are laid out as separate blocks
+CONTAINER_BLOCKS = {
+    "doc",
+    "bulletList",
+    "orderedList",
+    "taskList",
+    "decisionList",
+    "listItem",
+    "taskItem",
+    "decisionItem",
+    "blockquote",
+    "panel",
+    "expand",
+    "nestedExpand",
+    "table",
+    "tableRow",
+    "tableCell",
+    "tableHeader",
+    "mediaSingle",
+    "mediaGroup",
+    "layoutSection",
+    "layoutColumn",
+    "bodiedExtension",
+}
+# Markdown delimiters of the emphasis-like marks
+_MARK_DELIMITERS = {"strong": "**", "em": "_", "strike": "~~"}
+LIST_NODES = {"bulletList", "orderedList", "taskList", "decisionList"}
+ITEM_NODES = {"listItem", "taskItem", "decisionItem"}
+
+
+class _Container:  # pylint: disable=too-few-public-methods
+    """Layout state of an open list item, quote, table or table cell."""
+
+    def __init__(self, kind: str, marker: str = ""):
+        self.kind = kind
+        self.marker = marker
+        self.first = True
+        self.cells: List[str] = []
+        self.rows: List[List[str]] = []
+
+
+class _Renderer:  # pylint: disable=too-many-instance-attributes
+    """Single-pass, stack-based ADF renderer."""
+
+    def __init__(self, markdown: bool):
+        self.markdown = markdown
+        self.lines: List[str] = []
+        self.inline: List[str] = []
+        self.containers: List[_Container] = []
+        # Counters of the open ordered lists, innermost last
+        self.counters: List[Optional[int]] = []
+        # Whether each open list sits directly in a list (nested task lists)
+        self.direct: List[bool] = []
+        self.open_items = 0
+        self.code_depth = 0
+        self.last_in_list = False
+        self.last_quote_depth = 0
+
+    def render(self, doc: Dict[str, Any]) -> str:
+        """Render ``doc`` depth-first and return the finished text."""
+        stack: List[Tuple[Any, bool]] = [(doc, False)]
+        while stack:
+            node, leaving = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            node_type = node.get("type", "")
+            if leaving:
+                self.leave(node, node_type)
+                continue
+            if self.enter(node, node_type):
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node["content"]))
+            elif node_type in TEXT_BLOCKS or node_type in CONTAINER_BLOCKS:
+                # Empty block: still runs its leave step (e.g. blank cells)
+                stack.append((node, True))
+        self.flush()
+        return "\n".join(self.lines).strip("\n")
+
+    # Tree walking -------------------------------------------------------
+
+    def enter(self, node: Dict[str, Any], node_type: str) -> bool:
+        """Handle a node on the way down; True when its children follow."""
+        attrs = node.get("attrs") or {}
+        if node_type == "text":
+            self.inline.append(self.text(node))
+        elif node_type == "hardBreak":
+            self.inline.append("\n")
+        elif node_type == "mention":
+            self.inline.append(attrs.get("text") or f"@{attrs.get('id', 'unknown')}")
+        elif node_type == "emoji":
+            self.inline.append(attrs.get("text") or attrs.get("shortName", ""))
+        elif node_type == "date":
+            self.inline.append(_format_date(attrs.get("timestamp")))
+        elif node_type == "status":
+            self.inline.append(f"[{attrs.get('text', '')}]")
+        elif node_type in ("inlineCard", "blockCard", "embedCard"):
+            url = attrs.get("url") or ""
+            self.inline.append(f"<{url}>" if self.markdown and url else url)
+        elif node_type == "media":
+            label = attrs.get("alt") or attrs.get("id") or ""
+            self.inline.append(f"[attachment: {label}]" if label else "[attachment]")
+        elif node_type == "rule":
+            self.flush()
+            self.emit(["---"])
+        elif node_type == "placeholder":
+            pass
+        else:
+            self.open_block(node_type, attrs)
+        return bool(node.get("content")) and node_type != "text"
+
+    def open_block(self, node_type: str, attrs: Dict[str, Any]) -> None:
+        """Start a block or container node."""
+        if node_type not in TEXT_BLOCKS and node_type not in CONTAINER_BLOCKS:
+            return  # unknown node: render its children inline
+        self.flush()
+        if node_type == "codeBlock":
+            self.code_depth += 1
+        elif node_type in LIST_NODES:
+            direct = len(self.counters) > self.open_items
+            if not self.open_items and not direct:
+                self.last_in_list = False  # a new top-level list starts a block
+            self.counters.append(
+                int(attrs.get("order", 1)) if node_type == "orderedList" else None
+            )
+            self.direct.append(direct)
+            if direct:
+                # Indent it under the previous item like a nested list
+                indent = _Container("item", "  ")
+                indent.first = False
+                self.containers.append(indent)
+                self.open_items += 1
+        elif node_type in ITEM_NODES:
+            self.containers.append(
+                _Container("item", self.item_marker(node_type, attrs))
+            )
+            self.open_items += 1
+        elif node_type in ("blockquote", "panel"):
+            self.containers.append(_Container("quote"))
+        elif node_type in ("expand", "nestedExpand") and attrs.get("title"):
+            title = attrs["title"]
+            self.emit([f"**{title}**" if self.markdown else title])
+        elif node_type == "table":
+            self.containers.append(_Container("table"))
+        elif node_type in ("tableCell", "tableHeader"):
+            self.containers.append(_Container("cell"))
+
+    def leave(  # pylint: disable=too-many-branches
+        self, node: Dict[str, Any], node_type: str
+    ) -> None:
+        """Finish a block or container node on the way back up."""
+        attrs = node.get("attrs") or {}
+        if node_type == "paragraph":
+            self.flush()
+        elif node_type == "heading":
+            text = "".join(self.inline).strip()
+            self.inline = []
+            if text:
+                level = int(attrs.get("level", 1))
+                self.emit([f"{'#' * level} {text}" if self.markdown else text])
+        elif node_type == "codeBlock":
+            self.code_depth -= 1
+            code = "".join(self.inline).rstrip("\n").split("\n")
+            self.inline = []
+            if self.markdown:
+                self.emit([f"```{attrs.get('language', '')}", *code, "```"])
+            else:
+                self.emit(code)
+        elif node_type in LIST_NODES:
+            self.flush()
+            self.counters.pop()
+            if self.direct.pop():
+                self.containers.pop()
+                self.open_items -= 1
+        elif node_type in ITEM_NODES or node_type in ("blockquote", "panel"):
+            self.flush()
+            self.open_items -= self.containers.pop().kind == "item"
+        elif node_type in ("tableCell", "tableHeader"):
+            self.flush()
+            cell = self.containers.pop()
+            self.containers[-1].cells.append(" ".join(cell.cells))
+        elif node_type == "tableRow":
+            table = self.containers[-1]
+            table.rows.append(table.cells)
+            table.cells = []
+        elif node_type == "table":
+            table = self.containers.pop()
+            if table.rows:
+                self.emit(self.table_lines(table.rows))
+        elif node_type in CONTAINER_BLOCKS:
+            self.flush()
+
+    # Output -------------------------------------------------------------
+
+    def text(self, node: Dict[str, Any]) -> str:
+        """Render a text node with its marks."""
+        text = node.get("text", "")
+        if self.code_depth:
+            return text
+        marks = node.get("marks") or []
+        # A delimiter run next to whitespace does not open or close emphasis,
+        # so leading and trailing spaces go outside the delimiters
+        lead = trail = ""
+        if self.markdown and any(m.get("type") in _MARK_DELIMITERS for m in marks):
+            core = text.strip()
+            if not core:
+                return text
+            lead = text[: len(text) - len(text.lstrip())]
+            trail = text[len(text.rstrip()) :]
+            text = core
+        href = None
+        for mark in marks:
+            mark_type = mark.get("type")
+            if mark_type == "link":
+                href = (mark.get("attrs") or {}).get("href")
+            elif not self.markdown:
+                continue
+            elif mark_type == "code":
+                fence = "``" if "`" in text else "`"
+                pad = " " if text.startswith("`") or text.endswith("`") else ""
+                text = f"{fence}{pad}{text}{pad}{fence}"
+            elif mark_type in _MARK_DELIMITERS:
+                delimiter = _MARK_DELIMITERS[mark_type]
+                text = f"{delimiter}{text}{delimiter}"
+        text = f"{lead}{text}{trail}"
+        if href:
+            if self.markdown:
+                text = f"[{text}]({href})"
+            elif href != text:
+                text = f"{text} ({href})"
+        return text
+
+    def item_marker(self, node_type: str, attrs: Dict[str, Any]) -> str:
+        """Bullet, number or checkbox prefix for a new list item."""
+        if node_type == "taskItem":
+            return "- [x] " if attrs.get("state") == "DONE" else "- [ ] "
+        if node_type == "decisionItem":
+            return "- Decision: "
+        if self.counters and self.counters[-1] is not None:
+            number = self.counters[-1]
+            self.counters[-1] = number + 1
+            return f"{number}. "
+        return "- "
+
+    def table_lines(self, rows: List[List[str]]) -> List[str]:
+        """Lay out table rows as a Markdown table or pipe-separated text."""
+        width = max(len(row) for row in rows)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        if not self.markdown:
+            return [" | ".join(row) for row in rows]
+        lines = [_table_row(rows[0]), "|" + " --- |" * width]
+        lines.extend(_table_row(row) for row in rows[1:])
+        return lines
+
+    def flush(self) -> None:
+        """Emit pending inline content as a paragraph."""
+        text = "".join(self.inline).strip()
+        self.inline = []
+        if text:
+            self.emit(text.split("\n"))
+
+    def emit(self, lines: List[str]) -> None:
+        """Place a finished block under the open list items, quotes and cells."""
+        in_list = False
+        # Prefixes of the first and following lines, innermost container first
+        first: List[str] = []
+        rest: List[str] = []
+        for container in reversed(self.containers):
+            if container.kind == "cell":
+                container.cells.append(
+                    " ".join(line.strip() for line in lines if line.strip())
+                )
+                return
+            if container.kind == "item":
+                in_list = True
+                indent = " " * len(container.marker)
+                first.append(container.marker if container.first else indent)
+                rest.append(indent)
+                container.first = False
+            elif container.kind == "quote":
+                first.append("> ")
+                rest.append("> ")
+        if first:
+            lead, indent = "".join(reversed(first)), "".join(reversed(rest))
+            lines = [lead + lines[0]] + [
+                indent + line if line else indent.rstrip() for line in lines[1:]
+            ]
+
+        quote_depth = sum(c.kind == "quote" for c in self.containers)
+        if self.lines and not (in_list and self.last_in_list):
+            # Blank line between blocks, kept inside a quote that continues
+            continuing = quote_depth and self.last_quote_depth >= quote_depth
+            self.lines.append(">" * quote_depth if continuing else "")
+        self.lines.extend(lines)
+        self.last_in_list = in_list
+        self.last_quote_depth = quote_depth
+
+
+def _table_row(cells: List[str]) -> str:
+    return "| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |"
+
+
+def _format_date(timestamp: Any) -> str:
+    try:
+        moment = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return str(timestamp or "")
+    return moment.strftime("%Y-%m-%d")
+
+
+def render_adf(node: Any, body_format: str = "markdown") -> Any:
+    """Render an ADF document as ``"markdown"`` or plain ``"text"``.
+
+    ``"adf"`` returns the node unchanged. Values that are not ADF documents,
+    such as plain strings, are returned as they are.
+    """
+    check_body_format(body_format)
+    if body_format == "adf" or not is_adf(node):
+        return node
+    return _Renderer(markdown=body_format == "markdown").render(node)
+
+
+def check_body_format(body_format: str) -> None:
+    """Reject body formats other than adf, markdown and text."""
+    if body_format not in BODY_FORMATS:
+        raise ValueError(
+            f"Unknown body format '{body_format}'. Use one of: {', '.join(BODY_FORMATS)}"
+        )
+
+
+def adf_to_text(node: Any) -> str:
+    """Extract the plain text of an ADF document (plain strings pass through)."""
+    if node is None:
+        return ""
+    if isinstance(node, str):
+        return node
+    return _Renderer(markdown=False).render(node) if isinstance(node, dict) else ""
+
+
+def is_adf(value: Any) -> bool:
+    """Whether ``value`` looks like an ADF document node."""
+    return isinstance(value, dict) and value.get("type") == "doc"
+
+
+# Markdown to ADF ----------------------------------------------------------
+
+_QUOTE = re.compile(r" {0,3}> ?")
+_LIST_MARKER = re.compile(r"( {0,3})(?:([-*+])|(\d{1,9})[.)])( +|$)")
+_TASK_BOX = re.compile(r"\[([ xX])\] +")
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})\s*([\w+#.-]*)")
+_HEADING = re.compile(r" {0,3}(#{1,6})(?:\s+(.*?))?(?:\s+#+)?\s*$")
+_RULE = re.compile(r" {0,3}(?:(?:\*\s*){3,}|(?:-\s*){3,}|(?:_\s*){3,})$")
+_TABLE_SEPARATOR = re.compile(r"\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)+\|?\s*$")
+_TABLE_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+_LINK = re.compile(r"\[([^\]\n]+)\]\(\s*<?([^\s)>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+_AUTOLINK = re.compile(r"<((?:https?|mailto):[^>\s]+)>")
+_ESCAPABLE = set("\\`*_{}[]()#+-.!|~<>")
+# Delimiters in the order they are tried, longest first
+_DELIMITERS = (
+    ("**", "strong"),
+    ("__", "strong"),
+    ("~~", "strike"),
+    ("*", "em"),
+    ("_", "em"),
+)
+# Mark order of emitted text nodes, matching how render_adf nests them
+_MARK_ORDER = ("code", "strong", "em", "strike", "link")
+_LIST_TYPES = {"bullet": "bulletList", "ordered": "orderedList", "task": "taskList"}
+
+
+class _Open:  # pylint: disable=too-few-public-methods
+    """An open blockquote or list item while parsing Markdown."""
+
+    def __init__(self, kind: str, node: Dict[str, Any], indent: int = 0):
+        self.kind = kind  # "quote", "item" or "task"
+        self.node = node
+        self.indent = indent
+        # Task items hold inline content only; nested task lists go here
+        self.list_node: Dict[str, Any] = {}
+
+
+class _MarkdownParser:  # pylint: disable=too-many-instance-attributes
+    """Line-by-line Markdown parser building ADF blocks as it goes.
+
+    Only structures ADF allows are produced: headings, rules and tables at the
+    top level, quotes holding paragraphs, lists and code, and task lists that
+    nest in task lists. Markdown outside those rules is kept as text.
+    """
+
+    def __init__(self) -> None:
+        self.doc: Dict[str, Any] = {"type": "doc", "version": 1, "content": []}
+        self.stack: List[_Open] = []
+        # Open paragraph, code block or table and its pending lines
+        self.leaf: Optional[Dict[str, Any]] = None
+        self.leaf_kind = ""
+        self.leaf_lines: List[str] = []
+        self.leaf_depth = 0
+        self.fence = ""
+        self.table_columns = 0
+        self.next_id = 0
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """Parse ``text`` line by line and return the ADF document."""
+        for line in text.splitlines():
+            self.line(line.expandtabs(4))
+        self.close_leaf()
+        self.close_containers(0)
+        return self.doc
+
+    # Containers ---------------------------------------------------------
+
+    def match(self, line: str, limit: Optional[int] = None) -> Tuple[str, int]:
+        """Strip the prefixes of the open containers ``line`` continues."""
+        matched = 0
+        pos = 0
+        blank = not line.strip()
+        spaces_end = len(line) - len(line.lstrip(" "))
+        for block in self.stack[:limit]:
+            if block.kind == "quote":
+                quote = _QUOTE.match(line, pos)
+                if not quote:
+                    break
+                pos = quote.end()
+                spaces_end = len(line) - len(line[pos:].lstrip(" "))
+            elif not blank:
+                if spaces_end - pos < block.indent:
+                    break
+                pos += block.indent
+            matched += 1
+        return line[pos:], matched
+
+    def content(self) -> List[Dict[str, Any]]:
+        """Content list that new blocks are appended to."""
+        return self.stack[-1].node["content"] if self.stack else self.doc["content"]
+
+    def close_containers(self, depth: int) -> None:
+        """Close open containers until only ``depth`` of them remain."""
+        if len(self.stack) > depth:
+            self.close_leaf()
+        while len(self.stack) > depth:
+            block = self.stack.pop()
+            content = block.node["content"]
+            if (block.kind == "quote" and not content) or (
+                block.kind == "item"
+                and (
+                    not content or content[0]["type"] not in ("paragraph", "codeBlock")
+                )
+            ):
+                # ADF needs a leading paragraph in items and content in quotes
+                content.insert(0, {"type": "paragraph", "content": []})
+
+    def open_item(self, marker: "re.Match[str]", rest: str) -> str:
+        """Open a list item for ``marker``; returns the text after it."""
+        parent = self.stack[-1] if self.stack else None
+        after = rest[marker.end() :]
+        box = None
+        if parent is None or parent.kind == "task":
+            box = _TASK_BOX.match(after) if marker.group(2) else None
+        if box or (parent is not None and parent.kind == "task"):
+            kind = "task"
+        else:
+            kind = "ordered" if marker.group(3) else "bullet"
+
+        if parent is not None and parent.kind == "task":
+            siblings = parent.list_node["content"]
+        else:
+            siblings = self.content()
+        if siblings and siblings[-1]["type"] == _LIST_TYPES[kind]:
+            list_node = siblings[-1]
+        else:
+            list_node = {"type": _LIST_TYPES[kind], "content": []}
+            if kind == "task":
+                list_node["attrs"] = {"localId": self.local_id()}
+            elif kind == "ordered" and int(marker.group(3)) != 1:
+                list_node["attrs"] = {"order": int(marker.group(3))}
+            siblings.append(list_node)
+
+        spacing = len(marker.group(4))
+        width = marker.end() - spacing + (1 if spacing == 0 or spacing > 4 else spacing)
+        if kind == "task":
+            done = box is not None and box.group(1) in "xX"
+            node = {
+                "type": "taskItem",
+                "attrs": {
+                    "localId": self.local_id(),
+                    "state": "DONE" if done else "TODO",
+                },
+                "content": [],
+            }
+            block = _Open("task", node, width)
+            block.list_node = list_node
+            after = after[box.end() :] if box else after
+        else:
+            node = {"type": "listItem", "content": []}
+            block = _Open("item", node, width)
+        list_node["content"].append(node)
+        self.stack.append(block)
+        return after
+
+    def local_id(self) -> str:
+        """Next ``localId`` for a task list or task item."""
+        self.next_id += 1
+        return str(self.next_id)
+
+    # Lines --------------------------------------------------------------
+
+    def line(self, line: str) -> None:
+        """Feed one line of Markdown to the open blocks."""
+        if self.leaf_kind == "code":
+            rest, matched = self.match(line, self.leaf_depth)
+            if matched == self.leaf_depth:
+                closing = _FENCE.match(rest)
+                if (
+                    closing
+                    and closing.group(1).startswith(self.fence)
+                    and not rest[closing.end() :].strip()
+                    and not closing.group(2)
+                ):
+                    self.close_leaf()
+                else:
+                    self.leaf_lines.append(rest)
+                return
+            self.close_leaf()
+
+        rest, matched = self.match(line)
+        if not rest.strip():
+            self.close_leaf()
+            self.close_containers(matched)
+            return
+        if (
+            matched < len(self.stack)
+            and self.leaf_kind == "paragraph"
+            and not self.starts_block(rest)
+        ):
+            self.leaf_lines.append(rest.strip())  # lazy continuation line
+            return
+        self.close_containers(matched)
+
+        # Open the quotes and list items the line starts
+        while True:
+            top = self.stack[-1] if self.stack else None
+            quote = _QUOTE.match(rest) if top is None else None
+            marker = None if quote else self.item_marker(rest, top)
+            if quote:
+                self.close_leaf()
+                node: Dict[str, Any] = {"type": "blockquote", "content": []}
+                self.doc["content"].append(node)
+                self.stack.append(_Open("quote", node))
+                rest = rest[quote.end() :]
+            elif marker:
+                self.close_leaf()
+                rest = self.open_item(marker, rest)
+            else:
+                break
+            if not rest.strip():
+                return
+            if self.stack[-1].kind == "task":
+                break
+        self.leaf_line(rest)
+
+    def item_marker(self, rest: str, top: Optional[_Open]) -> Optional["re.Match[str]"]:
+        """List marker that opens an item at the start of ``rest``, if any."""
+        marker = _LIST_MARKER.match(rest)
+        if not marker or (top is None and _RULE.match(rest)):
+            return None
+        if (
+            marker.group(3)
+            and int(marker.group(3)) != 1
+            and self.leaf_kind == "paragraph"
+            and self.leaf_depth == len(self.stack)
+        ):
+            return None  # only "1." may interrupt a paragraph ("2024. was a year")
+        return marker
+
+    def starts_block(self, rest: str) -> bool:
+        """Whether ``rest`` starts a block that interrupts a paragraph."""
+        return bool(
+            _QUOTE.match(rest)
+            or _LIST_MARKER.match(rest)
+            or _FENCE.match(rest)
+            or _HEADING.match(rest)
+            or _RULE.match(rest)
+        )
+
+    def leaf_line(self, rest: str) -> None:
+        """Handle a line that continues or starts a leaf block."""
+        top = self.stack[-1] if self.stack else None
+        text = rest.strip()
+        if top is not None and top.kind == "task":
+            self.add_text("task", text)
+            return
+        fence = _FENCE.match(rest)
+        if fence and not (fence.group(1)[0] == "`" and "`" in rest[fence.end() :]):
+            self.close_leaf()
+            self.fence = fence.group(1)
+            code: Dict[str, Any] = {"type": "codeBlock", "content": []}
+            if fence.group(2):
+                code["attrs"] = {"language": fence.group(2)}
+            self.open_leaf("code", code)
+            return
+        if top is None and self.top_level_block(rest, text):
+            return
+        self.add_text("paragraph", text)
+
+    def top_level_block(self, rest: str, text: str) -> bool:
+        """Headings, rules and tables, which ADF only allows at the top level."""
+        heading = _HEADING.match(rest)
+        if heading:
+            self.close_leaf()
+            node = {
+                "type": "heading",
+                "attrs": {"level": len(heading.group(1))},
+                "content": _inline(heading.group(2) or ""),
+            }
+            self.doc["content"].append(node)
+            return True
+        if _RULE.match(rest):
+            self.close_leaf()
+            self.doc["content"].append({"type": "rule"})
+            return True
+        if self.leaf is not None and self.leaf_kind == "table" and text.startswith("|"):
+            self.leaf["content"].append(
+                _adf_table_row(text, "tableCell", self.table_columns)
+            )
+            return True
+        if (
+            self.leaf_kind == "paragraph"
+            and len(self.leaf_lines) == 1
+            and self.leaf_lines[0].startswith("|")
+            and _TABLE_SEPARATOR.match(text)
+        ):
+            # The open one-line paragraph was the header row
+            header = self.leaf_lines[0]
+            self.doc["content"].pop()
+            self.leaf = None
+            self.leaf_kind = ""
+            self.table_columns = len(_markdown_cells(header))
+            table = {
+                "type": "table",
+                "attrs": {"isNumberColumnEnabled": False, "layout": "default"},
+                "content": [_adf_table_row(header, "tableHeader", self.table_columns)],
+            }
+            self.open_leaf("table", table)
+            return True
+        return False
+
+    def add_text(self, kind: str, text: str) -> None:
+        """Append a line of text to the open leaf or start a new one."""
+        if self.leaf_kind == kind and self.leaf_depth == len(self.stack):
+            self.leaf_lines.append(text)
+        elif kind == "task":
+            self.close_leaf()
+            self.leaf = self.stack[-1].node
+            self.leaf_kind = "task"
+            self.leaf_lines = [text]
+            self.leaf_depth = len(self.stack)
+        else:
+            self.open_leaf("paragraph", {"type": "paragraph", "content": []}, [text])
+
+    def open_leaf(
+        self, kind: str, node: Dict[str, Any], lines: Optional[List[str]] = None
+    ) -> None:
+        """Start ``node`` as the open leaf block in the innermost container."""
+        self.close_leaf()
+        self.content().append(node)
+        self.leaf = node
+        self.leaf_kind = kind
+        self.leaf_lines = lines or []
+        self.leaf_depth = len(self.stack)
+
+    def close_leaf(self) -> None:
+        """Finish the open leaf block from its pending lines."""
+        if self.leaf is not None:
+            if self.leaf_kind == "code":
+                code = "\n".join(self.leaf_lines)
+                self.leaf["content"] = [{"type": "text", "text": code}] if code else []
+            elif self.leaf_kind != "table":
+                self.leaf["content"].extend(_inline("\n".join(self.leaf_lines)))
+        self.leaf = None
+        self.leaf_kind = ""
+        self.leaf_lines = []
+
+
+def _markdown_cells(row: str) -> List[str]:
+    row = row.strip()
+    row = row[1:] if row.startswith("|") else row
+    row = row[:-1] if row.endswith("|") and not row.endswith("\\|") else row
+    return [cell.strip().replace("\\|", "|") for cell in _TABLE_CELL_SPLIT.split(row)]
+
+
+def _adf_table_row(row: str, cell_type: str, columns: int) -> Dict[str, Any]:
+    """Build a table row with as many cells as the header has columns."""
+    cells = _markdown_cells(row)
+    cells = cells[:columns] + [""] * (columns - len(cells))
+    return {
+        "type": "tableRow",
+        "content": [
+            {
+                "type": cell_type,
+                "attrs": {},
+                "content": [{"type": "paragraph", "content": _inline(cell)}],
+            }
+            for cell in cells
+        ],
+    }
+
+
+def _inline(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    text: str, outer: Sequence[str] = (), href: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Parse inline Markdown into ADF text, hardBreak and inlineCard nodes."""
+    nodes: List[Dict[str, Any]] = []
+    buffer: List[str] = []
+    active: Dict[str, str] = {mark: "" for mark in outer}
+
+    def flush() -> None:
+        if buffer:
+            nodes.append(_text_node("".join(buffer), active, href))
+            buffer.clear()
+
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\\" and i + 1 < len(text) and text[i + 1] in _ESCAPABLE:
+            buffer.append(text[i + 1])
+            i += 2
+            continue
+        if char == "\n":
+            flush()
+            nodes.append({"type": "hardBreak"})
+            i += 1
+            continue
+        if char == "`":
+            run = len(text) - i - len(text[i:].lstrip("`"))
+            end = text.find("`" * run, i + run)
+            if end != -1 and text[i + run : end].strip():
+                flush()
+                code = text[i + run : end]
+                if code.startswith(" ") and code.endswith(" ") and code.strip():
+                    code = code[1:-1]
+                nodes.append(_text_node(code, {"code": "`"}, href))
+                i = end + run
+            else:
+                buffer.append("`" * run)
+                i += run
+            continue
+        link = _LINK.match(text, i) if char == "[" and href is None else None
+        if link:
+            flush()
+            nodes.extend(_inline(link.group(1), list(active), link.group(2)))
+            i = link.end()
+            continue
+        card = _AUTOLINK.match(text, i) if char == "<" else None
+        if card:
+            flush()
+            nodes.append({"type": "inlineCard", "attrs": {"url": card.group(1)}})
+            i = card.end()
+            continue
+        for delimiter, mark in _DELIMITERS:
+            if text.startswith(delimiter, i):
+                break
+        else:
+            buffer.append(char)
+            i += 1
+            continue
+        end = i + len(delimiter)
+        if active.get(mark) == delimiter and _can_close(text, i, delimiter):
+            flush()
+            del active[mark]
+        elif mark not in active and _can_open(text, i, delimiter):
+            flush()
+            active[mark] = delimiter
+        else:
+            buffer.append(delimiter)
+        i = end
+    flush()
+
+    merged: List[Dict[str, Any]] = []
+    for node in nodes:
+        # pylint cannot see that ``previous`` is a dict once it is not None
+        # pylint: disable=unsubscriptable-object,unsupported-assignment-operation
+        previous = merged[-1] if merged else None
+        if (
+            previous is not None
+            and node["type"] == previous["type"] == "text"
+            and node.get("marks") == previous.get("marks")
+        ):
+            previous["text"] += node["text"]
+        else:
+            merged.append(node)
+    return merged
+
+
+def _can_open(text: str, i: int, delimiter: str) -> bool:
+    """Whether ``delimiter`` at ``i`` opens a span that is closed later."""
+    after = i + len(delimiter)
+    if after >= len(text) or text[after].isspace():
+        return False
+    if delimiter[0] == "_" and i > 0 and text[i - 1].isalnum():
+        return False  # snake_case words
+    close = text.find(delimiter, after + 1)
+    while close != -1:
+        if _can_close(text, close, delimiter):
+            return True
+        close = text.find(delimiter, close + 1)
+    return False
+
+
+def _can_close(text: str, i: int, delimiter: str) -> bool:
+    if i == 0 or text[i - 1].isspace():
+        return False
+    after = i + len(delimiter)
+    if delimiter[0] == "_" and after < len(text) and text[after].isalnum():
+        return False
+    # Part of a longer run such as "**" while closing "*"
+    return not (len(delimiter) == 1 and after < len(text) and text[after] == delimiter)
+
+
+def _text_node(text: str, marks: Dict[str, str], href: Optional[str]) -> Dict[str, Any]:
+    node: Dict[str, Any] = {"type": "text", "text": text}
+    # Code only combines with links in ADF
+    names = ["code"] if "code" in marks else [m for m in _MARK_ORDER if m in marks]
+    adf_marks: List[Dict[str, Any]] = [{"type": name} for name in names]
+    if href:
+        adf_marks.append({"type": "link", "attrs": {"href": href}})
+    if adf_marks:
+        node["marks"] = adf_marks
+    return node
+
+
+def markdown_to_adf(text: str) -> Dict[str, Any]:
+    """Convert Markdown to an ADF document.
+
+    Supports headings, paragraphs (line breaks are kept), bold, italic,
+    strikethrough, inline code, links, ``<url>`` cards, bullet, ordered and
+    ``- [ ]`` task lists with nesting, block quotes, fenced code blocks,
+    rules and pipe tables. Anything else is kept as plain text.
+    """
+    return _MarkdownParser().parse(text or "")
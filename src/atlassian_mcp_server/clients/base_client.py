@@ -5,7 +5,6 @@ Base Atlassian client with OAuth 2.0 authentication and common HTTP functionalit
 import asyncio
 import base64
 import hashlib
-import json
 import logging
 import secrets
 import threading
@@ -13,23 +12,103 @@ import time
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
 from pydantic import BaseModel
 
+from .cache import CachedResponse, ValidatorCache
+from .concurrency import AdaptiveLimiter
+from .rate_limit import RETRYABLE_STATUS_CODES, RetryRequest
+from .session import AtlassianSession
+
 logger = logging.getLogger(__name__)
 
+TOKEN_URL = "https://auth.atlassian.com/oauth/token"
+# Refresh in the background once the token is this close to expiring...
+TOKEN_REFRESH_AHEAD_SECONDS = 300
+# ...and block callers on the refresh once it is effectively expired.
+TOKEN_EXPIRY_SKEW_SECONDS = 30
+# Minimum gap between background refresh attempts after a failure.
+TOKEN_REFRESH_RETRY_SECONDS = 30
+# How long a resolved cloud ID may be reused from the persistent cache.
+CLOUD_ID_PERSIST_SECONDS = 24 * 3600
+# Site-level endpoints (path after the cloud ID) that exist on every site, so
+# a 404 from them means the cloud ID no longer routes to the configured site.
+# 404s from other endpoints are ordinary "not found" answers.
+SITE_LEVEL_PATHS = frozenset(
+    {
+        "/rest/api/3/myself",
+        "/rest/api/3/field",
+        "/rest/api/3/search/jql",
+        "/rest/api/3/issue/bulkfetch",
+        "/rest/servicedeskapi/servicedesk",
+        "/rest/servicedeskapi/request",
+        "/wiki/api/v2/spaces",
+        "/wiki/api/v2/pages",
+    }
+)
+
+# Total seconds (including retries) a call may take before failing fast.
+# Keys are passed as ``budget=`` to make_request and can be overridden through
+# AtlassianConfig.latency_budgets / ATLASSIAN_LATENCY_BUDGETS.
+DEFAULT_LATENCY_BUDGETS: Dict[str, float] = {
+    "jira_get_issue": 15.0,
+    "jira_get_issues": 45.0,
+    "jira_create_issues": 60.0,
+    "jira_search": 45.0,
+    "confluence_get_page": 30.0,
+    "confluence_search": 30.0,
+    "servicedesk_get_request": 15.0,
+    "bulk_export": 300.0,
+}
+
 
 class AtlassianConfig(BaseModel):
-    """Configuration for Atlassian Cloud connection."""
+    """Configuration for Atlassian Cloud connection.
+
+    The keep-alive pool defaults to ``max_connections`` (it used to be 10) so
+    parallel tool calls reuse warm connections instead of reopening them.
+    """
 
     site_url: str
     client_id: str
     client_secret: str
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
+    token_expires_at: Optional[float] = None
+    max_connections: int = 20
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    max_retries: int = 4
+    rate_limit_per_second: float = 20.0
+    rate_limit_burst: int = 40
+    concurrency_initial: int = 8
+    concurrency_max: int = 20
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    latency_budgets: Dict[str, float] = {}
+    http_cache_bytes: int = 32 * 1024 * 1024
+    reference_cache_bytes: int = 8 * 1024 * 1024
+    reference_cache_ttls: Dict[str, float] = {}
+    persistent_cache: bool = False
+    persistent_cache_path: Optional[str] = None
+    issue_store_path: Optional[str] = None
+    sync_reconcile_seconds: float = 3600.0
+    response_compaction: str = "prune"
+
+
+class CloudResource(BaseModel):
+    """Cached accessible-resources entry for a configured site."""
+
+    cloud_id: str
+    scopes: List[str] = []
+    token_fingerprint: str
+    resolved_at: float
 
 
 class AtlassianError(Exception):
@@ -104,10 +183,11 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 class BaseAtlassianClient:
     """Base HTTP client for Atlassian Cloud APIs with OAuth 2.0 authentication."""
 
-    def __init__(self, config: AtlassianConfig):
-        self.config = config
-        self.client = httpx.AsyncClient()
-        self.credentials_file = Path.home() / ".atlassian_mcp_credentials.json"
+    def __init__(
+        self, config: AtlassianConfig, session: Optional[AtlassianSession] = None
+    ):
+        self.session = session or AtlassianSession(config)
+        self.config = self.session.config
         self.server = None
         self.server_thread = None
         self.code_verifier = None
@@ -128,6 +208,16 @@ class BaseAtlassianClient:
         )
         return code_verifier, code_challenge
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared through the session."""
+        return self.session.http
+
+    @property
+    def credentials_file(self) -> Path:
+        """Path of the credentials file used by the session."""
+        return self.session.credentials.path
+
     def start_callback_server(self):
         """Start the callback server"""
         self.server = HTTPServer(("localhost", 8080), OAuthCallbackHandler)
@@ -224,7 +314,7 @@ class BaseAtlassianClient:
             }
 
             response = await self.client.post(
-                "https://auth.atlassian.com/oauth/token",
+                TOKEN_URL,
                 data=token_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
@@ -234,10 +324,8 @@ class BaseAtlassianClient:
                     f"Token exchange failed: {response.text}", "TOKEN_EXCHANGE_FAILED"
                 )
 
-            tokens = response.json()
-            self.config.access_token = tokens["access_token"]
-            self.config.refresh_token = tokens["refresh_token"]
-            self.save_credentials()
+            self._store_tokens(response.json())
+            await self.invalidate_cloud_id()
 
             return "✅ Authentication successful! You can now use Atlassian tools."
 
@@ -246,32 +334,25 @@ class BaseAtlassianClient:
 
     def save_credentials(self):
         """Save credentials to file"""
-        credentials = {
-            "site_url": self.config.site_url,
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret,
-            "access_token": self.config.access_token,
-            "refresh_token": self.config.refresh_token,
-        }
-        with open(self.credentials_file, "w", encoding="utf-8") as f:
-            json.dump(credentials, f, indent=2)
+        self.session.credentials.save()
 
     def load_credentials(self) -> bool:
         """Load saved credentials"""
-        if not self.credentials_file.exists():
-            return False
+        return self.session.credentials.load()
 
-        try:
-            with open(self.credentials_file, "r", encoding="utf-8") as f:
-                credentials = json.load(f)
-                self.config.access_token = credentials.get("access_token")
-                self.config.refresh_token = credentials.get("refresh_token")
-                return bool(self.config.access_token)
-        except (json.JSONDecodeError, KeyError):
-            return False
+    def _store_tokens(self, tokens: Dict[str, Any]) -> None:
+        """Apply a token endpoint response to the shared config and persist it."""
+        self.config.access_token = tokens["access_token"]
+        if "refresh_token" in tokens:
+            self.config.refresh_token = tokens["refresh_token"]
+        expires_in = tokens.get("expires_in")
+        self.config.token_expires_at = (
+            time.time() + float(expires_in) if expires_in else None
+        )
+        self.save_credentials()
 
-    async def refresh_access_token(self) -> bool:
-        """Refresh access token using refresh token"""
+    async def _request_token_refresh(self) -> bool:
+        """POST the refresh token grant and store the new tokens."""
         if not self.config.refresh_token:
             return False
 
@@ -282,21 +363,67 @@ class BaseAtlassianClient:
             "refresh_token": self.config.refresh_token,
         }
 
-        response = await self.client.post(
-            "https://auth.atlassian.com/oauth/token",
-            data=token_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+        try:
+            response = await self.client.post(
+                TOKEN_URL,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+        except httpx.RequestError as e:
+            logger.warning("Token refresh request failed: %s", e)
+            return False
 
         if response.status_code == 200:
-            tokens = response.json()
-            self.config.access_token = tokens["access_token"]
-            if "refresh_token" in tokens:
-                self.config.refresh_token = tokens["refresh_token"]
-            self.save_credentials()
+            self._store_tokens(response.json())
+            logger.debug("Access token refreshed")
             return True
+
+        logger.warning("Token refresh rejected with HTTP %s", response.status_code)
         return False
 
+    def _start_token_refresh(self) -> "asyncio.Future[bool]":
+        """Return the in-flight refresh, starting one if none is running."""
+        task = self.session.credentials.refresh_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._request_token_refresh())
+            task.add_done_callback(self._on_token_refresh_done)
+            self.session.credentials.refresh_task = task
+        return task
+
+    def _on_token_refresh_done(self, task: "asyncio.Future[bool]") -> None:
+        """Record refresh failures so background refreshes back off."""
+        if task.cancelled() or task.exception() is not None or not task.result():
+            self.session.credentials.refresh_failed_at = time.time()
+
+    async def refresh_access_token(self) -> bool:
+        """Refresh access token using refresh token.
+
+        Concurrent callers share a single token request, so a burst of expired
+        requests results in one POST and one saved refresh token.
+        """
+        if not self.config.refresh_token:
+            return False
+        return await asyncio.shield(self._start_token_refresh())
+
+    async def ensure_fresh_token(self) -> None:
+        """Refresh the access token ahead of expiry.
+
+        Shortly before expiry the refresh runs in the background while callers
+        keep using the current token; once the token is effectively expired,
+        callers wait on the shared refresh instead of collecting 401s.
+        """
+        expires_at = self.config.token_expires_at
+        if expires_at is None or not self.config.refresh_token:
+            return
+
+        remaining = expires_at - time.time()
+        if remaining <= TOKEN_EXPIRY_SKEW_SECONDS:
+            await self.refresh_access_token()
+        elif remaining <= TOKEN_REFRESH_AHEAD_SECONDS:
+            last_failure = self.session.credentials.refresh_failed_at
+            if time.time() - last_failure >= TOKEN_REFRESH_RETRY_SECONDS:
+                self._start_token_refresh()
+
     async def get_headers(self) -> Dict[str, str]:
         """Get authenticated headers"""
         if not self.config.access_token:
@@ -310,33 +437,299 @@ class BaseAtlassianClient:
             "Content-Type": "application/json",
         }
 
-    async def make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        """Make authenticated request with enhanced error handling."""
-        headers = await self.get_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs["headers"])
-        kwargs["headers"] = headers
+    async def _send(
+        self, method: str, url: str, extra_headers: Dict[str, str], **kwargs
+    ) -> httpx.Response:
+        """Send one authenticated request, refreshing the token on a 401."""
+        await self.ensure_fresh_token()
+        sent_token = self.config.access_token
+        kwargs["headers"] = {**await self.get_headers(), **extra_headers}
+
+        response = await self.client.request(method, url, **kwargs)
+
+        if response.status_code == 401:
+            # Another request may already have refreshed the token
+            if self.config.access_token != sent_token or (
+                await self.refresh_access_token()
+            ):
+                kwargs["headers"] = {**await self.get_headers(), **extra_headers}
+                response = await self.client.request(method, url, **kwargs)
+            else:
+                await self._invalidate_stale_cloud_id(url)
+                raise AtlassianError(
+                    "Authentication failed. Please re-authenticate.", "AUTH_FAILED"
+                )
 
-        try:
-            response = await self.client.request(method, url, **kwargs)
-
-            if response.status_code == 401:
-                if await self.refresh_access_token():
-                    headers = await self.get_headers()
-                    kwargs["headers"] = headers
-                    response = await self.client.request(method, url, **kwargs)
-                else:
-                    raise AtlassianError(
-                        "Authentication failed. Please re-authenticate.", "AUTH_FAILED"
-                    )
+        return response
 
+    async def _send_limited(
+        self,
+        limiter: Optional[AdaptiveLimiter],
+        method: str,
+        url: str,
+        extra_headers: Dict[str, str],
+        **kwargs,
+    ) -> httpx.Response:
+        """Send one request inside a slot of the adaptive concurrency limiter."""
+        if limiter is None:
+            return await self._send(method, url, extra_headers, **kwargs)
+
+        await limiter.acquire()
+        status_code = None
+        started = time.monotonic()
+        try:
+            response = await self._send(method, url, extra_headers, **kwargs)
+            status_code = response.status_code
             return response
+        finally:
+            limiter.release(status_code, time.monotonic() - started)
+            self.session.metrics.set(
+                f"concurrency_limit_{limiter.name}", round(limiter.limit, 2)
+            )
+
+    async def cached_reference(
+        self, category: str, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return slow-changing reference data from the shared TTL cache."""
+        return await self.session.reference_cache.get_or_load(category, key, loader)
 
+    def latency_budget(self, name: Optional[str]) -> Optional[float]:
+        """Return the configured latency budget in seconds for ``name``."""
+        if name is None:
+            return None
+        return self.config.latency_budgets.get(name, DEFAULT_LATENCY_BUDGETS.get(name))
+
+    async def make_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        budget: Optional[str] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Make authenticated request with enhanced error handling.
+
+        Throttled (429) and transiently unavailable (502/503/504) responses are
+        retried with jittered exponential backoff, honouring ``Retry-After``.
+        Only idempotent requests are retried on 5xx; pass ``idempotent=True`` for
+        read-only POSTs such as searches. ``budget`` names a latency budget that
+        bounds the whole call, retries included.
+        """
+        budget_seconds = self.latency_budget(budget)
+        if budget_seconds is None:
+            return await self._request_with_retries(
+                method, url, idempotent, None, **kwargs
+            )
+
+        deadline = time.monotonic() + budget_seconds
+        try:
+            return await asyncio.wait_for(
+                self._request_with_retries(method, url, idempotent, deadline, **kwargs),
+                budget_seconds,
+            )
+        except asyncio.TimeoutError as e:
+            self.session.metrics.increment("latency_budget_exceeded")
+            raise AtlassianError(
+                f"{budget} exceeded its {budget_seconds:g}s latency budget",
+                "LATENCY_BUDGET_EXCEEDED",
+                context={
+                    "url": url,
+                    "method": method,
+                    "budget_seconds": budget_seconds,
+                },
+                troubleshooting=["Atlassian is responding slowly or is degraded"],
+                suggested_actions=[
+                    "Retry the tool call later",
+                    "Narrow the request (fewer results or fields)",
+                ],
+            ) from e
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool],
+        deadline: Optional[float],
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, pacing and retrying it per the session policies."""
+        extra_headers = kwargs.pop("headers", None) or {}
+        request = RetryRequest(method, idempotent, deadline)
+        cache = self.session.validator_cache
+        cache_key = cached = None
+        if cache is not None and method.upper() == "GET":
+            cache_key = cache.key(url, kwargs.get("params"))
+            cached = cache.get(cache_key)
+            if cached:
+                extra_headers = {**cached.conditional_headers(), **extra_headers}
+
+        try:
+            response, retries = await self._send_with_retries(
+                request, url, extra_headers, **kwargs
+            )
+        except httpx.TimeoutException as e:
+            self.session.metrics.increment("timeouts")
+            raise AtlassianError(
+                f"Request timed out: {type(e).__name__}",
+                "REQUEST_TIMEOUT",
+                context={"url": url, "method": method},
+                suggested_actions=["Retry the tool call later"],
+            ) from e
         except httpx.RequestError as e:
             raise AtlassianError(f"Request failed: {str(e)}", "REQUEST_FAILED") from e
 
-    async def get_cloud_id(self, required_scopes: Optional[List[str]] = None) -> str:
-        """Get the cloud ID for the configured site"""
+        if cache is not None and cache_key is not None:
+            response = self._apply_validator_cache(cache, cache_key, cached, response)
+        elif cache is not None and response.is_success:
+            cache.invalidate(url)
+
+        if response.status_code == 401 or (
+            response.status_code == 404 and self._is_site_level(url)
+        ):
+            await self._invalidate_stale_cloud_id(url)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            self._raise_unavailable(response, retries)
+
+        return response
+
+    async def _send_with_retries(
+        self,
+        request: RetryRequest,
+        url: str,
+        extra_headers: Dict[str, str],
+        **kwargs,
+    ) -> Tuple[httpx.Response, int]:
+        """Send a request until the retry policy stops retrying it.
+
+        Returns the last response and the number of retries made.
+        """
+        policy = self.session.traffic.retry_policy
+        metrics = self.session.metrics
+        bucket = self.session.traffic.rate_limiter(httpx.URL(url).host)
+        limiter = self.session.traffic.concurrency_limiter(url)
+        attempt = 0
+        while True:
+            if bucket:
+                waited = await bucket.acquire()
+                if waited:
+                    metrics.increment("rate_limit_wait_seconds", waited)
+
+            response = await self._send_limited(
+                limiter, request.method, url, extra_headers, **kwargs
+            )
+            metrics.increment("requests")
+            metrics.increment(f"responses_{response.http_version}")
+            if bucket:
+                bucket.observe(response.headers)
+
+            status = response.status_code
+            delay = policy.retry_delay(request, status, response.headers, attempt)
+            if delay is None:
+                return response, attempt
+            if status == 429 and bucket:
+                bucket.pause(delay)
+
+            metrics.increment("retries")
+            metrics.increment(f"retries_http_{status}")
+            metrics.increment("retry_wait_seconds", delay)
+            logger.debug(
+                "HTTP %s from %s %s, retrying in %.2fs",
+                status,
+                request.method,
+                url,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _apply_validator_cache(
+        self,
+        cache: ValidatorCache,
+        key: str,
+        cached: Optional[CachedResponse],
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Serve 304s from the validator cache and store fresh cacheable bodies."""
+        metrics = self.session.metrics
+        if response.status_code == 304 and cached is not None:
+            metrics.increment("http_cache_hits")
+            metrics.increment("http_cache_bytes_saved", len(cached.content))
+            return httpx.Response(
+                200,
+                headers=cached.headers,
+                content=cached.content,
+                request=response.request,
+            )
+
+        metrics.increment("http_cache_misses")
+        if response.status_code == 200:
+            evicted = cache.store(key, response)
+            if evicted:
+                metrics.increment("http_cache_evictions", evicted)
+        else:
+            cache.discard(key)
+        metrics.set("http_cache_bytes", cache.size)
+        return response
+
+    def _raise_unavailable(self, response: httpx.Response, attempts: int) -> None:
+        """Raise a structured error for a throttled or unavailable response."""
+        throttled = response.status_code == 429
+        self.session.metrics.increment(
+            "rate_limited" if throttled else "service_unavailable"
+        )
+        retry_after = response.headers.get("Retry-After")
+        raise AtlassianError(
+            (
+                "Atlassian rate limit exceeded"
+                if throttled
+                else f"Atlassian service unavailable (HTTP {response.status_code})"
+            ),
+            "RATE_LIMITED" if throttled else "SERVICE_UNAVAILABLE",
+            context={
+                "url": str(response.request.url),
+                "status_code": response.status_code,
+                "retry_after": retry_after,
+                "retries": attempts,
+            },
+            suggested_actions=[
+                "Wait before retrying the tool call",
+                "Reduce the number of parallel tool calls",
+            ],
+        )
+
+    def _site_key(self) -> str:
+        """Return the normalised site URL used as the cloud ID cache key."""
+        return self.config.site_url.rstrip("/")
+
+    def _token_fingerprint(self) -> str:
+        """Return a short digest identifying the current access token."""
+        token = self.config.access_token or ""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+    async def invalidate_cloud_id(self) -> None:
+        """Drop the cached cloud ID so the next call re-resolves it."""
+        self.session.credentials.cloud_resources.pop(self._site_key(), None)
+        if self.session.persistent_cache is not None:
+            await self.session.persistent_cache.adelete("cloud_id", self._site_key())
+
+    def _is_site_level(self, url: str) -> bool:
+        """Whether ``url`` is a site-level endpoint under the cached cloud ID."""
+        cached = self.session.credentials.cloud_resources.get(self._site_key())
+        if not cached:
+            return False
+        _, found, path = url.partition(f"/{cached.cloud_id}/")
+        return bool(found) and "/" + path.split("?")[0].rstrip("/") in SITE_LEVEL_PATHS
+
+    async def _invalidate_stale_cloud_id(self, url: str) -> None:
+        """Invalidate the cached cloud ID if a failed request was routed with it."""
+        cached = self.session.credentials.cloud_resources.get(self._site_key())
+        if cached and f"/{cached.cloud_id}/" in url:
+            logger.debug("Invalidating cached cloud ID for %s", self._site_key())
+            await self.invalidate_cloud_id()
+
+    async def _resolve_cloud_resource(self) -> CloudResource:
+        """Look up the configured site in accessible-resources."""
         response = await self.make_request(
             "GET", "https://api.atlassian.com/oauth/token/accessible-resources"
         )
@@ -348,20 +741,69 @@ class BaseAtlassianClient:
             )
 
         resources = response.json()
-        site_url = self.config.site_url.rstrip("/")
+        site_url = self._site_key()
 
         for resource in resources:
             if resource["url"] == site_url:
-                if required_scopes:
-                    available_scopes = set(resource.get("scopes", []))
-                    missing_scopes = set(required_scopes) - available_scopes
-                    if missing_scopes:
-                        raise AtlassianError(
-                            f"Missing required scopes: {', '.join(missing_scopes)}",
-                            "INSUFFICIENT_SCOPES",
-                        )
-                return resource["id"]
+                return CloudResource(
+                    cloud_id=resource["id"],
+                    scopes=resource.get("scopes", []),
+                    token_fingerprint=self._token_fingerprint(),
+                    resolved_at=time.time(),
+                )
 
         raise AtlassianError(
             f"Site {site_url} not found in accessible resources", "SITE_NOT_FOUND"
         )
+
+    async def _load_persisted_cloud_resource(self) -> Optional[CloudResource]:
+        """Return the cloud ID saved by an earlier run for the configured site.
+
+        The entry is keyed on the site URL alone: a site's cloud ID does not
+        change when the access token is refreshed, and a stale entry is dropped
+        by the 401 and site-level 404 invalidation.
+        """
+        store = self.session.persistent_cache
+        if store is None:
+            return None
+        stored = await store.aget("cloud_id", self._site_key())
+        if stored is None:
+            return None
+        return CloudResource(
+            **dict(stored[0], token_fingerprint=self._token_fingerprint())
+        )
+
+    async def _persist_cloud_resource(self, resource: CloudResource) -> None:
+        """Save a freshly resolved cloud ID for warm starts."""
+        store = self.session.persistent_cache
+        if store is not None:
+            await store.aput(
+                "cloud_id",
+                self._site_key(),
+                resource.model_dump(),
+                CLOUD_ID_PERSIST_SECONDS,
+            )
+
+    async def get_cloud_id(self, required_scopes: Optional[List[str]] = None) -> str:
+        """Get the cloud ID for the configured site.
+
+        The accessible-resources lookup is cached per site URL and only repeated
+        when the access token changes or a request suggests the mapping is stale.
+        """
+        site_url = self._site_key()
+        resource = self.session.credentials.cloud_resources.get(site_url)
+        if resource is None or resource.token_fingerprint != self._token_fingerprint():
+            resource = await self._load_persisted_cloud_resource()
+        if resource is None:
+            resource = await self._resolve_cloud_resource()
+            await self._persist_cloud_resource(resource)
+        self.session.credentials.cloud_resources[site_url] = resource
+
+        if required_scopes:
+            missing_scopes = set(required_scopes) - set(resource.scopes)
+            if missing_scopes:
+                raise AtlassianError(
+                    f"Missing required scopes: {', '.join(missing_scopes)}",
+                    "INSUFFICIENT_SCOPES",
+                )
+        return resource.cloud_id
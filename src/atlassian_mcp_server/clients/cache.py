@@ -0,0 +1,225 @@
+"""
+Response caches for Atlassian Cloud requests.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+import httpx
+
+from ..storage import PersistentCache
+from .metrics import ClientMetrics
+
+# Headers that describe the wire encoding rather than the cached (decoded) body
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CachedResponse(NamedTuple):
+    """Body and validators of a cacheable GET response."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    content: bytes
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn the next GET into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """Size-bounded LRU of GET bodies keyed by URL, revalidated via ETag/Last-Modified."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a GET of ``url`` with query ``params``."""
+        return str(httpx.URL(url, params=params))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached entry for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: str, response: httpx.Response) -> int:
+        """Cache a 200 response carrying validators. Returns entries evicted."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        content = response.content
+        if not (etag or last_modified) or len(content) > self.max_bytes:
+            return 0
+
+        self.discard(key)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _WIRE_HEADERS
+        }
+        self._entries[key] = CachedResponse(etag, last_modified, headers, content)
+        self.size += len(content)
+
+        evicted = 0
+        while self.size > self.max_bytes:
+            _, oldest = self._entries.popitem(last=False)
+            self.size -= len(oldest.content)
+            evicted += 1
+        return evicted
+
+    def discard(self, key: str) -> None:
+        """Remove a single entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.content)
+
+    def invalidate(self, url: str) -> None:
+        """Drop every cached GET of ``url`` (any query string) after a write."""
+        prefix = str(httpx.URL(url).copy_with(query=None))
+        for key in [k for k in self._entries if k.split("?", 1)[0] == prefix]:
+            self.discard(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Seconds reference data stays fresh, per category
+DEFAULT_REFERENCE_TTLS: Dict[str, float] = {
+    "createmeta": 3600.0,
+    "createmeta_fields": 3600.0,
+    "fields": 3600.0,
+    "space": 3600.0,
+    "request_types": 1800.0,
+    "request_type_fields": 1800.0,
+    "object_types": 1800.0,
+    "users": 3600.0,
+}
+# Lifetime for categories without an entry in the TTL table
+DEFAULT_REFERENCE_TTL = 600.0
+
+
+class _ReferenceEntry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+class ReferenceCache:
+    """TTL + LRU cache for slow-changing reference data (projects, spaces, types).
+
+    Concurrent misses for the same key share one load. Memory is bounded by the
+    approximate JSON size of the cached values. With a ``backing`` store, misses
+    are first looked up on disk and loaded values are written through to it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttls: Optional[Mapping[str, float]] = None,
+        metrics: Optional[ClientMetrics] = None,
+        backing: Optional[PersistentCache] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_REFERENCE_TTLS, **(ttls or {})}
+        self.metrics = metrics or ClientMetrics()
+        self.backing = backing
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str], _ReferenceEntry]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+
+    def ttl(self, category: str) -> float:
+        """Freshness lifetime in seconds for ``category``."""
+        return self.ttls.get(category, DEFAULT_REFERENCE_TTL)
+
+    def get(self, category: str, key: str) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for a fresh entry."""
+        cache_key = (category, key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return False, None
+        if entry.expires_at <= time.monotonic():
+            self._discard(cache_key)
+            return False, None
+        self._entries.move_to_end(cache_key)
+        return True, entry.value
+
+    def set(
+        self, category: str, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store ``value`` (default: category TTL), evicting LRU entries if needed."""
+        cache_key = (category, key)
+        size = len(json.dumps(value, default=str))
+        self._discard(cache_key)
+        if size > self.max_bytes:
+            return
+        self._entries[cache_key] = _ReferenceEntry(
+            value, time.monotonic() + (self.ttl(category) if ttl is None else ttl), size
+        )
+        self.size += size
+        while self.size > self.max_bytes:
+            oldest, _ = next(iter(self._entries.items()))
+            self._discard(oldest)
+            self.metrics.increment("reference_cache_evictions")
+
+    async def invalidate(self, category: str, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry of ``category`` when ``key`` is None."""
+        for cache_key in list(self._entries):
+            if cache_key[0] == category and key in (None, cache_key[1]):
+                self._discard(cache_key)
+        if self.backing is not None:
+            await self.backing.adelete(category, key)
+
+    async def get_or_load(
+        self, category: str, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value or load it once, sharing concurrent loads."""
+        found, value = self.get(category, key)
+        if found:
+            self.metrics.increment("reference_cache_hits")
+            return value
+
+        cache_key = (category, key)
+        task = self._pending.get(cache_key)
+        if task is None:
+            self.metrics.increment("reference_cache_misses")
+            task = asyncio.ensure_future(self._load(category, key, loader))
+            self._pending[cache_key] = task
+            task.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, category: str, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.backing is not None:
+            stored = await self.backing.aget(category, key)
+            if stored is not None:
+                value, seconds_left, _ = stored
+                self.metrics.increment("persistent_cache_hits")
+                self.set(category, key, value, ttl=seconds_left)
+                return value
+
+        value = await loader()
+        self.set(category, key, value)
+        if self.backing is not None:
+            await self.backing.aput(category, key, value, self.ttl(category))
+        return value
+
+    def _discard(self, cache_key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
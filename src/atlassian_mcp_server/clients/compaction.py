@@ -0,0 +1,102 @@
+"""
+Pruning and flattening of Jira REST responses before they reach the agent.
+
+Jira decorates every object with REST links (``self``), four avatar sizes per
+user, icon URLs and ``expand`` hints. :func:`compact_response` strips these
+and, in ``flatten`` mode, reduces common objects such as status, priority and
+users to a single scalar. It works in place in one iterative pass and renders
+ADF documents it meets on the way when a body format is requested.
+"""
+
+from typing import Any, List
+
+from .adf import is_adf, render_adf
+
+COMPACTION_MODES = ("none", "prune", "flatten")
+
+# Keys dropped in prune and flatten modes, wherever they appear
+NOISE_KEYS = frozenset(
+    {"self", "avatarUrls", "iconUrl", "expand", "avatarId", "timeZone", "accountType"}
+)
+
+# Objects reduced to one attribute in flatten mode, by the key holding them.
+# List values (components, versions) are flattened item by item.
+FLATTEN_FIELDS = {
+    "status": "name",
+    "statusCategory": "name",
+    "priority": "name",
+    "issuetype": "name",
+    "resolution": "name",
+    "project": "key",
+    "components": "name",
+    "fixVersions": "name",
+    "versions": "name",
+    "watches": "watchCount",
+    "votes": "votes",
+}
+
+
+def check_compaction(compaction: str) -> None:
+    """Reject compaction modes other than none, prune and flatten."""
+    if compaction not in COMPACTION_MODES:
+        raise ValueError(
+            f"Unknown compaction mode '{compaction}'. "
+            f"Use one of: {', '.join(COMPACTION_MODES)}"
+        )
+
+
+def _flatten(key: str, value: Any) -> Any:
+    """Scalar form of a Jira object, or the value unchanged."""
+    if not isinstance(value, dict):
+        return value
+    if "accountId" in value:
+        # Users anywhere: assignee, reporter, comment authors, user pickers
+        return value.get("displayName") or value["accountId"]
+    attr = FLATTEN_FIELDS.get(key)
+    if attr is not None and attr in value:
+        return value[attr]
+    return value
+
+
+def compact_response(
+    value: Any, compaction: str = "prune", body_format: str = "adf"
+) -> Any:
+    """Prune, flatten and render a Jira response in place; returns ``value``.
+
+    ``compaction`` is ``"none"`` (keep every key), ``"prune"`` (drop
+    :data:`NOISE_KEYS`) or ``"flatten"`` (also reduce users and the objects in
+    :data:`FLATTEN_FIELDS` to scalars). ADF documents are rendered in
+    ``body_format`` and never descended into.
+    """
+    prune = compaction != "none"
+    flatten = compaction == "flatten"
+    render = body_format != "adf"
+    if not prune and not render:
+        return value
+
+    def visit(key: Any, child: Any) -> Any:
+        """Compacted form of one child; nested containers are queued."""
+        if is_adf(child):
+            return render_adf(child, body_format) if render else child
+        if flatten and isinstance(key, str):
+            if isinstance(child, list):
+                child = [_flatten(key, item) for item in child]
+            else:
+                child = _flatten(key, child)
+        if isinstance(child, (dict, list)) and child:
+            stack.append(child)
+        return child
+
+    stack: List[Any] = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, child in list(node.items()):
+                if prune and key in NOISE_KEYS:
+                    del node[key]
+                else:
+                    node[key] = visit(key, child)
+        elif isinstance(node, list):
+            for index, child in enumerate(node):
+                node[index] = visit(None, child)
+    return value
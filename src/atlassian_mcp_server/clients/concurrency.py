@@ -0,0 +1,119 @@
+"""
+Adaptive (AIMD) concurrency limiting for outbound Atlassian requests.
+
+Each traffic class (Jira, Confluence, Assets) gets its own limit. The limit
+grows additively while responses are healthy and is cut multiplicatively on
+throttling, transport errors or latency spikes, so a burst of tool calls
+backs off before Atlassian starts rejecting it.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+import httpx
+
+# Status codes that signal the upstream is overloaded
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+def traffic_class(url: str) -> str:
+    """Return the limiter name for ``url``: jira, confluence, assets or default."""
+    path = httpx.URL(url).path
+    if "/assets/" in path or "/insight/" in path:
+        return "assets"
+    if path.startswith("/ex/confluence/"):
+        return "confluence"
+    if path.startswith("/ex/jira/"):
+        return "jira"
+    return "default"
+
+
+class AdaptiveLimiter:  # pylint: disable=too-many-instance-attributes
+    """Additive-increase / multiplicative-decrease concurrency limit."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        *,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation; hand it on
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, status_code: Optional[int], latency: float) -> None:
+        """Free a slot and adapt the limit from the request outcome.
+
+        ``status_code`` is None when the request failed at the transport level.
+        """
+        self.in_flight -= 1
+        if status_code is None or status_code in OVERLOAD_STATUS_CODES:
+            self._decrease()
+        elif self._is_latency_spike(latency):
+            self._decrease()
+        elif status_code < 500:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._record_latency(latency)
+        self._wake()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        if self.baseline_latency is None or self._samples < 10:
+            return False
+        return latency > self.baseline_latency * self.latency_tolerance
+
+    def _record_latency(self, latency: float) -> None:
+        self._samples += 1
+        if self.baseline_latency is None:
+            self.baseline_latency = latency
+        else:
+            self.baseline_latency += 0.1 * (latency - self.baseline_latency)
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        # One cut per cooldown window: a burst of 429s is a single congestion event
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
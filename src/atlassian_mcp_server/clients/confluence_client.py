@@ -6,14 +6,14 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-from .base_client import BaseAtlassianClient
+from .base_client import AtlassianError, BaseAtlassianClient
 
 
 class ConfluenceClient(BaseAtlassianClient):
     """Confluence-specific client for content management operations."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, session=None):
+        super().__init__(config, session)
         self.confluence_base = "https://api.atlassian.com/ex/confluence"
         self.load_credentials()  # Load saved credentials
 
@@ -25,7 +25,9 @@ class ConfluenceClient(BaseAtlassianClient):
         url = f"{self.confluence_base}/{cloud_id}/wiki/api/v2/pages"
         params = {"title": query, "limit": limit, "body-format": "storage"}
 
-        response = await self.make_request("GET", url, params=params)
+        response = await self.make_request(
+            "GET", url, params=params, budget="confluence_search"
+        )
         return response.json().get("results", [])
 
     async def confluence_get_page(self, page_id: str) -> Dict[str, Any]:
@@ -34,19 +36,34 @@ class ConfluenceClient(BaseAtlassianClient):
         url = f"{self.confluence_base}/{cloud_id}/wiki/api/v2/pages/{page_id}"
         params = {"body-format": "storage"}
 
-        response = await self.make_request("GET", url, params=params)
+        response = await self.make_request(
+            "GET", url, params=params, budget="confluence_get_page"
+        )
         return response.json()
 
     async def _get_space_id(self, cloud_id: str, space_key: str) -> str:
-        """Helper method to get space ID from space key."""
-        space_url = f"{self.confluence_base}/{cloud_id}/wiki/api/v2/spaces"
-        space_response = await self.make_request(
-            "GET", space_url, params={"keys": space_key}
-        )
-        spaces = space_response.json().get("results", [])
-        if not spaces:
-            raise ValueError(f"Space '{space_key}' not found")
-        return spaces[0]["id"]
+        """Helper method to get space ID from space key (cached per key)."""
+
+        async def load() -> str:
+            space_url = f"{self.confluence_base}/{cloud_id}/wiki/api/v2/spaces"
+            space_response = await self.make_request(
+                "GET", space_url, params={"keys": space_key}
+            )
+            if not space_response.is_success:
+                raise AtlassianError(
+                    f"Space lookup failed: HTTP {space_response.status_code}",
+                    "SPACE_LOOKUP_FAILED",
+                    context={
+                        "space_key": space_key,
+                        "status_code": space_response.status_code,
+                    },
+                )
+            spaces = space_response.json().get("results", [])
+            if not spaces:
+                raise ValueError(f"Space '{space_key}' not found")
+            return spaces[0]["id"]
+
+        return await self.cached_reference("space", space_key, load)
 
     async def _build_page_data(
         self, space_id: str, title: str, content: str, parent_id: Optional[str] = None
@@ -0,0 +1,119 @@
+"""
+Create-metadata index used to resolve and validate Jira issue creation locally.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# Fields every create payload built by JiraClient supplies itself
+SUPPLIED_FIELDS = {"project", "issuetype", "summary", "description"}
+
+
+def compact_issue_types(issue_types: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Index createmeta issue types by lowercase name for caching."""
+    return {
+        it["name"].lower(): {
+            "id": str(it["id"]),
+            "name": it["name"],
+            "subtask": bool(it.get("subtask")),
+        }
+        for it in issue_types
+    }
+
+
+def compact_fields(fields: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce createmeta field metadata to what validation needs, for caching."""
+    index = {}
+    for field in fields:
+        allowed = None
+        if field.get("allowedValues"):
+            allowed = sorted(
+                {
+                    str(value[attr])
+                    for value in field["allowedValues"]
+                    if isinstance(value, dict)
+                    for attr in ("id", "name", "value", "key")
+                    if attr in value
+                }
+            )
+        index[field["fieldId"]] = {
+            "name": field.get("name", field["fieldId"]),
+            "required": bool(field.get("required")),
+            "has_default": bool(field.get("hasDefaultValue")),
+            "allowed_values": allowed,
+        }
+    return index
+
+
+class CreateMetaIndex:
+    """Per-project issue types plus required fields and allowed values per type.
+
+    Built from the cached, JSON-serialisable forms produced by
+    :func:`compact_issue_types` and :func:`compact_fields`.
+    """
+
+    def __init__(self, project_key: str, issue_types: Dict[str, Any]):
+        self.project_key = project_key
+        self.issue_types = issue_types
+
+    def issue_type(self, name: str) -> Dict[str, Any]:
+        """Return the issue type called ``name`` (case-insensitive)."""
+        issue_type = self.issue_types.get(name.strip().lower())
+        if issue_type is None:
+            available = ", ".join(it["name"] for it in self.issue_types.values())
+            raise ValueError(
+                f"Issue type '{name}' is not available in project "
+                f"{self.project_key}. Available types: {available or 'none'}"
+            )
+        return issue_type
+
+    @staticmethod
+    def validate(
+        issue_type: Dict[str, Any],
+        field_meta: Dict[str, Any],
+        fields: Dict[str, Any],
+    ) -> List[str]:
+        """Return the problems Jira would reject ``fields`` for, if any."""
+        problems = []
+        for field_id, meta in field_meta.items():
+            if (
+                meta["required"]
+                and not meta["has_default"]
+                and field_id not in SUPPLIED_FIELDS
+                and fields.get(field_id) in (None, "", [], {})
+            ):
+                problems.append(
+                    f"{meta['name']} ({field_id}) is required for "
+                    f"{issue_type['name']} issues"
+                )
+
+        for field_id, value in fields.items():
+            if field_id in SUPPLIED_FIELDS:
+                continue
+            meta = field_meta.get(field_id)
+            if meta is None:
+                problems.append(
+                    f"Field {field_id} cannot be set when creating "
+                    f"{issue_type['name']} issues"
+                )
+                continue
+            allowed = meta["allowed_values"]
+            if allowed is None or value is None:
+                continue
+            for item in value if isinstance(value, list) else [value]:
+                if not _matches_allowed(item, allowed):
+                    problems.append(
+                        f"{item!r} is not an allowed value for {meta['name']} "
+                        f"({field_id})"
+                    )
+        return problems
+
+
+def _matches_allowed(value: Any, allowed: List[str]) -> bool:
+    """Whether a field value refers to one of the allowed value identifiers."""
+    if isinstance(value, dict):
+        candidates: List[Optional[Any]] = [
+            value.get(attr) for attr in ("id", "name", "value", "key")
+        ]
+    else:
+        candidates = [value]
+    return any(str(c) in allowed for c in candidates if c is not None)
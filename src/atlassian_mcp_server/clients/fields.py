@@ -0,0 +1,170 @@
+"""
+Field catalogue used to translate between Jira field ids and display names.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+# Jira selectors that are passed through untouched
+FIELD_SELECTORS = {"*all", "*navigable"}
+# System field ids common to every site; lists made only of these, selectors
+# and custom field ids are used as-is without loading the catalogue
+SYSTEM_FIELD_IDS = frozenset(
+    {
+        "id",
+        "key",
+        "summary",
+        "description",
+        "status",
+        "statuscategorychangedate",
+        "assignee",
+        "reporter",
+        "creator",
+        "priority",
+        "issuetype",
+        "project",
+        "created",
+        "updated",
+        "duedate",
+        "resolution",
+        "resolutiondate",
+        "labels",
+        "components",
+        "fixVersions",
+        "versions",
+        "parent",
+        "subtasks",
+        "issuelinks",
+        "comment",
+        "worklog",
+        "attachment",
+        "environment",
+        "timetracking",
+        "watches",
+        "votes",
+    }
+)
+_CUSTOM_FIELD_ID = re.compile(r"^customfield_\d+$")
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def is_field_id(field: str) -> bool:
+    """Whether ``field`` is certainly an id or selector, without the catalogue."""
+    field = field.strip()
+    if field.startswith("-"):
+        field = field[1:]
+    return (
+        field in FIELD_SELECTORS
+        or field in SYSTEM_FIELD_IDS
+        or bool(_CUSTOM_FIELD_ID.match(field))
+    )
+
+
+def field_alias(name: str) -> str:
+    """Lowercase alias of a field name: ``"Story Points"`` -> ``"story_points"``."""
+    return _NON_ALNUM.sub("_", name.lower()).strip("_")
+
+
+def compact_field_list(fields: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce ``/rest/api/3/field`` output to what the catalogue needs, for caching."""
+    return [
+        {
+            "id": field["id"],
+            "name": field.get("name") or field["id"],
+            "custom": bool(field.get("custom")),
+            "clauseNames": list(field.get("clauseNames") or []),
+        }
+        for field in fields
+    ]
+
+
+class FieldCatalogue:
+    """Jira fields indexed by id, display name and lowercase alias.
+
+    Built from the cached list produced by :func:`compact_field_list`. Names
+    are matched case-insensitively, also as aliases (``story_points``) and JQL
+    clause names (``cf[10016]``). A name shared by several fields is ambiguous
+    and must be given as an id.
+    """
+
+    def __init__(self, fields: Sequence[Dict[str, Any]]):
+        self.by_id: Dict[str, Dict[str, Any]] = {f["id"]: f for f in fields}
+        self._by_name: Dict[str, List[str]] = {}
+        for field in fields:
+            keys = {field["name"].strip().lower(), field_alias(field["name"])}
+            keys.update(clause.lower() for clause in field.get("clauseNames") or [])
+            for key in keys:
+                ids = self._by_name.setdefault(key, [])
+                if field["id"] not in ids:
+                    ids.append(field["id"])
+        # Display names unique among custom fields, used as response keys
+        custom_names: Dict[str, List[str]] = {}
+        for field in fields:
+            if field.get("custom"):
+                custom_names.setdefault(field["name"], []).append(field["id"])
+        self._response_names = {
+            field_id: (
+                name
+                if len(ids) == 1 and name not in self.by_id
+                else f"{name} ({field_id})"
+            )
+            for name, ids in custom_names.items()
+            for field_id in ids
+        }
+
+    def resolve(self, field: str) -> str:
+        """Field id for an id, selector, display name or alias."""
+        field = field.strip()
+        if field in self.by_id or is_field_id(field):
+            return field
+        if field.startswith("-") and len(field) > 1:
+            return "-" + self.resolve(field[1:])
+        ids = self._by_name.get(field.lower()) or self._by_name.get(field_alias(field))
+        if not ids:
+            raise ValueError(f"Unknown Jira field '{field}'")
+        if len(ids) > 1:
+            raise ValueError(
+                f"Jira field name '{field}' is ambiguous; use one of the ids: "
+                + ", ".join(ids)
+            )
+        return ids[0]
+
+    def resolve_many(self, fields: Iterable[str]) -> List[str]:
+        """Resolve each of ``fields`` as :meth:`resolve` does, in order."""
+        return [self.resolve(field) for field in fields]
+
+    def uses_names(self, fields: Optional[Iterable[str]]) -> bool:
+        """Whether any entry of ``fields`` is a name rather than an id."""
+        return any(
+            field.strip().lstrip("-") not in self.by_id and not is_field_id(field)
+            for field in fields or []
+        )
+
+    def name(self, field_id: str) -> str:
+        """Display name of ``field_id`` (the id itself if unknown)."""
+        field = self.by_id.get(field_id)
+        return field["name"] if field else field_id
+
+    def to_ids(self, values: Mapping[str, Any]) -> Dict[str, Any]:
+        """Re-key a field-value mapping from names or ids to field ids."""
+        resolved: Dict[str, Any] = {}
+        for field, value in values.items():
+            field_id = self.resolve(field)
+            if field_id in resolved:
+                raise ValueError(f"Jira field '{field}' is given more than once")
+            resolved[field_id] = value
+        return resolved
+
+    def name_fields(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-key an issue's custom fields by display name, in place.
+
+        System fields keep their readable ids. A custom field whose name is
+        shared with another field keeps its id in parentheses.
+        """
+        fields = issue.get("fields")
+        if isinstance(fields, dict):
+            issue["fields"] = {
+                self._response_names.get(key, key): value
+                for key, value in fields.items()
+            }
+        return issue
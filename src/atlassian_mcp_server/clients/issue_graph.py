@@ -0,0 +1,188 @@
+"""
+Issue graph built while traversing Jira hierarchies (parent, children,
+subtasks) and issue links breadth-first.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from pydantic import BaseModel
+
+# Fields a traversal requests for every issue it visits
+GRAPH_FIELDS = ["summary", "status", "issuetype", "parent", "issuelinks"]
+# Hierarchy directions that can be followed; links are chosen by type
+GRAPH_RELATIONS = ("parent", "children")
+
+
+class Edge(NamedTuple):
+    """A relation read from one issue's fields, labelled from both ends."""
+
+    label: str
+    key: str
+    reverse: str
+    link: bool
+
+
+def check_relations(relations: Iterable[str]) -> None:
+    """Reject relations other than parent and children."""
+    unknown = [r for r in relations if r not in GRAPH_RELATIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown relation '{unknown[0]}'. "
+            f"Use any of: {', '.join(GRAPH_RELATIONS)}"
+        )
+
+
+class Traversal(BaseModel):
+    """What a traversal follows from its start issue, and how far.
+
+    ``relations`` picks the hierarchy directions: ``parent`` (up to the parent
+    or epic) and ``children`` (down to child issues and subtasks).
+    ``link_types`` adds issue links by type name or direction (``"Blocks"``,
+    ``"is blocked by"``, ``"*"`` for all). The walk stops after ``max_depth``
+    levels or ``max_nodes`` issues.
+    """
+
+    relations: List[str] = list(GRAPH_RELATIONS)
+    link_types: Optional[List[str]] = None
+    max_depth: int = 3
+    max_nodes: int = 200
+
+    def check(self) -> None:
+        """Reject unknown relations and limits that allow no walk."""
+        check_relations(self.relations)
+        if self.max_depth < 0 or self.max_nodes < 1:
+            raise ValueError("max_depth must be >= 0 and max_nodes >= 1")
+
+
+def link_type_set(link_types: Optional[Iterable[str]]) -> Set[str]:
+    """Lowercase link type names or directions to follow (``*`` for all)."""
+    return {name.strip().lower() for name in link_types or [] if name.strip()}
+
+
+def issue_edges(issue: Dict[str, Any], link_types: Set[str]) -> List[Edge]:
+    """Hierarchy and chosen link edges held in ``issue``'s own fields.
+
+    A link type is chosen by its name (both directions) or by one direction's
+    description, e.g. ``blocks`` or ``is blocked by``.
+    """
+    fields = issue.get("fields") or {}
+    edges = []
+    parent = fields.get("parent")
+    if isinstance(parent, dict) and parent.get("key"):
+        issue_type = fields.get("issuetype") or {}
+        reverse = "subtasks" if issue_type.get("subtask") else "children"
+        edges.append(Edge("parent", parent["key"], reverse, False))
+    if not link_types:
+        return edges
+    for link in fields.get("issuelinks") or []:
+        link_type = link.get("type") or {}
+        name = (link_type.get("name") or "").lower()
+        outward = link_type.get("outward") or name
+        inward = link_type.get("inward") or name
+        if "outwardIssue" in link:
+            label, reverse, other = outward, inward, link["outwardIssue"]
+        elif "inwardIssue" in link:
+            label, reverse, other = inward, outward, link["inwardIssue"]
+        else:
+            continue
+        if "*" in link_types or name in link_types or label.lower() in link_types:
+            edges.append(Edge(label, other["key"], reverse, True))
+    return edges
+
+
+class IssueGraph:
+    """Visited issues in breadth-first order with the edges between them.
+
+    Only a compact summary and the outgoing edges of each issue are kept, not
+    the fetched issue itself. ``failed`` holds the error of each neighbour
+    that could not be fetched and ``truncated`` tells whether a limit cut the
+    walk short.
+    """
+
+    def __init__(self, link_types: Set[str]):
+        self.link_types = link_types
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[str, List[Edge]] = {}
+        self.failed: Dict[str, str] = {}
+        self.truncated = False
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, issue: Dict[str, Any], depth: int) -> str:
+        """Record a fetched issue at ``depth``; returns its key."""
+        key = issue["key"]
+        fields = issue.get("fields") or {}
+        self.nodes[key] = {
+            "key": key,
+            "summary": fields.get("summary"),
+            "type": (fields.get("issuetype") or {}).get("name"),
+            "status": (fields.get("status") or {}).get("name"),
+            "depth": depth,
+        }
+        self._edges[key] = issue_edges(issue, self.link_types)
+        return key
+
+    def neighbours(self, key: str, follow_parent: bool) -> Iterator[str]:
+        """Unvisited issues reachable from ``key`` through its own fields."""
+        for edge in self._edges[key]:
+            if (edge.link or follow_parent) and edge.key not in self.nodes:
+                yield edge.key
+
+    def next_keys(
+        self, frontier: Sequence[str], follow_parent: bool, limit: int
+    ) -> List[str]:
+        """Up to ``limit`` unvisited neighbours of ``frontier`` not known to fail."""
+        keys = list(
+            dict.fromkeys(
+                key
+                for parent in frontier
+                for key in self.neighbours(parent, follow_parent)
+                if key not in self.failed
+            )
+        )
+        if len(keys) > limit:
+            self.truncated = True
+            keys = keys[:limit]
+        return keys
+
+    def add_level(
+        self, issues: Iterable[Dict[str, Any]], depth: int, max_nodes: int
+    ) -> List[str]:
+        """Record new ``issues`` at ``depth`` while there is room; returns their keys."""
+        added = []
+        for issue in issues:
+            if issue["key"] in self:
+                continue
+            if len(self) >= max_nodes:
+                self.truncated = True
+                break
+            added.append(self.add(issue, depth))
+        return added
+
+    def adjacency(self) -> List[Dict[str, Any]]:
+        """Nodes with their edges to other visited nodes, by relation label."""
+        related: Dict[str, Dict[str, Dict[str, None]]] = {key: {} for key in self.nodes}
+        for key, edges in self._edges.items():
+            for edge in edges:
+                if edge.key not in related:
+                    continue
+                related[key].setdefault(edge.label, {})[edge.key] = None
+                related[edge.key].setdefault(edge.reverse, {})[key] = None
+        return [
+            dict(node, edges={label: list(keys) for label, keys in edges.items()})
+            for node, edges in zip(self.nodes.values(), related.values())
+        ]
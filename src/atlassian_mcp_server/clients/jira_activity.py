@@ -0,0 +1,213 @@
+"""
+Changelog and worklog streaming over JQL results for the Jira client.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from .activity import (
+    StatusTimes,
+    WorklogTotals,
+    compact_history,
+    compact_worklog,
+    parse_time,
+    status_durations,
+)
+from .base_client import AtlassianError
+from .jira_core import IssueView
+from .jira_search import JiraSearchMixin, stream_concurrently
+
+# Issues per /changelog/bulkfetch request, histories per page, requests in flight
+CHANGELOG_BATCH_SIZE = 200
+CHANGELOG_PAGE_SIZE = 10000
+CHANGELOG_CONCURRENCY = 4
+# /worklog/list accepts the 1000 ids of one /worklog/updated page
+WORKLOG_CONCURRENCY = 4
+# Jira allows 5000 results per search page when only ids are requested
+ID_SEARCH_PAGE_SIZE = 5000
+
+
+class JiraActivityMixin(JiraSearchMixin):
+    """Status times and worklog totals over issues matching a JQL query."""
+
+    async def _fetch_changelogs(
+        self, cloud_id: str, issues: List[Dict[str, Any]], field_ids: Sequence[str]
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Compacted change histories of ``issues`` for ``field_ids``, per issue."""
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/changelog/bulkfetch"
+        histories: Dict[str, List[Dict[str, Any]]] = {
+            str(issue["id"]): [] for issue in issues
+        }
+        body: Dict[str, Any] = {
+            "issueIdsOrKeys": list(histories),
+            "fieldIds": list(field_ids),
+            "maxResults": CHANGELOG_PAGE_SIZE,
+        }
+        while True:
+            response = await self.make_request(
+                "POST", url, json=body, idempotent=True, budget="bulk_export"
+            )
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Could not fetch changelogs: HTTP {response.status_code}",
+                    "CHANGELOG_FAILED",
+                    context={"status_code": response.status_code},
+                )
+            page = response.json()
+            for log in page.get("issueChangeLogs", []):
+                target = histories.get(str(log.get("issueId")))
+                if target is not None:
+                    target.extend(
+                        compact_history(history)
+                        for history in log.get("changeHistories", [])
+                    )
+            if not page.get("nextPageToken"):
+                break
+            body["nextPageToken"] = page["nextPageToken"]
+        return [(issue, histories[str(issue["id"])]) for issue in issues]
+
+    async def iter_changelogs(
+        self,
+        jql: str,
+        fields: Sequence[str] = ("created", "status"),
+        field_ids: Sequence[str] = ("status",),
+        max_issues: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Yield ``(issue, histories)`` for issues matching ``jql``.
+
+        Search pages are grouped into batches of 200 issues whose changelogs,
+        restricted to ``field_ids``, come from ``/changelog/bulkfetch`` with a
+        few batches in flight. Histories are compacted to their timestamp and
+        changed values, and only the batches in flight are held in memory.
+        """
+        cloud_id = await self.get_cloud_id()
+
+        async def fetch(
+            issues: List[Dict[str, Any]],
+        ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+            return await self._fetch_changelogs(cloud_id, issues, field_ids)
+
+        batches = self._search_batches(jql, fields, CHANGELOG_BATCH_SIZE, max_issues)
+        async for results in stream_concurrently(batches, fetch, CHANGELOG_CONCURRENCY):
+            for result in results:
+                yield result
+
+    async def iter_worklogs(
+        self, jql: str, since: datetime, until: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield compacted worklogs on issues matching ``jql``.
+
+        Worklogs updated since ``since`` are listed page by page through
+        ``/worklog/updated`` and each page's ids are fetched through
+        ``/worklog/list`` with a few requests in flight. Worklogs on other
+        issues, or started outside ``[since, until)``, are dropped.
+        """
+        cloud_id = await self.get_cloud_id()
+        base = f"{self.jira_base}/{cloud_id}/rest/api/3/worklog"
+        issue_keys = {
+            str(issue["id"]): issue["key"]
+            async for issue in self.iter_jira_search(
+                jql, view=IssueView(fields=["id"]), page_size=ID_SEARCH_PAGE_SIZE
+            )
+        }
+        if not issue_keys:
+            return
+
+        def failed(response: Any) -> AtlassianError:
+            return AtlassianError(
+                f"Could not fetch worklogs: HTTP {response.status_code}",
+                "WORKLOG_FAILED",
+                context={"status_code": response.status_code},
+            )
+
+        async def updated_pages() -> AsyncIterator[List[int]]:
+            cursor = int(since.timestamp() * 1000)
+            while True:
+                response = await self.make_request(
+                    "GET",
+                    f"{base}/updated",
+                    params={"since": cursor},
+                    budget="bulk_export",
+                )
+                if not response.is_success:
+                    raise failed(response)
+                page = response.json()
+                ids = [value["worklogId"] for value in page.get("values", [])]
+                if ids:
+                    yield ids
+                if page.get("lastPage", True) or not page.get("until"):
+                    return
+                cursor = page["until"]
+
+        async def fetch(ids: List[int]) -> List[Dict[str, Any]]:
+            response = await self.make_request(
+                "POST",
+                f"{base}/list",
+                json={"ids": ids},
+                idempotent=True,
+                budget="bulk_export",
+            )
+            if not response.is_success:
+                raise failed(response)
+            worklogs = []
+            for worklog in response.json():
+                key = issue_keys.get(str(worklog.get("issueId")))
+                if key is None or not worklog.get("started"):
+                    continue
+                started = parse_time(worklog["started"])
+                if started >= since and (until is None or started < until):
+                    worklogs.append(compact_worklog(worklog, key))
+            return worklogs
+
+        async for worklogs in stream_concurrently(
+            updated_pages(), fetch, WORKLOG_CONCURRENCY
+        ):
+            for worklog in worklogs:
+                yield worklog
+
+    async def jira_status_times(
+        self, jql: str, max_issues: int = 1000, include_issues: bool = True
+    ) -> Dict[str, Any]:
+        """Time spent in each status by issues matching ``jql``.
+
+        Each issue's status history is turned into hours per status (the
+        current status counts until now) as soon as its batch arrives.
+        """
+        now = datetime.now(timezone.utc)
+        times = StatusTimes(keep_issues=include_issues)
+        async for issue, histories in self.iter_changelogs(jql, max_issues=max_issues):
+            fields = issue.get("fields") or {}
+            status = (fields.get("status") or {}).get("name")
+            times.add(
+                issue["key"],
+                status,
+                status_durations(fields["created"], status, histories, now),
+            )
+        report: Dict[str, Any] = {
+            "issues_scanned": times.count,
+            "truncated": times.count >= max_issues,
+            "statuses": times.summary(),
+        }
+        if include_issues:
+            report["issues"] = times.issues
+        return report
+
+    async def jira_worklog_summary(
+        self, jql: str, since: str, until: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Hours logged on issues matching ``jql`` between ``since`` and ``until``.
+
+        Dates are ISO dates or datetimes (UTC unless an offset is given).
+        """
+        start = parse_time(since)
+        end = parse_time(until) if until else None
+        if end is not None and end <= start:
+            raise ValueError("until must be later than since")
+        totals = WorklogTotals()
+        async for worklog in self.iter_worklogs(jql, start, end):
+            totals.add(worklog)
+        return {
+            "since": start.isoformat(),
+            "until": end.isoformat() if end else None,
+            **totals.summary(),
+        }
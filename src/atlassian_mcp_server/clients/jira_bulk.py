@@ -0,0 +1,212 @@
+"""
+Bulk issue fetching and issue graph traversal for the Jira client.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .base_client import AtlassianError
+from .issue_graph import GRAPH_FIELDS, IssueGraph, Traversal, link_type_set
+from .jira_core import IssueView
+from .jira_search import JiraSearchMixin
+
+# /issue/bulkfetch accepts up to 100 issues; chunks are fetched in parallel
+BULK_FETCH_SIZE = 100
+BULK_FETCH_CONCURRENCY = 4
+MISSING_ISSUE_ERROR = "Issue does not exist or you do not have permission to see it"
+# Parent keys per "parent in (...)" query when traversing, and queries in flight
+TRAVERSE_JQL_KEYS = 50
+TRAVERSE_CONCURRENCY = 4
+
+
+class JiraBulkMixin(JiraSearchMixin):
+    """Fetching many issues, or the issues around one, in few requests."""
+
+    async def _bulk_fetch(
+        self, cloud_id: str, keys: Sequence[str], body: Dict[str, Any]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Fetch issues through ``/issue/bulkfetch`` in parallel chunks.
+
+        Returns the issues found, indexed by upper-case key and by id, and
+        error messages by key or id for chunks or issues that failed.
+        """
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/issue/bulkfetch"
+        found: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        semaphore = asyncio.Semaphore(BULK_FETCH_CONCURRENCY)
+
+        async def fetch_chunk(chunk: List[str]) -> None:
+            async with semaphore:
+                try:
+                    response = await self.make_request(
+                        "POST",
+                        url,
+                        json=dict(body, issueIdsOrKeys=chunk),
+                        idempotent=True,
+                        budget="jira_get_issues",
+                    )
+                except AtlassianError as e:
+                    errors.update((key, str(e)) for key in chunk)
+                    return
+            result = response.json() if response.content else {}
+            if not response.is_success:
+                message = "; ".join(result.get("errorMessages", [])) or (
+                    f"HTTP {response.status_code}"
+                )
+                errors.update((key, message) for key in chunk)
+                return
+            for issue in result.get("issues", []):
+                found[issue["key"].upper()] = issue
+                found[str(issue["id"])] = issue
+            for error in result.get("issueErrors", []):
+                errors[str(error.get("id"))] = error.get("errorMessage", "")
+
+        await asyncio.gather(
+            *(
+                fetch_chunk(list(keys[i : i + BULK_FETCH_SIZE]))
+                for i in range(0, len(keys), BULK_FETCH_SIZE)
+            )
+        )
+        return found, errors
+
+    async def jira_get_issues(
+        self,
+        issue_keys: Sequence[str],
+        view: Optional[IssueView] = None,
+    ) -> Dict[str, Any]:
+        """Get many Jira issues by key or id through the bulk-fetch endpoint.
+
+        Keys are fetched in chunks of up to 100 with bounded parallelism.
+        Issues are returned in input order; keys that could not be fetched are
+        reported under ``errors`` instead of failing the whole call. ``view``
+        defaults to the "standard" profile.
+        """
+        view = view or IssueView()
+        shape = self.response_shape(view.body_format, view.compaction)
+        cloud_id = await self.get_cloud_id()
+        unique = list(dict.fromkeys(key.strip() for key in issue_keys if key.strip()))
+        body: Dict[str, Any] = {
+            "fields": await self.view_fields(cloud_id, view, "standard")
+        }
+        if view.expand:
+            body["expand"] = list(view.expand)
+
+        found, errors = await self._bulk_fetch(cloud_id, unique, body)
+        issues = []
+        missing = []
+        for key in unique:
+            issue = found.get(key.upper())
+            if issue is not None:
+                issues.append(issue)
+            else:
+                missing.append(
+                    {
+                        "key": key,
+                        "error": errors.get(key) or MISSING_ISSUE_ERROR,
+                    }
+                )
+        return {
+            "issues": await self.present_issues(issues, view, shape),
+            "errors": missing,
+        }
+
+    async def _child_issues(
+        self, parents: Sequence[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Children and subtasks of ``parents`` through chunked JQL queries.
+
+        Each query returns at most ``limit`` issues; the flag tells whether
+        any query stopped at that limit.
+        """
+        semaphore = asyncio.Semaphore(TRAVERSE_CONCURRENCY)
+
+        async def query(chunk: Sequence[str]) -> List[Dict[str, Any]]:
+            keys = ", ".join(f'"{key}"' for key in chunk)
+            async with semaphore:
+                return [
+                    issue
+                    async for issue in self.iter_jira_search(
+                        f"parent in ({keys})", limit, IssueView(fields=GRAPH_FIELDS)
+                    )
+                ]
+
+        results = await asyncio.gather(
+            *(
+                query(parents[i : i + TRAVERSE_JQL_KEYS])
+                for i in range(0, len(parents), TRAVERSE_JQL_KEYS)
+            )
+        )
+        return [issue for issues in results for issue in issues], any(
+            len(issues) >= limit for issues in results
+        )
+
+    async def jira_traverse(
+        self, issue_key: str, traversal: Optional[Traversal] = None
+    ) -> Dict[str, Any]:
+        """Walk the issue graph around ``issue_key`` breadth-first.
+
+        ``traversal`` picks the relations to follow and the limits (by default
+        parent and children, three levels, 200 issues). Each level is fetched
+        at once: children through ``parent in (...)`` JQL queries and other
+        neighbours through the bulk-fetch endpoint, both with bounded
+        concurrency.
+        """
+        traversal = traversal or Traversal()
+        traversal.check()
+        cloud_id = await self.get_cloud_id()
+        body = {"fields": GRAPH_FIELDS}
+        found, errors = await self._bulk_fetch(cloud_id, [issue_key.strip()], body)
+        root = found.get(issue_key.strip().upper())
+        if root is None:
+            raise AtlassianError(
+                errors.get(issue_key.strip()) or MISSING_ISSUE_ERROR,
+                "ISSUE_NOT_FOUND",
+                context={"issue_key": issue_key},
+            )
+
+        graph = IssueGraph(link_type_set(traversal.link_types))
+        frontier = [graph.add(root, 0)]
+        for depth in range(1, traversal.max_depth + 1):
+            if not frontier:
+                break
+            frontier = await self._traverse_level(graph, frontier, depth, traversal)
+
+        return {
+            "root": root["key"],
+            "nodes": graph.adjacency(),
+            "truncated": graph.truncated,
+            "errors": [
+                {"key": key, "error": error} for key, error in graph.failed.items()
+            ],
+        }
+
+    async def _traverse_level(
+        self,
+        graph: IssueGraph,
+        frontier: List[str],
+        depth: int,
+        traversal: Traversal,
+    ) -> List[str]:
+        """Fetch the issues one hop from ``frontier`` into ``graph``.
+
+        Returns the keys added, which form the next frontier.
+        """
+        cloud_id = await self.get_cloud_id()
+        body = {"fields": GRAPH_FIELDS}
+        room = traversal.max_nodes - len(graph)
+        wanted = graph.next_keys(frontier, "parent" in traversal.relations, room)
+        children: List[Dict[str, Any]] = []
+        if "children" in traversal.relations and room > 0:
+            (children, capped), (found, errors) = await asyncio.gather(
+                self._child_issues(frontier, room),
+                self._bulk_fetch(cloud_id, wanted, body),
+            )
+            graph.truncated = graph.truncated or capped
+        else:
+            found, errors = await self._bulk_fetch(cloud_id, wanted, body)
+
+        for key in wanted:
+            if key.upper() not in found:
+                graph.failed[key] = errors.get(key) or MISSING_ISSUE_ERROR
+        fetched = [found[key.upper()] for key in wanted if key not in graph.failed]
+        return graph.add_level(children + fetched, depth, traversal.max_nodes)
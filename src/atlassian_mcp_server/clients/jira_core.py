@@ -0,0 +1,298 @@
+"""
+Shared state and helpers of the Jira client: response shaping, users and fields.
+"""
+
+import asyncio
+import functools
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from .adf import check_body_format
+from .base_client import AtlassianError, BaseAtlassianClient
+from .compaction import check_compaction, compact_response
+from .fields import FieldCatalogue, compact_field_list, is_field_id
+from .users import apply_user_names, compact_user, unnamed_user_refs
+
+logger = logging.getLogger(__name__)
+
+# Account ids per /user/bulk request (they all go in the query string)
+USER_BULK_SIZE = 100
+USER_LOOKUP_CONCURRENCY = 4
+
+# Named field projections; "compact" is the search default, "standard" the
+# bulk get_issues default and "full" (every field) the get_issue default.
+FIELD_PROFILES: Dict[str, List[str]] = {
+    "compact": ["summary", "status", "assignee", "priority", "issuetype", "updated"],
+    "standard": [
+        "summary",
+        "status",
+        "assignee",
+        "reporter",
+        "priority",
+        "issuetype",
+        "created",
+        "updated",
+        "duedate",
+        "resolution",
+        "labels",
+        "components",
+        "fixVersions",
+        "parent",
+        "subtasks",
+        "issuelinks",
+        "description",
+    ],
+    "full": ["*all"],
+}
+
+
+class IssueView(BaseModel):
+    """Which fields of an issue to fetch and how to render them."""
+
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Field ids or display names (e.g. 'Story Points'); "
+        "overrides profile",
+    )
+    expand: Optional[List[str]] = Field(
+        default=None,
+        description="Jira expand options (e.g. 'changelog', 'renderedFields')",
+    )
+    profile: Optional[str] = Field(
+        default=None,
+        description="Field profile - 'compact', 'standard' or 'full' "
+        "(default depends on the tool)",
+    )
+    body_format: str = Field(
+        default="adf",
+        description="'adf' (raw), or 'markdown' / 'text' to render descriptions "
+        "and comments compactly",
+    )
+    compaction: Optional[str] = Field(
+        default=None,
+        description="'prune' drops links, avatars and icons; 'flatten' also "
+        "reduces status, priority, type and users to names; 'none' returns "
+        "Jira's objects as they are (default from ATLASSIAN_RESPONSE_COMPACTION, "
+        "'prune')",
+    )
+    field_names: Optional[bool] = Field(
+        default=None,
+        description="Key custom fields by display name instead of "
+        "customfield_NNNNN; by default only when fields used names",
+    )
+
+
+class JiraCore(BaseAtlassianClient):
+    """Jira client state shared by the operation mixins."""
+
+    def __init__(self, config, session=None):
+        super().__init__(config, session)
+        self.jira_base = "https://api.atlassian.com/ex/jira"
+        # In-flight /user/bulk requests by cache key, shared by concurrent lookups
+        self._user_loads: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        # Catalogue built from the cached field list, per cloud id
+        self._catalogues: Dict[str, Tuple[Any, FieldCatalogue]] = {}
+        self.load_credentials()  # Load saved credentials
+
+    def response_shape(
+        self, body_format: str = "adf", compaction: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Validate a body format and compaction mode (default from config)."""
+        check_body_format(body_format)
+        compaction = compaction or self.config.response_compaction
+        check_compaction(compaction)
+        return body_format, compaction
+
+    @staticmethod
+    def shape_issue(
+        issue: Dict[str, Any], shape: Tuple[str, str] = ("adf", "none")
+    ) -> Dict[str, Any]:
+        """Render ADF bodies and compact an issue in place, in one pass.
+
+        ``shape`` is the ``(body_format, compaction)`` pair returned by
+        :meth:`response_shape`.
+        """
+        body_format, compaction = shape
+        return compact_response(issue, compaction, body_format)
+
+    async def resolve_users(
+        self, account_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Resolve account ids to user records, using the cached directory.
+
+        Ids missing from the cache are fetched through ``/user/bulk``, up to
+        100 per request with bounded parallelism, and cached (unknown ids
+        included) for the ``users`` TTL. Concurrent lookups of the same id
+        share one request. Ids Jira does not know are left out.
+        """
+        cloud_id = await self.get_cloud_id()
+        cache = self.session.reference_cache
+        users: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for account_id in dict.fromkeys(a for a in account_ids if a):
+            found, user = cache.get("users", f"{cloud_id}:{account_id}")
+            if found:
+                cache.metrics.increment("reference_cache_hits")
+                if user is not None:
+                    users[account_id] = user
+            else:
+                missing.append(account_id)
+        if not missing:
+            return users
+
+        self._start_user_loads(cloud_id, missing)
+        tasks = {self._user_loads[f"{cloud_id}:{a}"] for a in missing}
+        for loaded in await asyncio.gather(*(asyncio.shield(t) for t in tasks)):
+            users.update((a, loaded[a]) for a in missing if a in loaded)
+        return users
+
+    def _start_user_loads(self, cloud_id: str, account_ids: List[str]) -> None:
+        """Start ``/user/bulk`` loads for the ids no lookup is loading yet."""
+        new = [a for a in account_ids if f"{cloud_id}:{a}" not in self._user_loads]
+        self.session.reference_cache.metrics.increment(
+            "reference_cache_misses", len(new)
+        )
+        semaphore = asyncio.Semaphore(USER_LOOKUP_CONCURRENCY)
+        for i in range(0, len(new), USER_BULK_SIZE):
+            chunk = new[i : i + USER_BULK_SIZE]
+            keys = [f"{cloud_id}:{a}" for a in chunk]
+            task = asyncio.ensure_future(self._load_users(cloud_id, chunk, semaphore))
+            for key in keys:
+                self._user_loads[key] = task
+            task.add_done_callback(functools.partial(self._forget_user_loads, keys))
+
+    def _forget_user_loads(self, keys: List[str], _: Any) -> None:
+        for key in keys:
+            self._user_loads.pop(key, None)
+
+    async def _load_users(
+        self, cloud_id: str, account_ids: List[str], semaphore: asyncio.Semaphore
+    ) -> Dict[str, Dict[str, Any]]:
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/user/bulk"
+        params = [("accountId", a) for a in account_ids]
+        params.append(("maxResults", str(len(account_ids))))
+        async with semaphore:
+            response = await self.make_request("GET", url, params=params)
+        if not response.is_success:
+            raise AtlassianError(
+                f"User lookup failed: HTTP {response.status_code}",
+                "USER_LOOKUP_FAILED",
+                context={"status_code": response.status_code},
+                suggested_actions=["Check that the token has the read:jira-user scope"],
+            )
+        found = {
+            user["accountId"]: compact_user(user)
+            for user in response.json().get("values", [])
+        }
+        for account_id in account_ids:
+            self.session.reference_cache.set(
+                "users", f"{cloud_id}:{account_id}", found.get(account_id)
+            )
+        return found
+
+    async def enrich_users(self, value: Any) -> Any:
+        """Fill in missing display names of users and ADF mentions in place.
+
+        Every unnamed account id in ``value`` is resolved in one batch through
+        the user directory. Lookup failures leave ``value`` as it was.
+        """
+        refs = unnamed_user_refs(value)
+        if refs:
+            try:
+                users = await self.resolve_users(ref.account_id for ref in refs)
+            except AtlassianError as e:
+                logger.warning("Could not resolve user names: %s", e)
+                return value
+            apply_user_names(refs, users)
+        return value
+
+    async def field_catalogue(self, cloud_id: str) -> FieldCatalogue:
+        """Return the site's field catalogue, loaded once per ``fields`` TTL."""
+
+        async def load() -> List[Dict[str, Any]]:
+            url = f"{self.jira_base}/{cloud_id}/rest/api/3/field"
+            response = await self.make_request("GET", url)
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Could not load Jira fields: HTTP {response.status_code}",
+                    "FIELDS_FAILED",
+                    context={"status_code": response.status_code},
+                )
+            return compact_field_list(response.json())
+
+        fields = await self.cached_reference("fields", cloud_id, load)
+        built = self._catalogues.get(cloud_id)
+        if built is None or built[0] is not fields:
+            # Rebuild only when the cache handed out a fresh list
+            built = (fields, FieldCatalogue(fields))
+            self._catalogues[cloud_id] = built
+        return built[1]
+
+    async def resolve_fields(
+        self,
+        cloud_id: str,
+        fields: Optional[Sequence[str]] = None,
+        profile: str = "compact",
+    ) -> List[str]:
+        """Return Jira field ids for ``fields``, or for ``profile`` if none given.
+
+        Entries may be field ids (``summary``, ``customfield_10016``), Jira
+        selectors (``*all``, ``-description``), display names (``Story
+        Points``) or aliases (``story_points``); names are looked up in the
+        field catalogue.
+        """
+        if not fields:
+            if profile not in FIELD_PROFILES:
+                raise ValueError(
+                    f"Unknown field profile '{profile}'. "
+                    f"Use one of: {', '.join(FIELD_PROFILES)}"
+                )
+            return list(FIELD_PROFILES[profile])
+        if all(is_field_id(field) for field in fields):
+            return [field.strip() for field in fields]
+        catalogue = await self.field_catalogue(cloud_id)
+        return catalogue.resolve_many(fields)
+
+    async def _field_values(
+        self, cloud_id: str, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Re-key field values given by id or display name to field ids."""
+        if all(is_field_id(field) for field in values):
+            return dict(values)
+        return (await self.field_catalogue(cloud_id)).to_ids(values)
+
+    async def view_fields(
+        self, cloud_id: str, view: IssueView, profile: str = "compact"
+    ) -> List[str]:
+        """Field ids selected by ``view``, with ``profile`` as its default."""
+        return await self.resolve_fields(cloud_id, view.fields, view.profile or profile)
+
+    async def _field_namer(self, view: IssueView) -> Optional[FieldCatalogue]:
+        """Catalogue to re-key custom fields by name with, if wanted.
+
+        ``field_names=None`` names them when ``view.fields`` used any names.
+        """
+        fields, field_names = view.fields, view.field_names
+        if field_names is False:
+            return None
+        if field_names is None and all(is_field_id(f) for f in fields or []):
+            return None
+        catalogue = await self.field_catalogue(await self.get_cloud_id())
+        if field_names is None and not catalogue.uses_names(fields):
+            return None
+        return catalogue
+
+    async def present_issues(
+        self, issues: List[Dict[str, Any]], view: IssueView, shape: Tuple[str, str]
+    ) -> List[Dict[str, Any]]:
+        """Name users, and custom fields if ``view`` asks, then shape ``issues``.
+
+        ``shape`` is validated up front by :meth:`response_shape`.
+        """
+        namer = await self._field_namer(view)
+        await self.enrich_users(issues)
+        if namer is not None:
+            issues = [namer.name_fields(issue) for issue in issues]
+        return [self.shape_issue(issue, shape) for issue in issues]
@@ -0,0 +1,236 @@
+"""
+JQL search, counting and faceting for the Jira client.
+"""
+
+import asyncio
+from collections import Counter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from .base_client import AtlassianError
+from .jira_core import IssueView, JiraCore
+
+# Jira caps a page of /search/jql results at 100 when fields are requested
+SEARCH_PAGE_SIZE = 100
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def stream_concurrently(
+    batches: AsyncIterator[T], fetch: Callable[[T], Awaitable[R]], concurrency: int
+) -> AsyncIterator[R]:
+    """Yield ``fetch(batch)`` results as they complete, ``concurrency`` at a time.
+
+    Batches are pulled from ``batches`` only when a slot is free, so a slow
+    consumer or fetch holds back the producer instead of buffering.
+    """
+    pending: set = set()
+    try:
+        async for batch in batches:
+            pending.add(asyncio.ensure_future(fetch(batch)))
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        close = getattr(batches, "aclose", None)
+        if close is not None:
+            await close()
+
+
+def facet_labels(value: Any) -> List[str]:
+    """Readable grouping labels for a Jira field value (one per list item)."""
+    if value in (None, "", []):
+        return ["(none)"]
+    if isinstance(value, list):
+        return [label for item in value for label in facet_labels(item)]
+    if isinstance(value, dict):
+        for attr in ("displayName", "name", "value", "key", "id"):
+            if value.get(attr) is not None:
+                return [str(value[attr])]
+        return ["(unknown)"]
+    return [str(value)]
+
+
+class JiraSearchMixin(JiraCore):
+    """Paginated JQL search and aggregation."""
+
+    async def iter_jira_search(
+        self,
+        jql: str,
+        max_results: Optional[int] = None,
+        view: Optional[IssueView] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield issues matching ``jql`` across all result pages.
+
+        Pages are fetched from ``/search/jql`` with its ``nextPageToken`` cursor;
+        the next page is requested while the current one is being consumed.
+        ``max_results`` caps the total number of issues yielded (None for all).
+        ``view`` selects the returned fields and expand options (by default the
+        "compact" profile); its rendering options are not applied here.
+        """
+        view = view or IssueView()
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/search/jql"
+        remaining = max_results
+        body: Dict[str, Any] = {
+            "jql": jql,
+            "fields": await self.view_fields(cloud_id, view),
+        }
+        if view.expand:
+            body["expand"] = ",".join(view.expand)
+
+        async def fetch_page(token: Optional[str]) -> Dict[str, Any]:
+            data = dict(body, maxResults=page_size)
+            if remaining is not None:
+                data["maxResults"] = min(page_size, remaining)
+            if token:
+                data["nextPageToken"] = token
+            response = await self.make_request(
+                "POST", url, json=data, idempotent=True, budget="jira_search"
+            )
+            result = response.json() if response.content else {}
+            if not response.is_success:
+                raise AtlassianError(
+                    "; ".join(result.get("errorMessages", []))
+                    or f"Issue search failed: HTTP {response.status_code}",
+                    "JQL_SEARCH_FAILED",
+                    context={"jql": jql, "status_code": response.status_code},
+                    suggested_actions=["Check the JQL syntax and field names"],
+                )
+            return result
+
+        if remaining is not None and remaining <= 0:
+            return
+        pending: Optional[asyncio.Task] = asyncio.ensure_future(fetch_page(None))
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                issues = page.get("issues", [])
+                if remaining is not None:
+                    issues = issues[:remaining]
+                    remaining -= len(issues)
+
+                token = page.get("nextPageToken")
+                if (
+                    issues
+                    and token
+                    and not page.get("isLast")
+                    and (remaining is None or remaining > 0)
+                ):
+                    pending = asyncio.ensure_future(fetch_page(token))
+
+                for issue in issues:
+                    yield issue
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def jira_search(
+        self,
+        jql: str,
+        max_results: int = 50,
+        view: Optional[IssueView] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search Jira issues using JQL, following pagination up to max_results"""
+        view = view or IssueView()
+        shape = self.response_shape(view.body_format, view.compaction)
+        issues = [
+            issue async for issue in self.iter_jira_search(jql, max_results, view)
+        ]
+        return await self.present_issues(issues, view, shape)
+
+    async def jira_count(self, jql: str) -> int:
+        """Return Jira's approximate count of issues matching a bounded JQL query"""
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/search/approximate-count"
+        response = await self.make_request(
+            "POST", url, json={"jql": jql}, idempotent=True, budget="jira_search"
+        )
+        result = response.json() if response.content else {}
+        if not response.is_success:
+            raise AtlassianError(
+                "; ".join(result.get("errorMessages", []))
+                or f"Issue count failed: HTTP {response.status_code}",
+                "JQL_COUNT_FAILED",
+                context={"jql": jql, "status_code": response.status_code},
+                suggested_actions=[
+                    "Bound the JQL query, e.g. with a project or date restriction"
+                ],
+            )
+        return result["count"]
+
+    async def jira_facets(
+        self,
+        jql: str,
+        group_by: Sequence[str],
+        max_issues: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Count issues matching ``jql`` grouped by each field in ``group_by``.
+
+        Pages through the results requesting only the grouped fields and keeps
+        nothing but the running counts, so memory does not grow with the
+        number of issues. ``max_issues`` bounds how many issues are scanned.
+        """
+        cloud_id = await self.get_cloud_id()
+        field_ids = await self.resolve_fields(cloud_id, group_by)
+        counters: Dict[str, Counter] = {name: Counter() for name in group_by}
+        scanned = 0
+        async for issue in self.iter_jira_search(
+            jql, max_results=max_issues, view=IssueView(fields=field_ids)
+        ):
+            scanned += 1
+            values = issue.get("fields") or {}
+            for name, field_id in zip(group_by, field_ids):
+                counters[name].update(facet_labels(values.get(field_id)))
+
+        return {
+            "issues_scanned": scanned,
+            "truncated": max_issues is not None and scanned >= max_issues,
+            "facets": {
+                name: dict(counter.most_common()) for name, counter in counters.items()
+            },
+        }
+
+    async def _search_batches(
+        self,
+        jql: str,
+        fields: Sequence[str],
+        size: int,
+        max_issues: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Issues matching ``jql`` in lists of up to ``size``."""
+        batch: List[Dict[str, Any]] = []
+        async for issue in self.iter_jira_search(
+            jql, max_results=max_issues, view=IssueView(fields=list(fields))
+        ):
+            batch.append(issue)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -0,0 +1,224 @@
+"""
+Incremental mirroring of JQL result sets into the local issue store.
+"""
+
+import asyncio
+import math
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..storage import IssueStore
+from ..storage.issue_store import normalize_jql
+from .adf import adf_to_text
+from .jira_client import JiraClient
+from .jira_core import FIELD_PROFILES, IssueView
+
+# Fields kept for every mirrored issue
+SYNC_FIELDS = FIELD_PROFILES["standard"] + ["comment"]
+# Re-read this many seconds before the watermark to absorb clock skew and
+# Jira's search index lag
+SYNC_OVERLAP_SECONDS = 120
+SYNC_BATCH_SIZE = 100
+# Jira allows 5000 results per page when only ids are requested
+RECONCILE_PAGE_SIZE = 5000
+
+ORDER_BY_PATTERN = re.compile(r"(?:^|(?<=\s))order\s+by\s+", re.IGNORECASE)
+
+
+def split_order_by(jql: str) -> Tuple[str, str]:
+    """Split ``jql`` into its condition and ORDER BY fields ("" if none).
+
+    Only an ORDER BY outside quoted strings and parentheses counts, so text
+    such as ``summary ~ "sort order by date"`` stays in the condition.
+    """
+    quote = ""
+    depth = 0
+    i = 0
+    while i < len(jql):
+        char = jql[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = ""
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            match = ORDER_BY_PATTERN.match(jql, i)
+            if match:
+                return jql[:i].strip(), jql[match.end() :].strip()
+        i += 1
+    return jql.strip(), ""
+
+
+def updated_since(jql: str, minutes: int) -> str:
+    """Restrict ``jql`` to issues updated in the last ``minutes`` minutes."""
+    where, order_fields = split_order_by(jql)
+    order = f" ORDER BY {order_fields}" if order_fields else ""
+    clause = f'updated >= "-{minutes}m"'
+    return f"({where}) AND {clause}{order}" if where else f"{clause}{order}"
+
+
+def search_text(issue: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Plain (summary, description, comments) text of an issue for indexing."""
+    fields = issue.get("fields") or {}
+    comments = (fields.get("comment") or {}).get("comments") or []
+    return (
+        fields.get("summary") or "",
+        adf_to_text(fields.get("description")),
+        "\n".join(adf_to_text(comment.get("body")) for comment in comments),
+    )
+
+
+class JiraSync:
+    """Mirror JQL result sets into an :class:`IssueStore` and serve them locally.
+
+    The first sync of a query backfills every matching issue. Later syncs only
+    fetch issues updated since the last watermark (relative JQL, so no
+    timezone conversion is needed). Issues deleted in Jira or no longer
+    matching the query are removed by a periodic reconcile that lists the
+    current matching ids.
+    """
+
+    def __init__(self, client: JiraClient, store: Optional[IssueStore] = None):
+        self.client = client
+        path = client.config.issue_store_path
+        # Opened on first use
+        self.store = store or IssueStore(
+            client.config.site_url.rstrip("/"), Path(path) if path else None
+        )
+        self.reconcile_seconds = client.config.sync_reconcile_seconds
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def sync(self, jql: str, full: bool = False) -> Dict[str, Any]:
+        """Bring the local mirror of ``jql`` up to date. Returns sync stats."""
+        lock = self._locks.setdefault(normalize_jql(jql), asyncio.Lock())
+        async with lock:
+            return await self._sync(jql, full)
+
+    async def _sync(self, jql: str, full: bool) -> Dict[str, Any]:
+        started = time.time()
+        state = await asyncio.to_thread(self.store.sync_state, jql)
+        backfill = full or state is None
+        last_reconcile = 0.0
+        search_jql = jql
+        if state is not None and not backfill:
+            last_reconcile = state["last_reconcile"]
+            minutes = math.ceil(
+                (started - state["last_sync"] + SYNC_OVERLAP_SECONDS) / 60
+            )
+            search_jql = updated_since(jql, minutes)
+
+        reconcile = backfill or started - last_reconcile >= self.reconcile_seconds
+        seen: Set[str] = set()
+        if reconcile and not backfill:
+            # List the current members before writing anything, so a failed
+            # listing leaves the mirror as it was
+            seen = {
+                issue["key"]
+                async for issue in self.client.iter_jira_search(
+                    jql, view=IssueView(fields=["id"]), page_size=RECONCILE_PAGE_SIZE
+                )
+            }
+
+        fetched = 0
+        batch: List[Dict[str, Any]] = []
+        async for issue in self.client.iter_jira_search(
+            search_jql, view=IssueView(fields=SYNC_FIELDS)
+        ):
+            batch.append(issue)
+            # Issues created since the listing match the query too
+            seen.add(issue["key"])
+            if len(batch) >= SYNC_BATCH_SIZE:
+                fetched += await self._store_batch(jql, batch)
+                batch = []
+        if batch:
+            fetched += await self._store_batch(jql, batch)
+
+        # Only reached once every page was fetched; search errors propagate
+        # before any member is removed or the watermark moves
+        removed = 0
+        if reconcile:
+            removed = await asyncio.to_thread(self.store.reconcile, jql, seen)
+
+        await asyncio.to_thread(
+            self.store.mark_synced, jql, started, started if reconcile else None
+        )
+        state = await asyncio.to_thread(self.store.sync_state, jql)
+        return {
+            "jql": jql,
+            "mode": "backfill" if backfill else "incremental",
+            "fetched": fetched,
+            "removed": removed,
+            "reconciled": reconcile,
+            "issue_count": state["issue_count"] if state else 0,
+            "duration_seconds": round(time.time() - started, 3),
+        }
+
+    async def _store_batch(self, jql: str, batch: List[Dict[str, Any]]) -> int:
+        # Name mentions and users before indexing, so they are searchable
+        await self.client.enrich_users(batch)
+        texts = {issue["key"]: search_text(issue) for issue in batch}
+        return await asyncio.to_thread(self.store.upsert, jql, batch, texts)
+
+    async def search(
+        self, text: str, limit: int = 20, jql: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over mirrored issues, best BM25 matches first.
+
+        With ``jql``, the query is synced first (incrementally when it was
+        synced before) and results are limited to its issues.
+        """
+        if jql is not None:
+            await self.sync(jql)
+        results = await asyncio.to_thread(self.store.search, text, limit, jql)
+        compact = []
+        for result in results:
+            fields = result["issue"].get("fields") or {}
+            compact.append(
+                {
+                    "key": result["key"],
+                    "summary": fields.get("summary"),
+                    "status": (fields.get("status") or {}).get("name"),
+                    "updated": fields.get("updated"),
+                    "score": result["score"],
+                    "snippet": result["snippet"],
+                }
+            )
+        return compact
+
+    async def query(
+        self,
+        jql: str,
+        max_results: Optional[int] = 50,
+        max_age: Optional[float] = None,
+        body_format: str = "adf",
+        compaction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Answer ``jql`` from the local mirror, syncing first if needed.
+
+        A query never synced before is backfilled. If the last sync is older
+        than ``max_age`` seconds an incremental sync runs first. Issues are
+        stored raw and shaped on the way out.
+        """
+        shape = self.client.response_shape(body_format, compaction)
+        state = await asyncio.to_thread(self.store.sync_state, jql)
+        if state is None or (
+            max_age is not None and time.time() - state["last_sync"] > max_age
+        ):
+            await self.sync(jql)
+            state = await asyncio.to_thread(self.store.sync_state, jql)
+
+        issues = await asyncio.to_thread(self.store.query, jql, max_results)
+        return {
+            "issues": [self.client.shape_issue(issue, shape) for issue in issues],
+            "total": state["issue_count"] if state else len(issues),
+            "synced_at": state["last_sync"] if state else None,
+            "source": "local",
+        }
@@ -0,0 +1,299 @@
+"""
+Issue creation, updates and comments for the Jira client.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from .adf import markdown_to_adf
+from .base_client import AtlassianError
+from .createmeta import CreateMetaIndex, compact_fields, compact_issue_types
+from .jira_core import JiraCore
+
+# /issue/bulk accepts up to 50 issues per request
+BULK_CREATE_SIZE = 50
+BULK_CREATE_CONCURRENCY = 4
+CREATEMETA_PAGE_SIZE = 200
+
+
+class NewIssue(BaseModel):
+    """An issue to create; ``description`` is Markdown.
+
+    ``fields`` holds extra field values keyed by field id or display name.
+    """
+
+    project_key: str
+    summary: str
+    description: str = ""
+    issue_type: str = "Task"
+    fields: Optional[Dict[str, Any]] = None
+
+
+class JiraWriteMixin(JiraCore):
+    """Issue writes, validated against the cached create metadata."""
+
+    async def _get_createmeta_pages(self, url: str, item_key: str) -> List[Any]:
+        """Collect every item of a paginated createmeta listing."""
+        items: List[Any] = []
+        while True:
+            response = await self.make_request(
+                "GET",
+                url,
+                params={"startAt": len(items), "maxResults": CREATEMETA_PAGE_SIZE},
+            )
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Could not load create metadata: HTTP {response.status_code}",
+                    "CREATEMETA_FAILED",
+                    context={"url": url, "status_code": response.status_code},
+                    suggested_actions=[
+                        "Check the project key and your Create issues permission"
+                    ],
+                )
+            page = response.json()
+            items.extend(page.get(item_key, []))
+            if not page.get(item_key) or len(items) >= page.get("total", 0):
+                return items
+
+    async def get_create_meta(self, cloud_id: str, project_key: str) -> CreateMetaIndex:
+        """Return the project's issue-type index, cached per project."""
+
+        async def load() -> Dict[str, Any]:
+            url = (
+                f"{self.jira_base}/{cloud_id}/rest/api/3/issue/createmeta/"
+                f"{project_key}/issuetypes"
+            )
+            return compact_issue_types(
+                await self._get_createmeta_pages(url, "issueTypes")
+            )
+
+        issue_types = await self.cached_reference(
+            "createmeta", f"{cloud_id}:{project_key}", load
+        )
+        return CreateMetaIndex(project_key, issue_types)
+
+    async def _get_create_fields(
+        self, cloud_id: str, project_key: str, issue_type_id: str
+    ) -> Dict[str, Any]:
+        """Return create-screen field metadata for one issue type, cached."""
+
+        async def load() -> Dict[str, Any]:
+            url = (
+                f"{self.jira_base}/{cloud_id}/rest/api/3/issue/createmeta/"
+                f"{project_key}/issuetypes/{issue_type_id}"
+            )
+            return compact_fields(await self._get_createmeta_pages(url, "fields"))
+
+        return await self.cached_reference(
+            "createmeta_fields", f"{cloud_id}:{project_key}:{issue_type_id}", load
+        )
+
+    async def _prepare_new_issue(
+        self, cloud_id: str, issue: NewIssue
+    ) -> Dict[str, Any]:
+        """Build and locally validate the ``fields`` of a create-issue payload."""
+        meta = await self.get_create_meta(cloud_id, issue.project_key)
+        resolved_type = meta.issue_type(issue.issue_type)
+        field_meta = await self._get_create_fields(
+            cloud_id, issue.project_key, resolved_type["id"]
+        )
+        extra_fields = {}
+        if issue.fields:
+            extra_fields = await self._field_values(cloud_id, issue.fields)
+        fields = {
+            **extra_fields,
+            **self._new_issue_fields(issue, resolved_type["id"]),
+        }
+        problems = meta.validate(resolved_type, field_meta, fields)
+        if problems:
+            raise ValueError(
+                f"Invalid {resolved_type['name']} for project {issue.project_key}: "
+                + "; ".join(problems)
+            )
+        return fields
+
+    @staticmethod
+    def _new_issue_fields(issue: NewIssue, issue_type_id: str) -> Dict[str, Any]:
+        """Build the ``fields`` object of a create-issue payload.
+
+        ``description`` is Markdown and is converted to ADF.
+        """
+        return {
+            "project": {"key": issue.project_key},
+            "summary": issue.summary,
+            "description": markdown_to_adf(issue.description),
+            "issuetype": {"id": issue_type_id},
+        }
+
+    async def jira_create_issue(self, issue: NewIssue) -> Dict[str, Any]:
+        """Create a new Jira issue.
+
+        The issue type and any extra ``fields`` are checked against the cached
+        create metadata, so invalid payloads fail before reaching Jira.
+        """
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/issue"
+        data = {"fields": await self._prepare_new_issue(cloud_id, issue)}
+
+        response = await self.make_request("POST", url, json=data)
+        return response.json()
+
+    async def _prepare_new_issues(
+        self, cloud_id: str, issues: Sequence[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], str]]:
+        """Bulk-create entries for ``issues``, or an error message per item.
+
+        Create metadata is loaded once per project, concurrently.
+        """
+        projects = list(dict.fromkeys(item.get("project_key") for item in issues))
+        project_errors: Dict[Any, str] = {}
+
+        async def load_project(project_key: Any) -> None:
+            try:
+                if not project_key:
+                    raise ValueError("project_key is required")
+                await self.get_create_meta(cloud_id, project_key)
+            except (AtlassianError, ValueError) as e:
+                project_errors[project_key] = str(e)
+
+        await asyncio.gather(*(load_project(key) for key in projects))
+
+        prepared: List[Union[Dict[str, Any], str]] = []
+        for item in issues:
+            try:
+                if item.get("project_key") in project_errors:
+                    raise ValueError(project_errors[item.get("project_key")])
+                if not item.get("summary"):
+                    raise ValueError("summary is required")
+                new_issue = NewIssue(
+                    project_key=item["project_key"],
+                    summary=item["summary"],
+                    description=item.get("description") or "",
+                    issue_type=item.get("issue_type") or "Task",
+                    fields=item.get("fields"),
+                )
+                fields = await self._prepare_new_issue(cloud_id, new_issue)
+            except (AtlassianError, ValueError) as e:
+                prepared.append(str(e))
+                continue
+            prepared.append({"fields": fields})
+        return prepared
+
+    async def jira_create_issues(
+        self, issues: Sequence[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Create many Jira issues through the bulk-create endpoint.
+
+        Each item takes ``project_key``, ``summary`` and optional ``description``,
+        ``issue_type`` (default "Task") and ``fields``. Items are validated against
+        the cached create metadata, which is loaded once per project, and sent in
+        concurrent batches of up to 50. Returns one
+        result per item, in input order, with ``success`` and either the new
+        ``key``/``id`` or an ``error``.
+        """
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/issue/bulk"
+        results: List[Dict[str, Any]] = [
+            {"index": i, "success": False} for i in range(len(issues))
+        ]
+
+        pending = []
+        for i, update in enumerate(await self._prepare_new_issues(cloud_id, issues)):
+            if isinstance(update, str):
+                results[i]["error"] = update
+            else:
+                pending.append((i, update))
+
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+
+        async def create_batch(batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+            data = {"issueUpdates": [update for _, update in batch]}
+            async with semaphore:
+                try:
+                    response = await self.make_request(
+                        "POST", url, json=data, budget="jira_create_issues"
+                    )
+                except AtlassianError as e:
+                    for i, _ in batch:
+                        results[i]["error"] = str(e)
+                    return
+            body = response.json() if response.content else {}
+            if response.status_code not in (201, 400) or not isinstance(body, dict):
+                for i, _ in batch:
+                    results[i]["error"] = f"HTTP {response.status_code}"
+                return
+
+            failed = {}
+            for error in body.get("errors", []):
+                element = error.get("elementErrors") or {}
+                messages = list(element.get("errorMessages", []))
+                messages += [f"{k}: {v}" for k, v in element.get("errors", {}).items()]
+                failed[error.get("failedElementNumber")] = "; ".join(messages) or (
+                    f"HTTP {error.get('status')}"
+                )
+            created = iter(body.get("issues", []))
+            for position, (i, _) in enumerate(batch):
+                if position in failed:
+                    results[i]["error"] = failed[position]
+                    continue
+                issue = next(created, None)
+                if issue is None:
+                    results[i]["error"] = "Issue was not created"
+                else:
+                    results[i].update(success=True, key=issue["key"], id=issue["id"])
+
+        await asyncio.gather(
+            *(
+                create_batch(pending[i : i + BULK_CREATE_SIZE])
+                for i in range(0, len(pending), BULK_CREATE_SIZE)
+            )
+        )
+        return results
+
+    async def jira_update_issue(
+        self,
+        issue_key: str,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Update a Jira issue.
+
+        ``description`` is Markdown. ``fields`` sets other fields by id or
+        display name (``{"Story Points": 5}``).
+        """
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/issue/{issue_key}"
+
+        updates: Dict[str, Any] = {}
+        if fields:
+            updates.update(await self._field_values(cloud_id, fields))
+        if summary:
+            updates["summary"] = summary
+        if description:
+            updates["description"] = markdown_to_adf(description)
+
+        response = await self.make_request("PUT", url, json={"fields": updates})
+        if not response.is_success:
+            result = response.json() if response.content else {}
+            messages = list(result.get("errorMessages", []))
+            messages += [f"{k}: {v}" for k, v in (result.get("errors") or {}).items()]
+            raise AtlassianError(
+                "; ".join(messages)
+                or f"Issue update failed: HTTP {response.status_code}",
+                "ISSUE_UPDATE_FAILED",
+                context={"issue_key": issue_key, "status_code": response.status_code},
+            )
+        return {"success": True, "issue_key": issue_key}
+
+    async def jira_add_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
+        """Add a comment to a Jira issue. ``comment`` is Markdown."""
+        cloud_id = await self.get_cloud_id()
+        url = f"{self.jira_base}/{cloud_id}/rest/api/3/issue/{issue_key}/comment"
+
+        data = {"body": markdown_to_adf(comment)}
+
+        response = await self.make_request("POST", url, json=data)
+        return response.json()
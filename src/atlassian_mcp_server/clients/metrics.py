@@ -0,0 +1,33 @@
+"""
+Lightweight counters describing HTTP client behaviour.
+"""
+
+from collections import defaultdict
+from typing import Dict
+
+
+class ClientMetrics:
+    """Named counters shared by all clients on a session."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, float] = defaultdict(float)
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        """Add ``value`` to the counter called ``name``."""
+        self._counters[name] += value
+
+    def set(self, name: str, value: float) -> None:
+        """Set a gauge-style counter to ``value``."""
+        self._counters[name] = value
+
+    def get(self, name: str) -> float:
+        """Return the current value of a counter (0 if never incremented)."""
+        return self._counters.get(name, 0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return a copy of all counters, rounded for display."""
+        return {name: round(value, 3) for name, value in sorted(self._counters.items())}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self._counters.clear()
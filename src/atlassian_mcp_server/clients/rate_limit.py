@@ -0,0 +1,175 @@
+"""
+Retry and client-side rate limiting for Atlassian Cloud requests.
+
+Atlassian signals throttling with 429/503 responses carrying ``Retry-After``
+and ``X-RateLimit-*`` headers. ``RetryPolicy`` decides whether and how long to
+wait before retrying, and ``TokenBucket`` paces requests per host so we slow
+down before the server starts rejecting them.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, NamedTuple, Optional
+
+from pydantic import BaseModel
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an HTTP-date or ISO 8601 timestamp."""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the server-requested wait from ``Retry-After``/``X-RateLimit-Reset``."""
+    for name in ("Retry-After", "X-RateLimit-Reset"):
+        value = headers.get(name)
+        if not value:
+            continue
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        reset_at = _parse_timestamp(value)
+        if reset_at is not None:
+            return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    return None
+
+
+class RetryRequest(NamedTuple):
+    """What a retry decision needs to know about the request being sent."""
+
+    method: str
+    idempotent: Optional[bool] = None
+    # time.monotonic() by which any retry must have been sent
+    deadline: Optional[float] = None
+
+
+class RetryPolicy(BaseModel):
+    """Retry rules for throttled and transiently unavailable responses."""
+
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 60.0
+
+    def should_retry(
+        self, method: str, status_code: int, attempt: int, idempotent: Optional[bool]
+    ) -> bool:
+        """Whether a response with ``status_code`` should be retried.
+
+        429 responses were rejected before processing, so they are retried for any
+        method; other transient failures only for idempotent requests.
+        """
+        if attempt >= self.max_retries or status_code not in RETRYABLE_STATUS_CODES:
+            return False
+        if status_code == 429:
+            return True
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent
+
+    def retry_delay(
+        self,
+        request: RetryRequest,
+        status_code: int,
+        headers: Mapping[str, str],
+        attempt: int,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a response, or None to give up.
+
+        Gives up when :meth:`should_retry` says so, when the server asks for a
+        longer wait than ``max_retry_after``, or when the wait would overrun
+        the request's deadline.
+        """
+        if not self.should_retry(
+            request.method, status_code, attempt, request.idempotent
+        ):
+            return None
+        delay = self.delay(headers, attempt)
+        if delay > self.max_retry_after:
+            return None
+        if request.deadline is not None and time.monotonic() + delay > request.deadline:
+            return None
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def delay(self, headers: Mapping[str, str], attempt: int) -> float:
+        """Seconds to wait before the next attempt, honouring server hints."""
+        hinted = retry_after_seconds(headers)
+        if hinted is None:
+            return self.backoff(attempt)
+        # Small jitter so throttled callers do not all retry in the same instant
+        return hinted + random.uniform(0, self.backoff_base)
+
+
+class TokenBucket:
+    """Per-host token bucket that paces outgoing requests."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.paused_until:
+                delay = self.paused_until - now
+            elif self.tokens >= 1:
+                self.tokens -= 1
+                return waited
+            else:
+                delay = (1 - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` (e.g. after a 429)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Slow down when rate-limit headers show we are close to the limit."""
+        near_limit = headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+        remaining: Optional[float]
+        limit: Optional[float]
+        try:
+            remaining = float(headers["X-RateLimit-Remaining"])
+            limit = float(headers.get("X-RateLimit-Limit", 0))
+        except (KeyError, ValueError):
+            remaining = limit = None
+
+        if remaining is not None and remaining <= 0:
+            wait = retry_after_seconds(headers)
+            if wait:
+                self.pause(wait)
+        if near_limit or (remaining is not None and limit and remaining < limit * 0.1):
+            # Drop the accumulated burst so requests proceed at the refill rate
+            self.tokens = min(self.tokens, 0.0)
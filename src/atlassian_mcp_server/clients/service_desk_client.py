@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-from .base_client import BaseAtlassianClient
+from .base_client import AtlassianError, BaseAtlassianClient
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,8 @@ logger = logging.getLogger(__name__)
 class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public-methods
     """Service Desk-specific client for service management operations."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, session=None):
+        super().__init__(config, session)
         self.jira_base = "https://api.atlassian.com/ex/jira"
         self.load_credentials()  # Load saved credentials
 
@@ -66,9 +66,23 @@ class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public
         else:
             url = f"{self.jira_base}/{cloud_id}/rest/servicedeskapi/requesttype"
 
-        params = {"limit": limit}
-        response = await self.make_request("GET", url, params=params)
-        return response.json().get("values", [])
+        async def load() -> List[Dict[str, Any]]:
+            params = {"limit": limit}
+            response = await self.make_request("GET", url, params=params)
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Request type lookup failed: HTTP {response.status_code}",
+                    "REQUEST_TYPES_FAILED",
+                    context={
+                        "service_desk_id": service_desk_id,
+                        "status_code": response.status_code,
+                    },
+                )
+            return response.json().get("values", [])
+
+        return await self.cached_reference(
+            "request_types", f"{service_desk_id or '*'}:{limit}", load
+        )
 
     async def servicedesk_get_request_type(
         self, service_desk_id: str, request_type_id: str
@@ -93,8 +107,23 @@ class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public
             f"servicedesk/{service_desk_id}/requesttype/{request_type_id}/field"
         )
 
-        response = await self.make_request("GET", url)
-        return response.json().get("requestTypeFields", [])
+        async def load() -> List[Dict[str, Any]]:
+            response = await self.make_request("GET", url)
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Request type field lookup failed: HTTP {response.status_code}",
+                    "REQUEST_TYPE_FIELDS_FAILED",
+                    context={
+                        "service_desk_id": service_desk_id,
+                        "request_type_id": request_type_id,
+                        "status_code": response.status_code,
+                    },
+                )
+            return response.json().get("requestTypeFields", [])
+
+        return await self.cached_reference(
+            "request_type_fields", f"{service_desk_id}:{request_type_id}", load
+        )
 
     async def servicedesk_get_request_comments(
         self, issue_key: str, limit: int = 50
@@ -150,7 +179,7 @@ class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public
         cloud_id = await self.get_cloud_id()
         url = f"{self.jira_base}/{cloud_id}/rest/servicedeskapi/request/{issue_key}"
 
-        response = await self.make_request("GET", url)
+        response = await self.make_request("GET", url, budget="servicedesk_get_request")
         return response.json()
 
     async def servicedesk_create_request(
@@ -374,7 +403,7 @@ class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public
             "resultsPerPage": limit,
         }
 
-        response = await self.make_request("POST", url, json=data)
+        response = await self.make_request("POST", url, json=data, idempotent=True)
         return response.json().get("objectEntries", [])
 
     async def assets_create_object(
@@ -421,5 +450,17 @@ class ServiceDeskClient(BaseAtlassianClient):  # pylint: disable=too-many-public
             f"assets/workspace/{workspace_id}/v1/objecttype/list"
         )
 
-        response = await self.make_request("GET", url)
-        return response.json().get("values", [])
+        async def load() -> List[Dict[str, Any]]:
+            response = await self.make_request("GET", url)
+            if not response.is_success:
+                raise AtlassianError(
+                    f"Assets object type lookup failed: HTTP {response.status_code}",
+                    "OBJECT_TYPES_FAILED",
+                    context={
+                        "workspace_id": workspace_id,
+                        "status_code": response.status_code,
+                    },
+                )
+            return response.json().get("values", [])
+
+        return await self.cached_reference("object_types", workspace_id, load)
@@ -0,0 +1,188 @@
+"""
+Shared session state for Atlassian product clients.
+
+A single session owns the pooled HTTP transport, the OAuth credentials and the
+cloud ID cache so that Jira, Confluence and Service Desk clients reuse warm
+connections and observe each other's token refreshes.
+"""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+import httpx
+
+from ..storage import PersistentCache
+from .cache import ReferenceCache, ValidatorCache
+from .concurrency import AdaptiveLimiter, traffic_class
+from .metrics import ClientMetrics
+from .rate_limit import RetryPolicy, TokenBucket
+
+if TYPE_CHECKING:
+    from .base_client import AtlassianConfig, CloudResource
+
+logger = logging.getLogger(__name__)
+
+CREDENTIALS_FILE = Path.home() / ".atlassian_mcp_credentials.json"
+
+
+def http2_available() -> bool:
+    """Check whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        logger.warning(
+            "HTTP/2 requested but the 'h2' package is not installed; "
+            "falling back to HTTP/1.1 (pip install 'atlassian-mcp-server[http2]')"
+        )
+        return False
+    return True
+
+
+class CredentialStore:
+    """OAuth tokens on disk and the cloud sites they grant access to."""
+
+    def __init__(self, config: "AtlassianConfig", path: Path):
+        self.config = config
+        self.path = path
+        # Cloud resources the token can access, keyed by site URL
+        self.cloud_resources: Dict[str, "CloudResource"] = {}
+        # Single-flight token refresh shared by every client on this session
+        self.refresh_task: Optional["asyncio.Future[bool]"] = None
+        self.refresh_failed_at = 0.0
+        self._loaded = False
+
+    def save(self) -> None:
+        """Save credentials to file"""
+        credentials = {
+            "site_url": self.config.site_url,
+            "client_id": self.config.client_id,
+            "client_secret": self.config.client_secret,
+            "access_token": self.config.access_token,
+            "refresh_token": self.config.refresh_token,
+            "expires_at": self.config.token_expires_at,
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(credentials, f, indent=2)
+        self._loaded = True
+
+    def load(self, force: bool = False) -> bool:
+        """Load saved credentials once per session unless ``force`` is set."""
+        if self._loaded and not force:
+            return bool(self.config.access_token)
+
+        if not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                credentials = json.load(f)
+                self.config.access_token = credentials.get("access_token")
+                self.config.refresh_token = credentials.get("refresh_token")
+                self.config.token_expires_at = credentials.get("expires_at")
+        except (json.JSONDecodeError, KeyError):
+            return False
+
+        self._loaded = True
+        logger.debug("Loaded credentials from %s", self.path)
+        return bool(self.config.access_token)
+
+
+class TrafficControl:
+    """Retry policy, per-host pacing and per-class concurrency limits."""
+
+    def __init__(self, config: "AtlassianConfig"):
+        self.config = config
+        self.retry_policy = RetryPolicy(max_retries=config.max_retries)
+        self.rate_limiters: Dict[str, TokenBucket] = {}
+        self.concurrency_limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def rate_limiter(self, host: str) -> Optional[TokenBucket]:
+        """Return the token bucket for ``host`` (None when pacing is disabled)."""
+        if self.config.rate_limit_per_second <= 0:
+            return None
+        bucket = self.rate_limiters.get(host)
+        if bucket is None:
+            bucket = TokenBucket(
+                self.config.rate_limit_per_second, self.config.rate_limit_burst
+            )
+            self.rate_limiters[host] = bucket
+        return bucket
+
+    def concurrency_limiter(self, url: str) -> Optional[AdaptiveLimiter]:
+        """Return the adaptive limiter for the traffic class of ``url``."""
+        if self.config.concurrency_max <= 0:
+            return None
+        name = traffic_class(url)
+        limiter = self.concurrency_limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveLimiter(
+                name,
+                initial=self.config.concurrency_initial,
+                max_limit=self.config.concurrency_max,
+            )
+            self.concurrency_limiters[name] = limiter
+        return limiter
+
+
+class AtlassianSession:
+    """Pooled transport, tokens and cloud ID shared by all product clients."""
+
+    def __init__(
+        self,
+        config: "AtlassianConfig",
+        *,
+        credentials_file: Optional[Path] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config
+        self.credentials = CredentialStore(config, credentials_file or CREDENTIALS_FILE)
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=config.connect_timeout,
+                read=config.read_timeout,
+                write=config.write_timeout,
+                pool=config.pool_timeout,
+            ),
+            # HTTP/1.1 stays enabled so servers without h2 ALPN still work
+            http2=config.http2 and http2_available(),
+            transport=transport,
+        )
+        self.traffic = TrafficControl(config)
+        self.metrics = ClientMetrics()
+        self.validator_cache = (
+            ValidatorCache(config.http_cache_bytes) if config.http_cache_bytes else None
+        )
+        self.reference_cache = ReferenceCache(
+            config.reference_cache_bytes,
+            ttls=config.reference_cache_ttls,
+            metrics=self.metrics,
+            backing=(
+                PersistentCache(
+                    config.site_url.rstrip("/"),
+                    (
+                        Path(config.persistent_cache_path)
+                        if config.persistent_cache_path
+                        else None
+                    ),
+                )
+                if config.persistent_cache
+                else None
+            ),
+        )
+
+    @property
+    def persistent_cache(self) -> Optional[PersistentCache]:
+        """On-disk store behind the reference cache, if warm starts are enabled."""
+        return self.reference_cache.backing
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP transport."""
+        await self.http.aclose()
@@ -0,0 +1,76 @@
+"""
+Helpers for the Jira user directory: compact user records and the places in a
+response where a user is referenced without a display name.
+"""
+
+from typing import Any, Dict, List, NamedTuple
+
+# Mention ids that address groups of people rather than an account
+GROUP_MENTIONS = {"all", "here"}
+
+
+class UserRef(NamedTuple):
+    """A user object or ADF mention whose display name is missing."""
+
+    target: Dict[str, Any]
+    account_id: str
+    mention: bool
+
+
+def compact_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Jira user to the fields worth caching and returning."""
+    compact = {
+        "accountId": user["accountId"],
+        "displayName": user.get("displayName"),
+        "active": user.get("active", True),
+    }
+    if user.get("emailAddress"):
+        compact["emailAddress"] = user["emailAddress"]
+    return compact
+
+
+def unnamed_user_refs(value: Any) -> List[UserRef]:
+    """Find user objects and ADF mentions in ``value`` that lack a name.
+
+    Walks the whole structure, ADF documents included, with an explicit stack.
+    """
+    refs: List[UserRef] = []
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        account_id = node.get("accountId")
+        if isinstance(account_id, str) and not node.get("displayName"):
+            refs.append(UserRef(node, account_id, False))
+        if node.get("type") == "mention":
+            attrs = node.get("attrs") or {}
+            mention_id = attrs.get("id")
+            if (
+                isinstance(mention_id, str)
+                and mention_id not in GROUP_MENTIONS
+                and not attrs.get("text")
+            ):
+                refs.append(UserRef(attrs, mention_id, True))
+        stack.extend(
+            child for child in node.values() if isinstance(child, (dict, list))
+        )
+    return refs
+
+
+def apply_user_names(refs: List[UserRef], users: Dict[str, Dict[str, Any]]) -> int:
+    """Fill in display names from resolved ``users``. Returns how many."""
+    filled = 0
+    for ref in refs:
+        user = users.get(ref.account_id)
+        if not user or not user.get("displayName"):
+            continue
+        if ref.mention:
+            ref.target["text"] = f"@{user['displayName']}"
+        else:
+            ref.target["displayName"] = user["displayName"]
+        filled += 1
+    return filled
@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 from mcp.server import Server
 
+from .clients import AtlassianSession
 from .modules import ConfluenceModule, JiraModule, ServiceDeskModule
 from .modules.base import BaseModule
 
@@ -12,9 +13,14 @@ from .modules.base import BaseModule
 class ModuleManager:
     """Manages which modules are enabled and registers their tools/resources."""
 
-    def __init__(self, config):
-        """Initialize the module manager."""
+    def __init__(self, config, session=None):
+        """Initialize the module manager.
+
+        All modules share one session so their clients reuse the same connection
+        pool, credentials and cloud ID.
+        """
         self.config = config
+        self.session = session or AtlassianSession(config)
         self.available_modules = {
             "jira": JiraModule,
             "confluence": ConfluenceModule,
@@ -48,7 +54,7 @@ class ModuleManager:
         # Initialize enabled modules
         for name in enabled_names:
             module_class = self.available_modules[name]
-            self.enabled_modules[name] = module_class(self.config)
+            self.enabled_modules[name] = module_class(self.config, self.session)
 
     def get_enabled_modules(self) -> Dict[str, BaseModule]:
         """Get all enabled modules."""
@@ -92,6 +98,8 @@ class ModuleManager:
             status[name] = {
                 "enabled": is_enabled,
                 "available": is_available,
-                "required_scopes": module_class(self.config).required_scopes,
+                "required_scopes": module_class(
+                    self.config, self.session
+                ).required_scopes,
             }
         return status
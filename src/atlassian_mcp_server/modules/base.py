@@ -9,9 +9,10 @@ from mcp.server import Server
 class BaseModule(ABC):
     """Base class for all Atlassian MCP modules."""
 
-    def __init__(self, config):
-        """Initialize the module with Atlassian config."""
+    def __init__(self, config, session=None):
+        """Initialize the module with Atlassian config and shared session."""
         self.config = config
+        self.session = session
         self.client = None  # Will be set by subclasses
 
     @property
@@ -11,9 +11,9 @@ from .base import BaseModule
 class ConfluenceModule(BaseModule):
     """Module for Confluence functionality."""
 
-    def __init__(self, config):
-        super().__init__(config)
-        self.client = ConfluenceClient(config)
+    def __init__(self, config, session=None):
+        super().__init__(config, session)
+        self.client = ConfluenceClient(config, session)
 
     @property
     def name(self) -> str:
@@ -4,16 +4,17 @@ from typing import Any, Dict, List, Optional
 
 from mcp.server import Server
 
-from ..clients import JiraClient
+from ..clients import IssueView, JiraClient, JiraSync, NewIssue, Traversal
 from .base import BaseModule
 
 
 class JiraModule(BaseModule):
     """Module for core Jira functionality."""
 
-    def __init__(self, config):
-        super().__init__(config)
-        self.client = JiraClient(config)
+    def __init__(self, config, session=None):
+        super().__init__(config, session)
+        self.client = JiraClient(config, session)
+        self.sync = JiraSync(self.client)
 
     @property
     def name(self) -> str:
@@ -25,11 +26,31 @@ class JiraModule(BaseModule):
 
     def register_tools(self, server: Server) -> None:
         """Register Jira tools."""
+        self._register_search_tools(server)
+        self._register_issue_tools(server)
+        self._register_write_tools(server)
+        self._register_local_tools(server)
+
+    def _register_search_tools(self, server: Server) -> None:
+        """Register JQL search and reporting tools."""
 
         @server.tool()
-        async def jira_search(jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
+        async def jira_search(
+            jql: str,
+            max_results: int = 50,
+            view: Optional[IssueView] = None,
+        ) -> List[Dict[str, Any]]:
             """Search Jira issues using JQL (Jira Query Language).
 
+            Results are paginated transparently, so max_results may exceed
+            Jira's 100-issue page size.
+
+            Args:
+                jql: JQL query
+                max_results: Maximum number of issues to return
+                view: Fields to return (profile 'compact' by default) and how
+                    to render them
+
             Examples:
             - "assignee = currentUser() AND status != Done" - My open issues
             - "project = PROJ AND created >= -7d" - Recent issues in project
@@ -39,59 +60,342 @@ class JiraModule(BaseModule):
                 raise ValueError(
                     "Not authenticated. Use authenticate_atlassian tool first."
                 )
-            return await self.client.jira_search(jql, max_results)
+            return await self.client.jira_search(jql, max_results, view)
+
+        @server.tool()
+        async def jira_count(
+            jql: str,
+            group_by: Optional[List[str]] = None,
+            max_issues: int = 10000,
+        ) -> Dict[str, Any]:
+            """Count Jira issues matching JQL, optionally grouped by fields.
+
+            Use this instead of jira_search when only numbers are needed, e.g.
+            open P1s per assignee. Without group_by, returns Jira's fast
+            approximate count (the JQL must be bounded, e.g. by project). With
+            group_by, scans up to max_issues matching issues and returns counts
+            per value of each field.
+
+            Args:
+                jql: JQL query
+                group_by: Field ids or display names (e.g. ['status', 'assignee'])
+                max_issues: Maximum number of issues scanned when grouping
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            if not group_by:
+                return {"count": await self.client.jira_count(jql), "approximate": True}
+            return await self.client.jira_facets(jql, group_by, max_issues)
+
+        @server.tool()
+        async def jira_status_times(
+            jql: str, max_issues: int = 1000, include_issues: bool = True
+        ) -> Dict[str, Any]:
+            """Report how long issues matching JQL spent in each status.
+
+            Use for cycle-time questions (e.g. how long stories sit In Review).
+            Status histories are fetched in bulk and reduced to hours per status
+            as they arrive. Returns issues, total, mean, median and p85 hours per
+            status, plus hours per status for each issue unless include_issues
+            is false. The current status counts until now.
+
+            Args:
+                jql: JQL query selecting the issues
+                max_issues: Maximum number of issues scanned
+                include_issues: Also return the hours per status of each issue
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.client.jira_status_times(jql, max_issues, include_issues)
 
         @server.tool()
-        async def jira_get_issue(issue_key: str) -> Dict[str, Any]:
-            """Get detailed information about a specific Jira issue."""
+        async def jira_worklog_summary(
+            jql: str, since: str, until: Optional[str] = None
+        ) -> Dict[str, Any]:
+            """Sum the time logged on issues matching JQL, per user and per issue.
+
+            Use for effort reporting. Worklogs are fetched in bulk and totalled
+            as they arrive, so thousands of issues are fine.
+
+            Args:
+                jql: JQL query selecting the issues
+                since: Count work started on or after this date (e.g.
+                    '2026-09-01' or '2026-09-01T09:00:00+02:00'; UTC if no offset)
+                until: Count work started before this date (default: now)
+            """
             if not self.client or not self.client.config.access_token:
                 raise ValueError(
                     "Not authenticated. Use authenticate_atlassian tool first."
                 )
-            return await self.client.jira_get_issue(issue_key)
+            return await self.client.jira_worklog_summary(jql, since, until)
+
+    def _register_issue_tools(self, server: Server) -> None:
+        """Register tools reading issues and users by key or id."""
+
+        @server.tool()
+        async def jira_get_issue(
+            issue_key: str, view: Optional[IssueView] = None
+        ) -> Dict[str, Any]:
+            """Get detailed information about a specific Jira issue.
+
+            Args:
+                issue_key: The issue key (e.g., 'PROJ-123')
+                view: Fields to return (every field by default) and how to
+                    render them
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.client.jira_get_issue(issue_key, view)
+
+        @server.tool()
+        async def jira_get_issues(
+            issue_keys: List[str], view: Optional[IssueView] = None
+        ) -> Dict[str, Any]:
+            """Get many Jira issues by key in a few bulk requests.
+
+            Prefer this over repeated jira_get_issue calls. Issues come back in
+            the order requested; keys that could not be fetched are listed under
+            'errors' with the reason.
+
+            Args:
+                issue_keys: Issue keys or ids (e.g., ['PROJ-1', 'PROJ-2'])
+                view: Fields to return (profile 'standard' by default) and how
+                    to render them
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.client.jira_get_issues(issue_keys, view)
+
+        @server.tool()
+        async def jira_traverse(
+            issue_key: str,
+            relations: Optional[List[str]] = None,
+            link_types: Optional[List[str]] = None,
+            max_depth: int = 3,
+            max_nodes: int = 200,
+        ) -> Dict[str, Any]:
+            """Map the issues around an issue: its epic or parent, children,
+            subtasks and linked issues, breadth-first.
+
+            Use this instead of repeated jira_get_issue calls to build an epic's
+            tree or a dependency chain. Returns each issue (key, summary, type,
+            status, depth) with its edges to the other issues found, by relation
+            ('parent', 'children', 'subtasks' or the link description).
+
+            Args:
+                issue_key: Issue to start from (e.g., 'PROJ-123')
+                relations: Hierarchy directions - 'parent', 'children' (default
+                    both)
+                link_types: Issue link types to follow by name or direction
+                    (e.g. ['Blocks'], ['is blocked by'], ['*'] for all)
+                max_depth: Maximum number of hops from issue_key
+                max_nodes: Maximum number of issues returned
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            traversal = Traversal(
+                link_types=link_types, max_depth=max_depth, max_nodes=max_nodes
+            )
+            if relations is not None:
+                traversal.relations = relations
+            return await self.client.jira_traverse(issue_key, traversal)
+
+        @server.tool()
+        async def jira_lookup_users(account_ids: List[str]) -> Dict[str, Any]:
+            """Resolve Jira account ids to display names (and emails, if visible).
+
+            Use for mentions, comment authors, approvers or any other accountId.
+            Ids are looked up together and cached, so one call handles many.
+
+            Args:
+                account_ids: Atlassian account ids
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            users = await self.client.resolve_users(account_ids)
+            return {
+                "users": list(users.values()),
+                "not_found": [a for a in dict.fromkeys(account_ids) if a not in users],
+            }
+
+    def _register_write_tools(self, server: Server) -> None:
+        """Register tools creating and updating issues."""
 
         @server.tool()
         async def jira_create_issue(
-            project_key: str, summary: str, description: str, issue_type: str = "Task"
+            project_key: str,
+            summary: str,
+            description: str,
+            issue_type: str = "Task",
+            fields: Optional[Dict[str, Any]] = None,
         ) -> Dict[str, Any]:
             """Create a new Jira issue.
 
             Args:
                 project_key: The project key (e.g., 'PROJ', 'DEV')
                 summary: Brief title of the issue
-                description: Detailed description of the issue
+                description: Detailed description of the issue, in Markdown
+                    (headings, lists, tables, code blocks and links are kept)
                 issue_type: Type of issue (Task, Story, Bug, etc.)
+                fields: Extra field values by field id or display name (e.g.,
+                    {'priority': {'name': 'High'}, 'Story Points': 5})
             """
             if not self.client or not self.client.config.access_token:
                 raise ValueError(
                     "Not authenticated. Use authenticate_atlassian tool first."
                 )
             return await self.client.jira_create_issue(
-                project_key, summary, description, issue_type
+                NewIssue(
+                    project_key=project_key,
+                    summary=summary,
+                    description=description,
+                    issue_type=issue_type,
+                    fields=fields,
+                )
             )
 
+        @server.tool()
+        async def jira_create_issues(
+            issues: List[Dict[str, Any]],
+        ) -> List[Dict[str, Any]]:
+            """Create many Jira issues at once.
+
+            Prefer this over repeated jira_create_issue calls. Returns one result
+            per item, in input order, with 'success' and either 'key' or 'error'.
+
+            Args:
+                issues: Items with 'project_key', 'summary' and optional
+                    'description' (Markdown), 'issue_type' (default 'Task')
+                    and 'fields' (extra field values by field id or name)
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.client.jira_create_issues(issues)
+
         @server.tool()
         async def jira_update_issue(
             issue_key: str,
             summary: Optional[str] = None,
             description: Optional[str] = None,
+            fields: Optional[Dict[str, Any]] = None,
         ) -> Dict[str, Any]:
-            """Update an existing Jira issue."""
+            """Update an existing Jira issue.
+
+            Args:
+                issue_key: The issue key (e.g., 'PROJ-123')
+                summary: New summary
+                description: New description, in Markdown
+                fields: Other field values by field id or display name (e.g.,
+                    {'Story Points': 8, 'labels': ['ops']})
+            """
             if not self.client or not self.client.config.access_token:
                 raise ValueError(
                     "Not authenticated. Use authenticate_atlassian tool first."
                 )
-            return await self.client.jira_update_issue(issue_key, summary, description)
+            return await self.client.jira_update_issue(
+                issue_key, summary, description, fields
+            )
 
         @server.tool()
         async def jira_add_comment(issue_key: str, comment: str) -> Dict[str, Any]:
-            """Add a comment to a Jira issue."""
+            """Add a comment to a Jira issue. The comment is Markdown."""
             if not self.client or not self.client.config.access_token:
                 raise ValueError(
                     "Not authenticated. Use authenticate_atlassian tool first."
                 )
             return await self.client.jira_add_comment(issue_key, comment)
 
+    def _register_local_tools(self, server: Server) -> None:
+        """Register tools backed by the local issue store."""
+
+        @server.tool()
+        async def jira_sync(jql: str, full: bool = False) -> Dict[str, Any]:
+            """Mirror a JQL result set into the local issue store.
+
+            The first sync downloads every matching issue; later syncs fetch
+            only issues updated since the previous one and periodically drop
+            issues that were deleted or no longer match.
+
+            Args:
+                jql: JQL query to mirror
+                full: Re-download everything instead of syncing incrementally
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.sync.sync(jql, full)
+
+        @server.tool()
+        async def jira_local_query(
+            jql: str,
+            max_results: int = 50,
+            max_age_seconds: float = 300,
+            body_format: str = "adf",
+            compaction: Optional[str] = None,
+        ) -> Dict[str, Any]:
+            """Answer a JQL query from the local issue store.
+
+            Prefer this over jira_search for queries you run repeatedly. The
+            query is mirrored on first use; afterwards results are read locally
+            and only refreshed incrementally once they are older than
+            max_age_seconds. Results are ordered by last update, newest first.
+
+            Args:
+                jql: JQL query
+                max_results: Maximum number of issues to return
+                max_age_seconds: Maximum staleness before an incremental sync
+                body_format: 'adf' (raw), or 'markdown' / 'text' to render
+                    descriptions and comments compactly
+                compaction: 'prune' drops links, avatars and icons; 'flatten'
+                    also reduces status, priority, type and users to names;
+                    'none' returns Jira's objects as they are (default from
+                    ATLASSIAN_RESPONSE_COMPACTION, 'prune')
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.sync.query(
+                jql, max_results, max_age_seconds, body_format, compaction
+            )
+
+        @server.tool()
+        async def jira_local_search(
+            query: str, limit: int = 20, jql: Optional[str] = None
+        ) -> List[Dict[str, Any]]:
+            """Full-text search over locally mirrored Jira issues.
+
+            Searches summaries, descriptions and comments of issues synced with
+            jira_sync or jira_local_query, without calling Jira's slower
+            'text ~' search. Results are ranked by relevance (BM25) and include
+            a snippet with matches in [brackets].
+
+            Args:
+                query: Words to find; all must match, 'word*' matches a prefix
+                limit: Maximum number of results
+                jql: Optional synced JQL query to sync first and search within
+            """
+            if not self.client or not self.client.config.access_token:
+                raise ValueError(
+                    "Not authenticated. Use authenticate_atlassian tool first."
+                )
+            return await self.sync.search(query, limit, jql)
+
     def register_resources(self, server: Server) -> None:
         """Register Jira resources."""
         # Jira resources will be added here if needed
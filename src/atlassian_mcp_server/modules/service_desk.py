@@ -11,10 +11,10 @@ from .base import BaseModule
 class ServiceDeskModule(BaseModule):
     """Module for Jira Service Management functionality including Assets."""
 
-    def __init__(self, config):
+    def __init__(self, config, session=None):
         """Initialize the Service Desk module."""
-        super().__init__(config)
-        self.client = ServiceDeskClient(config)
+        super().__init__(config, session)
+        self.client = ServiceDeskClient(config, session)
 
     @property
     def name(self) -> str:
@@ -12,10 +12,16 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
-from .clients import AtlassianConfig, AtlassianError, BaseAtlassianClient
+from .clients import (
+    AtlassianConfig,
+    AtlassianError,
+    AtlassianSession,
+    BaseAtlassianClient,
+)
 from .module_manager import ModuleManager
 
 # Configure logging to both stderr and file
@@ -30,6 +36,54 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP("Atlassian MCP Server")
 
+
+def parse_flag(value: str) -> bool:
+    """Parse a boolean environment flag such as 1/true/yes/on."""
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(value)
+
+
+def parse_float_map(value: str) -> Dict[str, float]:
+    """Parse ``name=seconds,name=seconds`` settings such as latency budgets."""
+    budgets = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, seconds = item.partition("=")
+        budgets[name.strip()] = float(seconds)
+    return budgets
+
+
+# Optional HTTP tuning overrides: environment variable -> (config field, type)
+HTTP_ENV_SETTINGS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "ATLASSIAN_HTTP_MAX_CONNECTIONS": ("max_connections", int),
+    "ATLASSIAN_HTTP_MAX_KEEPALIVE": ("max_keepalive_connections", int),
+    "ATLASSIAN_HTTP_KEEPALIVE_EXPIRY": ("keepalive_expiry", float),
+    "ATLASSIAN_HTTP2": ("http2", parse_flag),
+    "ATLASSIAN_HTTP_CONNECT_TIMEOUT": ("connect_timeout", float),
+    "ATLASSIAN_HTTP_READ_TIMEOUT": ("read_timeout", float),
+    "ATLASSIAN_HTTP_WRITE_TIMEOUT": ("write_timeout", float),
+    "ATLASSIAN_HTTP_POOL_TIMEOUT": ("pool_timeout", float),
+    "ATLASSIAN_LATENCY_BUDGETS": ("latency_budgets", parse_float_map),
+    "ATLASSIAN_HTTP_CACHE_BYTES": ("http_cache_bytes", int),
+    "ATLASSIAN_REFERENCE_CACHE_BYTES": ("reference_cache_bytes", int),
+    "ATLASSIAN_REFERENCE_CACHE_TTLS": ("reference_cache_ttls", parse_float_map),
+    "ATLASSIAN_PERSISTENT_CACHE": ("persistent_cache", parse_flag),
+    "ATLASSIAN_PERSISTENT_CACHE_PATH": ("persistent_cache_path", str),
+    "ATLASSIAN_ISSUE_STORE_PATH": ("issue_store_path", str),
+    "ATLASSIAN_SYNC_RECONCILE_SECONDS": ("sync_reconcile_seconds", float),
+    "ATLASSIAN_RESPONSE_COMPACTION": ("response_compaction", str),
+    "ATLASSIAN_HTTP_MAX_RETRIES": ("max_retries", int),
+    "ATLASSIAN_RATE_LIMIT_PER_SECOND": ("rate_limit_per_second", float),
+    "ATLASSIAN_RATE_LIMIT_BURST": ("rate_limit_burst", int),
+    "ATLASSIAN_CONCURRENCY_INITIAL": ("concurrency_initial", int),
+    "ATLASSIAN_CONCURRENCY_MAX": ("concurrency_max", int),
+}
+
 # Global instances
 ATLASSIAN_CLIENT = None
 MODULE_MANAGER = None
@@ -65,6 +119,28 @@ async def authenticate_atlassian() -> str:
     return await ATLASSIAN_CLIENT.seamless_oauth_flow(scopes)
 
 
+@mcp.tool()
+async def atlassian_client_metrics() -> Dict[str, float]:
+    """Report HTTP client metrics (requests, retries, rate-limit waits)."""
+    if not ATLASSIAN_CLIENT:
+        raise ValueError("Client not initialized")
+    return ATLASSIAN_CLIENT.session.metrics.snapshot()
+
+
+def load_http_settings() -> Dict[str, Any]:
+    """Read optional HTTP tuning overrides from the environment."""
+    settings: Dict[str, Any] = {}
+    for env_name, (field, cast) in HTTP_ENV_SETTINGS.items():
+        value = os.getenv(env_name, "").strip()
+        if not value:
+            continue
+        try:
+            settings[field] = cast(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid value for {env_name}: {value!r}") from e
+    return settings
+
+
 async def initialize_client():
     """Initialize and return the Atlassian client."""
     site_url = os.getenv("ATLASSIAN_SITE_URL")
@@ -81,9 +157,11 @@ async def initialize_client():
         site_url=site_url,
         client_id=client_id,
         client_secret=client_secret,
+        **load_http_settings(),
     )
 
-    client = BaseAtlassianClient(config)
+    # One session is shared by the auth client and every module client
+    client = BaseAtlassianClient(config, AtlassianSession(config))
     client.load_credentials()
     return client
 
@@ -96,7 +174,9 @@ def main():
         ATLASSIAN_CLIENT = asyncio.run(initialize_client())
 
         # Initialize and register modules with config
-        MODULE_MANAGER = ModuleManager(ATLASSIAN_CLIENT.config)
+        MODULE_MANAGER = ModuleManager(
+            ATLASSIAN_CLIENT.config, ATLASSIAN_CLIENT.session
+        )
         MODULE_MANAGER.register_all(mcp)
 
         print(
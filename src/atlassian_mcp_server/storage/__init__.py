@@ -0,0 +1,6 @@
+"""Local on-disk storage used by the Atlassian MCP Server."""
+
+from .issue_store import IssueStore
+from .persistent_cache import PersistentCache
+
+__all__ = ["IssueStore", "PersistentCache"]
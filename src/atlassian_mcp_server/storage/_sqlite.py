@@ -0,0 +1,60 @@
+"""
+Connection handling shared by the SQLite stores.
+
+Both store files may be opened by several server processes on one host, so
+every connection runs in WAL mode with a busy timeout and is used for one
+short transaction.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+BUSY_TIMEOUT_SECONDS = 5.0
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open ``path`` in WAL mode with the shared busy timeout."""
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS)
+    conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT_SECONDS * 1000)}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+
+def make_private(path: Path) -> None:
+    """Restrict ``path`` to its owner; failures (e.g. on Windows) are ignored."""
+    try:
+        os.chmod(path, 0o600)
+    except OSError:
+        pass
+
+
+class SQLiteStore:  # pylint: disable=too-few-public-methods
+    """SQLite file opened lazily; the schema is set up by the first connection."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._initialized = False
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create or migrate the tables; runs once per instance."""
+        raise NotImplementedError
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect(self.path)
+        if not self._initialized:
+            self._create_schema(conn)
+            make_private(self.path)
+            self._initialized = True
+        return conn
+
+
+def fetch_one(
+    conn: sqlite3.Connection, sql: str, params: Sequence[Any]
+) -> Optional[Tuple[Any, ...]]:
+    """Run a single-row query on ``conn`` and close it."""
+    try:
+        return conn.execute(sql, params).fetchone()
+    finally:
+        conn.close()
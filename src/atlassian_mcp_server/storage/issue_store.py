@@ -0,0 +1,303 @@
+"""
+Local SQLite mirror of Jira issues matched by synced JQL queries.
+
+Issues are stored once per site and linked to every synced query that matched
+them, so repeat queries can be answered from disk. Like the persistent cache,
+the file runs in WAL mode with a busy timeout and each operation is one short
+transaction, so several server processes on one host can share it.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from ._sqlite import SQLiteStore, fetch_one
+
+logger = logging.getLogger(__name__)
+
+ISSUE_STORE_FILE = Path.home() / ".atlassian_mcp_issues.sqlite3"
+
+# Bump when the schema changes; files with an older version are rebuilt (the
+# mirror is refilled by the next sync).
+STORE_FORMAT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    pk INTEGER PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    id TEXT NOT NULL,
+    updated TEXT,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    UNIQUE (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS sync_queries (
+    namespace TEXT NOT NULL,
+    jql TEXT NOT NULL,
+    last_sync REAL NOT NULL,
+    last_reconcile REAL NOT NULL,
+    PRIMARY KEY (namespace, jql)
+);
+CREATE TABLE IF NOT EXISTS query_members (
+    namespace TEXT NOT NULL,
+    jql TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (namespace, jql, key)
+);
+CREATE INDEX IF NOT EXISTS query_members_key ON query_members (namespace, key);
+"""
+
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS issues;
+DROP TABLE IF EXISTS sync_queries;
+DROP TABLE IF EXISTS query_members;
+DROP TABLE IF EXISTS issue_fts;
+"""
+
+# Full-text index over issues; its rowid is the pk of the issues row, which
+# (unlike an implicit rowid) VACUUM never renumbers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS issue_fts USING fts5 (
+    summary, description, comments, tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+# BM25 column weights: summary, description, comments
+FTS_WEIGHTS = (10.0, 4.0, 1.0)
+_SEARCH_TERM = re.compile(r"\w+\*?", re.UNICODE)
+
+
+def normalize_jql(jql: str) -> str:
+    """Collapse whitespace so trivially different spellings share one mirror."""
+    return " ".join(jql.split())
+
+
+class IssueStore(SQLiteStore):
+    """SQLite-backed issue mirror, namespaced by Atlassian site."""
+
+    def __init__(self, namespace: str, path: Optional[Path] = None):
+        super().__init__(Path(path) if path else ISSUE_STORE_FILE)
+        self.namespace = namespace
+        self.full_text = True
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != STORE_FORMAT_VERSION:
+            conn.executescript(_DROP_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {STORE_FORMAT_VERSION}")
+        with conn:
+            conn.executescript(_SCHEMA)
+        try:
+            with conn:
+                conn.execute(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite FTS5 unavailable, local search disabled: %s", e)
+            self.full_text = False
+
+    def sync_state(self, jql: str) -> Optional[Dict[str, Any]]:
+        """Return the watermarks and size of a synced query, if it was synced."""
+        row = fetch_one(
+            self._connect(),
+            "SELECT last_sync, last_reconcile, "
+            "(SELECT COUNT(*) FROM query_members m "
+            "WHERE m.namespace = q.namespace AND m.jql = q.jql) "
+            "FROM sync_queries q WHERE namespace = ? AND jql = ?",
+            (self.namespace, normalize_jql(jql)),
+        )
+        if row is None:
+            return None
+        return {"last_sync": row[0], "last_reconcile": row[1], "issue_count": row[2]}
+
+    def upsert(
+        self,
+        jql: str,
+        issues: Iterable[Dict[str, Any]],
+        texts: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> int:
+        """Store issues and record them as members of ``jql``. Returns count.
+
+        ``texts`` maps issue keys to their (summary, description, comments)
+        plain text, which replaces the issue's entry in the full-text index.
+        """
+        now = time.time()
+        jql = normalize_jql(jql)
+        rows = [
+            (
+                self.namespace,
+                issue["key"],
+                str(issue["id"]),
+                (issue.get("fields") or {}).get("updated"),
+                json.dumps(issue),
+                now,
+            )
+            for issue in issues
+        ]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO issues (namespace, key, id, updated, data, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (namespace, key) DO UPDATE SET "
+                    "id = excluded.id, updated = excluded.updated, "
+                    "data = excluded.data, synced_at = excluded.synced_at",
+                    rows,
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO query_members (namespace, jql, key) "
+                    "VALUES (?, ?, ?)",
+                    [(self.namespace, jql, row[1]) for row in rows],
+                )
+                if texts and self.full_text:
+                    self._index_texts(conn, texts)
+        finally:
+            conn.close()
+        return len(rows)
+
+    def reconcile(self, jql: str, keys: Iterable[str]) -> int:
+        """Drop members of ``jql`` not in ``keys`` and orphaned issues.
+
+        Returns the number of memberships removed.
+        """
+        jql = normalize_jql(jql)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("CREATE TEMP TABLE current_keys (key TEXT PRIMARY KEY)")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO current_keys VALUES (?)",
+                    ((key,) for key in keys),
+                )
+                removed = conn.execute(
+                    "DELETE FROM query_members WHERE namespace = ? AND jql = ? "
+                    "AND key NOT IN (SELECT key FROM current_keys)",
+                    (self.namespace, jql),
+                ).rowcount
+                conn.execute("DROP TABLE current_keys")
+                self._delete_orphans(conn)
+        finally:
+            conn.close()
+        return removed
+
+    def _index_texts(
+        self, conn: sqlite3.Connection, texts: Mapping[str, Sequence[str]]
+    ) -> None:
+        for key, (summary, description, comments) in texts.items():
+            row = conn.execute(
+                "SELECT pk FROM issues WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                continue
+            conn.execute("DELETE FROM issue_fts WHERE rowid = ?", (row[0],))
+            conn.execute(
+                "INSERT INTO issue_fts (rowid, summary, description, comments) "
+                "VALUES (?, ?, ?, ?)",
+                (row[0], summary, description, comments),
+            )
+
+    def _delete_orphans(self, conn: sqlite3.Connection) -> None:
+        orphans = (
+            "namespace = ? AND key NOT IN "
+            "(SELECT key FROM query_members WHERE namespace = ?)"
+        )
+        if self.full_text:
+            conn.execute(
+                f"DELETE FROM issue_fts WHERE rowid IN "
+                f"(SELECT pk FROM issues WHERE {orphans})",
+                (self.namespace, self.namespace),
+            )
+        conn.execute(
+            f"DELETE FROM issues WHERE {orphans}", (self.namespace, self.namespace)
+        )
+
+    def mark_synced(
+        self, jql: str, synced_at: float, reconciled_at: Optional[float] = None
+    ) -> None:
+        """Advance the sync watermark (and the reconcile time, if given)."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO sync_queries (namespace, jql, last_sync, "
+                    "last_reconcile) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (namespace, jql) DO UPDATE SET "
+                    "last_sync = excluded.last_sync, "
+                    "last_reconcile = MAX(last_reconcile, excluded.last_reconcile)",
+                    (
+                        self.namespace,
+                        normalize_jql(jql),
+                        synced_at,
+                        reconciled_at or 0.0,
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def query(self, jql: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the mirrored issues of ``jql``, most recently updated first."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT i.data FROM query_members m JOIN issues i "
+                "ON i.namespace = m.namespace AND i.key = m.key "
+                "WHERE m.namespace = ? AND m.jql = ? "
+                "ORDER BY i.updated DESC, i.key LIMIT ?",
+                (self.namespace, normalize_jql(jql), -1 if limit is None else limit),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row[0]) for row in rows]
+
+    def search(
+        self, text: str, limit: int = 20, jql: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Rank mirrored issues against ``text`` with BM25.
+
+        Every word must match (a trailing ``*`` matches a prefix). ``jql``
+        restricts results to the mirror of one synced query.
+        """
+        conn = self._connect()
+        if not self.full_text:
+            conn.close()
+            raise ValueError("Local search needs SQLite with the FTS5 extension")
+        terms = _SEARCH_TERM.findall(text)
+        if not terms:
+            conn.close()
+            return []
+        match = " ".join(
+            f'"{term[:-1]}"*' if term.endswith("*") else f'"{term}"' for term in terms
+        )
+        sql = (
+            "SELECT i.key, i.data, bm25(issue_fts, ?, ?, ?) AS rank, "
+            "snippet(issue_fts, -1, '[', ']', '...', 16) "
+            "FROM issue_fts JOIN issues i ON i.pk = issue_fts.rowid "
+            "WHERE issue_fts MATCH ? AND i.namespace = ?"
+        )
+        params: List[Any] = [*FTS_WEIGHTS, match, self.namespace]
+        if jql is not None:
+            sql += (
+                " AND i.key IN (SELECT key FROM query_members "
+                "WHERE namespace = ? AND jql = ?)"
+            )
+            params += [self.namespace, normalize_jql(jql)]
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [
+            {
+                "key": key,
+                "issue": json.loads(data),
+                "score": round(-rank, 4),
+                "snippet": snippet,
+            }
+            for key, data, rank, snippet in rows
+        ]
@@ -0,0 +1,152 @@
+"""
+Persistent warm-start cache for reference data and the cloud ID.
+
+Entries live in a small SQLite file next to the credentials file so a restarted
+server can skip cloud ID, project, space and request-type discovery. The file
+is opened lazily and is safe to share between server processes on one host:
+it runs in WAL mode with a busy timeout and every operation is a single short
+transaction using atomic upserts.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from ._sqlite import SQLiteStore, fetch_one
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = Path.home() / ".atlassian_mcp_cache.sqlite3"
+
+# Bump when the stored value format changes; older rows are then ignored.
+CACHE_FORMAT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    category TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    format_version INTEGER NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, category, key)
+)
+"""
+
+
+class PersistentCache(SQLiteStore):
+    """SQLite-backed cache shared by server processes on the same host."""
+
+    def __init__(self, namespace: str, path: Optional[Path] = None):
+        super().__init__(Path(path) if path else CACHE_FILE)
+        self.namespace = namespace
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute(_SCHEMA)
+            conn.execute(
+                "DELETE FROM entries WHERE expires_at <= ? OR format_version != ?",
+                (time.time(), CACHE_FORMAT_VERSION),
+            )
+
+    def get(self, category: str, key: str) -> Optional[Tuple[Any, float, int]]:
+        """Return ``(value, seconds_left, version)`` for a fresh entry."""
+        row = fetch_one(
+            self._connect(),
+            "SELECT value, expires_at, version FROM entries "
+            "WHERE namespace = ? AND category = ? AND key = ? "
+            "AND format_version = ? AND expires_at > ?",
+            (self.namespace, category, key, CACHE_FORMAT_VERSION, time.time()),
+        )
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1] - time.time(), row[2]
+
+    def put(self, category: str, key: str, value: Any, ttl: float) -> None:
+        """Insert or replace an entry, bumping its version stamp."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO entries (namespace, category, key, value, "
+                    "format_version, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (namespace, category, key) DO UPDATE SET "
+                    "value = excluded.value, "
+                    "format_version = excluded.format_version, "
+                    "version = entries.version + 1, "
+                    "stored_at = excluded.stored_at, "
+                    "expires_at = excluded.expires_at",
+                    (
+                        self.namespace,
+                        category,
+                        key,
+                        json.dumps(value, default=str),
+                        CACHE_FORMAT_VERSION,
+                        now,
+                        now + ttl,
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def delete(self, category: str, key: Optional[str] = None) -> None:
+        """Delete one entry, or the whole ``category`` when ``key`` is None."""
+        conn = self._connect()
+        try:
+            with conn:
+                if key is None:
+                    conn.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND category = ?",
+                        (self.namespace, category),
+                    )
+                else:
+                    conn.execute(
+                        "DELETE FROM entries "
+                        "WHERE namespace = ? AND category = ? AND key = ?",
+                        (self.namespace, category, key),
+                    )
+        finally:
+            conn.close()
+
+    def purge_expired(self) -> int:
+        """Remove expired or outdated rows for every namespace. Returns count."""
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ? OR format_version != ?",
+                    (time.time(), CACHE_FORMAT_VERSION),
+                )
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    async def aget(self, category: str, key: str) -> Optional[Tuple[Any, float, int]]:
+        """Non-blocking :meth:`get`; storage errors are logged and treated as misses."""
+        try:
+            return await asyncio.to_thread(self.get, category, key)
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache read failed: %s", e)
+            return None
+
+    async def aput(self, category: str, key: str, value: Any, ttl: float) -> None:
+        """Non-blocking :meth:`put`; storage errors are logged and ignored."""
+        try:
+            await asyncio.to_thread(self.put, category, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache write failed: %s", e)
+
+    async def adelete(self, category: str, key: Optional[str] = None) -> None:
+        """Non-blocking :meth:`delete`; storage errors are logged and ignored."""
+        try:
+            await asyncio.to_thread(self.delete, category, key)
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache delete failed: %s", e)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Shared fixtures: configs, sessions and clients whose HTTP traffic is mocked."""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianConfig,
+    AtlassianSession,
+    BaseAtlassianClient,
+)
+
+SITE_URL = "https://example.atlassian.net"
+
+
+@pytest.fixture
+def make_config():
+    """Factory for a config with an access token already present."""
+
+    def factory(**overrides):
+        settings = {
+            "site_url": SITE_URL,
+            "client_id": "client-id",
+            "client_secret": "client-secret",
+            "access_token": "token-1",
+        }
+        return AtlassianConfig(**{**settings, **overrides})
+
+    return factory
+
+
+@pytest.fixture
+def make_session(make_config, tmp_path):
+    """Factory for a session whose HTTP traffic is served by ``handler``.
+
+    Credentials are read from and saved to ``tmp_path``, never the home
+    directory.
+    """
+
+    def factory(handler, config=None, **overrides):
+        return AtlassianSession(
+            config or make_config(**overrides),
+            credentials_file=tmp_path / "credentials.json",
+            transport=httpx.MockTransport(handler),
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_client(make_session):
+    """Factory for a ``client_class`` client on a mocked session."""
+
+    def factory(handler, client_class=BaseAtlassianClient, **overrides):
+        session = make_session(handler, **overrides)
+        return client_class(session.config, session)
+
+    return factory
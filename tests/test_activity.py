@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Unit tests for the changelog and worklog aggregates."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients.activity import (
+    StatusTimes,
+    WorklogTotals,
+    parse_time,
+    status_durations,
+)
+
+NOW = datetime(2026, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def change(created, from_status, to_status, field="status"):
+    return {
+        "created": created,
+        "items": [{"field": field, "from": from_status, "to": to_status}],
+    }
+
+
+def test_status_durations_orders_transitions_and_counts_until_now():
+    """Histories may arrive out of order; other fields are ignored."""
+    histories = [
+        change("2026-01-01T18:00:00.000+0000", "In Progress", "Done"),
+        change("2026-01-01T12:00:00.000+0000", "Open", "Open", field="priority"),
+        change("2026-01-01T06:00:00.000+0000", "To Do", "In Progress"),
+    ]
+
+    hours = {
+        status: seconds / 3600
+        for status, seconds in status_durations(
+            "2026-01-01T00:00:00.000+0000", "Done", histories, NOW
+        ).items()
+    }
+
+    assert hours == {"To Do": 6, "In Progress": 12, "Done": 6}
+
+
+def test_status_durations_without_changes_uses_current_status():
+    durations = status_durations("2026-01-01T12:00:00+00:00", "Open", [], NOW)
+    assert durations == {"Open": 12 * 3600}
+
+
+def test_status_times_summarises_per_status():
+    times = StatusTimes(keep_issues=False)
+    for n, hours in enumerate([1, 2, 3, 4, 10]):
+        times.add(f"P-{n}", "Done", {"Review": hours * 3600})
+
+    summary = times.summary()["Review"]
+
+    assert times.issues == []
+    assert summary == {
+        "issues": 5,
+        "total_hours": 20.0,
+        "mean_hours": 4.0,
+        "median_hours": 3.0,
+        "p85_hours": 10.0,
+    }
+
+
+def test_worklog_totals_group_by_user_and_issue():
+    totals = WorklogTotals()
+    for account, issue, seconds in [("a", "P-1", 3600), ("b", "P-1", 1800)]:
+        totals.add(
+            {
+                "account_id": account,
+                "author": account.upper(),
+                "issue_key": issue,
+                "seconds": seconds,
+            }
+        )
+
+    summary = totals.summary()
+
+    assert summary["total_hours"] == 1.5
+    assert [u["name"] for u in summary["by_user"]] == ["A", "B"]
+    assert summary["by_issue"] == {"P-1": 1.5}
+
+
+def test_parse_time_accepts_dates_and_jira_timestamps():
+    assert parse_time("2026-09-01") == datetime(2026, 9, 1, tzinfo=timezone.utc)
+    assert parse_time("2026-09-01T10:00:00.000+0200").hour == 10
+    assert parse_time("2026-01-01T10:00:00.000+0000") == datetime(
+        2026, 1, 1, 10, tzinfo=timezone.utc
+    )
+    assert parse_time("2026-01-01T10:00:00Z") == datetime(
+        2026, 1, 1, 10, tzinfo=timezone.utc
+    )
+    assert parse_time("2026-01-01T11:30:00-0130").utcoffset() == -timedelta(
+        hours=1, minutes=30
+    )
+    with pytest.raises(ValueError, match="Invalid date"):
+        parse_time("yesterday")
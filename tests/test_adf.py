@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Unit tests for the ADF renderer and the Markdown to ADF converter."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients.adf import adf_to_text, markdown_to_adf, render_adf
+
+
+def text(value, *marks):
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+def para(*content):
+    return {"type": "paragraph", "content": list(content)}
+
+
+def doc(*content):
+    return {"type": "doc", "version": 1, "content": list(content)}
+
+
+def item(*content):
+    return {"type": "listItem", "content": list(content)}
+
+
+def test_markdown_blocks_and_marks():
+    """Headings, marks, links, mentions and code render as compact Markdown."""
+    document = doc(
+        {"type": "heading", "attrs": {"level": 2}, "content": [text("Plan")]},
+        para(
+            text("Ship "),
+            text("now", {"type": "strong"}),
+            text(" per "),
+            text("docs", {"type": "link", "attrs": {"href": "https://x.test"}}),
+            text(", ask "),
+            {"type": "mention", "attrs": {"id": "a1", "text": "@Ada"}},
+        ),
+        {
+            "type": "codeBlock",
+            "attrs": {"language": "sh"},
+            "content": [text("make *test*")],
+        },
+    )
+
+    assert render_adf(document) == (
+        "## Plan\n\n"
+        "Ship **now** per [docs](https://x.test), ask @Ada\n\n"
+        "```sh\nmake *test*\n```"
+    )
+    assert render_adf(document, "text") == (
+        "Plan\n\nShip now per docs (https://x.test), ask @Ada\n\nmake *test*"
+    )
+
+
+def test_nested_lists_tasks_and_quotes():
+    """Nested lists indent under their parent item and keep numbering."""
+    document = doc(
+        {
+            "type": "bulletList",
+            "content": [
+                item(
+                    para(text("one")),
+                    {
+                        "type": "orderedList",
+                        "attrs": {"order": 3},
+                        "content": [
+                            item(para(text("three"))),
+                            item(para(text("four"))),
+                        ],
+                    },
+                ),
+                item(para(text("two"))),
+            ],
+        },
+        {
+            "type": "taskList",
+            "content": [
+                {
+                    "type": "taskItem",
+                    "attrs": {"state": "DONE"},
+                    "content": [text("a")],
+                },
+                {
+                    "type": "taskItem",
+                    "attrs": {"state": "TODO"},
+                    "content": [text("b")],
+                },
+            ],
+        },
+        {"type": "blockquote", "content": [para(text("q1")), para(text("q2"))]},
+    )
+
+    assert render_adf(document) == (
+        "- one\n  3. three\n  4. four\n- two\n\n" "- [x] a\n- [ ] b\n\n" "> q1\n>\n> q2"
+    )
+
+
+def test_tables():
+    """Tables become Markdown tables with escaped pipes and padded rows."""
+    cell = lambda kind, *content: {"type": kind, "content": list(content)}  # noqa
+    document = doc(
+        {
+            "type": "table",
+            "content": [
+                {
+                    "type": "tableRow",
+                    "content": [
+                        cell("tableHeader", para(text("Name"))),
+                        cell("tableHeader", para(text("A|B"))),
+                    ],
+                },
+                {"type": "tableRow", "content": [cell("tableCell", para(text("x")))]},
+            ],
+        }
+    )
+
+    assert render_adf(document) == "| Name | A\\|B |\n| --- | --- |\n| x |  |"
+    assert render_adf(document, "text") == "Name | A|B\nx | "
+
+
+def test_deeply_nested_document_does_not_recurse():
+    """Nesting far beyond the recursion limit still renders."""
+    depth = sys.getrecursionlimit() * 5
+    node = para(text("bottom"))
+    for _ in range(depth):
+        node = {"type": "blockquote", "content": [node]}
+
+    rendered = adf_to_text(doc(node))
+
+    assert rendered.endswith("bottom")
+    assert rendered.count(">") == depth
+
+
+def test_non_adf_values_pass_through():
+    """Strings and raw mode are returned unchanged; bad formats are rejected."""
+    assert render_adf("plain", "markdown") == "plain"
+    assert render_adf(doc(para(text("x"))), "adf") == doc(para(text("x")))
+    with pytest.raises(ValueError):
+        render_adf(doc(), "html")
+
+
+MARKDOWN = """# Release plan
+
+Ship **now**, _carefully_, with `make deploy` and ~~no~~ [docs](https://x.io).
+Second line of the same paragraph
+
+- one
+- two
+  - nested **deep**
+- three
+
+3. third
+4. fourth
+
+- [ ] todo
+- [x] done
+  - [ ] subtask
+
+> quoted
+>
+> - in a quote
+
+```python
+def f():
+    return 1
+```
+
+---
+
+| Name | Notes |
+| --- | --- |
+| a \\| b | ``x ` y`` |
+| c |  |"""
+
+
+def test_markdown_to_adf_structure():
+    """Markdown blocks become the matching ADF nodes."""
+    document = markdown_to_adf(MARKDOWN)
+    types = [node["type"] for node in document["content"]]
+    assert types == [
+        "heading",
+        "paragraph",
+        "bulletList",
+        "orderedList",
+        "taskList",
+        "blockquote",
+        "codeBlock",
+        "rule",
+        "table",
+    ]
+    paragraph = document["content"][1]["content"]
+    assert text("now", {"type": "strong"}) in paragraph
+    assert text("make deploy", {"type": "code"}) in paragraph
+    assert (
+        text("docs", {"type": "link", "attrs": {"href": "https://x.io"}}) in paragraph
+    )
+    assert {"type": "hardBreak"} in paragraph
+    assert document["content"][3]["attrs"] == {"order": 3}
+    tasks = document["content"][4]["content"]
+    assert [t["attrs"]["state"] for t in tasks[:2]] == ["TODO", "DONE"]
+    assert tasks[2]["type"] == "taskList"
+    assert document["content"][6]["attrs"] == {"language": "python"}
+    cell = document["content"][8]["content"][1]["content"][0]
+    assert cell["content"][0]["content"] == [text("a | b")]
+
+
+def test_markdown_round_trips_through_renderer():
+    """Rendering the converted document gives back the same Markdown and ADF."""
+    document = markdown_to_adf(MARKDOWN)
+    rendered = render_adf(document)
+    assert rendered == MARKDOWN
+    assert markdown_to_adf(rendered) == document
+
+
+def test_adf_round_trips_through_markdown():
+    """ADF in the converter's vocabulary survives render and convert."""
+    document = doc(
+        {"type": "heading", "attrs": {"level": 3}, "content": [text("Title")]},
+        para(
+            text("a "),
+            text("b", {"type": "strong"}, {"type": "em"}),
+            {"type": "hardBreak"},
+            text("c", {"type": "link", "attrs": {"href": "https://e.com"}}),
+        ),
+        {
+            "type": "bulletList",
+            "content": [
+                item(
+                    para(text("x")),
+                    {"type": "orderedList", "content": [item(para(text("y")))]},
+                )
+            ],
+        },
+        {"type": "blockquote", "content": [para(text("q1")), para(text("q2"))]},
+        {"type": "codeBlock", "content": [text("  indented\n\nblank above")]},
+    )
+    assert markdown_to_adf(render_adf(document)) == document
+
+
+def test_markdown_edge_cases_stay_text():
+    """Unmatched delimiters, snake_case and non-list numbers are plain text."""
+    document = markdown_to_adf("a * b and snake_case_name and 2*3\n2024. was fine")
+    assert document["content"] == [
+        para(
+            text("a * b and snake_case_name and 2*3"),
+            {"type": "hardBreak"},
+            text("2024. was fine"),
+        )
+    ]
+    assert markdown_to_adf("") == doc()
+    # ADF has no headings in list items, so they stay text
+    nested = markdown_to_adf("- # not a heading")["content"][0]
+    assert nested["content"][0]["content"] == [para(text("# not a heading"))]
+
+
+def test_mixed_marks_with_spaces_round_trip():
+    """Spaces at the edge of marked text are kept outside the delimiters."""
+    document = doc(
+        para(
+            text("bold ", {"type": "strong"}),
+            text("it", {"type": "strong"}, {"type": "em"}),
+            text(" and", {"type": "em"}),
+            text(" ", {"type": "strike"}),
+            text("end"),
+        )
+    )
+    markdown = render_adf(document)
+
+    assert markdown == "**bold** _**it**_ _and_ end"
+    assert markdown_to_adf(markdown) == doc(
+        para(
+            text("bold", {"type": "strong"}),
+            text(" "),
+            text("it", {"type": "strong"}, {"type": "em"}),
+            text(" "),
+            text("and", {"type": "em"}),
+            text(" end"),
+        )
+    )
+    assert adf_to_text(markdown_to_adf(markdown)) == adf_to_text(document)
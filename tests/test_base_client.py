@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Unit tests for BaseAtlassianClient request handling (mocked transport)."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianError,
+    BaseAtlassianClient,
+    ConfluenceClient,
+    JiraClient,
+)
+
+SITE_URL = "https://example.atlassian.net"
+RESOURCES_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
+CLOUD_ID = "cloud-123"
+
+
+def resources_response():
+    """Accessible-resources payload for the test site."""
+    return httpx.Response(
+        200,
+        json=[{"id": CLOUD_ID, "url": SITE_URL, "scopes": ["read:jira-work"]}],
+    )
+
+
+async def test_cloud_id_is_resolved_once(make_client):
+    """Repeated lookups reuse the cached accessible-resources result."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return resources_response()
+
+    client = make_client(handler)
+    assert await client.get_cloud_id() == CLOUD_ID
+    assert await client.get_cloud_id(["read:jira-work"]) == CLOUD_ID
+    assert calls == [RESOURCES_URL]
+
+
+async def test_cloud_id_cache_refreshes_on_token_change(make_client):
+    """A new access token triggers a fresh accessible-resources lookup."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return resources_response()
+
+    client = make_client(handler)
+    await client.get_cloud_id()
+    client.config.access_token = "token-2"
+    await client.get_cloud_id()
+    assert len(calls) == 2
+
+
+async def test_cloud_id_cache_invalidated_on_404(make_client):
+    """A 404 from a site-level endpoint drops the cached mapping."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if request.url.path.startswith("/oauth"):
+            return resources_response()
+        return httpx.Response(404, json={})
+
+    client = make_client(handler)
+    cloud_id = await client.get_cloud_id()
+    await client.make_request(
+        "GET", f"https://api.atlassian.com/ex/jira/{cloud_id}/rest/api/3/myself"
+    )
+    await client.get_cloud_id()
+    assert calls.count(RESOURCES_URL) == 2
+
+
+async def test_cloud_id_cache_kept_on_missing_resource_404(make_client):
+    """A 404 for a missing issue or page is not a sign of a stale cloud ID."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if request.url.path.startswith("/oauth"):
+            return resources_response()
+        return httpx.Response(404, json={"errorMessages": ["Issue does not exist"]})
+
+    client = make_client(handler)
+    cloud_id = await client.get_cloud_id()
+    base = f"https://api.atlassian.com/ex/jira/{cloud_id}/rest/api/3"
+    for key in ("PROJ-1", "PROJ-2", "PROJ-3"):
+        await client.make_request("GET", f"{base}/issue/{key}")
+        await client.get_cloud_id()
+    assert calls.count(RESOURCES_URL) == 1
+
+
+async def test_missing_scopes_checked_against_cache(make_client):
+    """Scope validation uses the cached scopes without another lookup."""
+    client = make_client(lambda request: resources_response())
+    await client.get_cloud_id()
+    with pytest.raises(AtlassianError, match="Missing required scopes"):
+        await client.get_cloud_id(["write:jira-work"])
+
+
+async def test_product_clients_share_session(tmp_path, make_session):
+    """Product clients on one session share the pool, tokens and cloud ID."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return resources_response()
+
+    credentials_file = tmp_path / "credentials.json"
+    credentials_file.write_text('{"access_token": "disk-token"}', encoding="utf-8")
+    session = make_session(handler)
+    jira = JiraClient(session.config, session)
+    confluence = ConfluenceClient(session.config, session)
+
+    assert jira.client is confluence.client
+    assert confluence.config.access_token == "disk-token"
+
+    credentials_file.write_text('{"access_token": "other"}', encoding="utf-8")
+    jira.config.access_token = "refreshed-token"
+    assert ConfluenceClient(session.config, session).config.access_token == (
+        "refreshed-token"
+    )
+
+    await jira.get_cloud_id()
+    await confluence.get_cloud_id()
+    assert calls == [RESOURCES_URL]
+
+
+def token_response(access_token):
+    """Token endpoint payload with a one hour lifetime."""
+    return httpx.Response(
+        200,
+        json={
+            "access_token": access_token,
+            "refresh_token": f"refresh-{access_token}",
+            "expires_in": 3600,
+        },
+    )
+
+
+async def test_concurrent_401s_share_one_refresh(make_session):
+    """A burst of 401s triggers a single token refresh."""
+    token_posts = []
+
+    async def handler(request):
+        if request.url.host == "auth.atlassian.com":
+            token_posts.append(request)
+            await asyncio.sleep(0.01)
+            return token_response("token-2")
+        if request.headers["Authorization"] == "Bearer token-2":
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(401)
+
+    session = make_session(handler)
+    session.config.refresh_token = "refresh-1"
+    client = BaseAtlassianClient(session.config, session)
+
+    responses = await asyncio.gather(
+        *(client.make_request("GET", "https://api.atlassian.com/me") for _ in range(5))
+    )
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert len(token_posts) == 1
+    assert session.config.refresh_token == "refresh-token-2"
+    assert session.config.token_expires_at is not None
+
+
+async def test_expired_token_refreshed_before_request(make_session):
+    """An expired token is refreshed up front instead of after a 401."""
+    seen = []
+
+    def handler(request):
+        if request.url.host == "auth.atlassian.com":
+            return token_response("token-2")
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    session = make_session(handler)
+    session.config.refresh_token = "refresh-1"
+    session.config.token_expires_at = time.time() - 1
+    client = BaseAtlassianClient(session.config, session)
+
+    await client.make_request("GET", "https://api.atlassian.com/me")
+    assert seen == ["Bearer token-2"]
+
+
+async def test_token_near_expiry_refreshed_in_background(make_session):
+    """A token close to expiry is refreshed without delaying the caller."""
+    token_posts = []
+    seen = []
+
+    def handler(request):
+        if request.url.host == "auth.atlassian.com":
+            token_posts.append(request)
+            return token_response("token-2")
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    session = make_session(handler)
+    session.config.refresh_token = "refresh-1"
+    session.config.token_expires_at = time.time() + 120
+    client = BaseAtlassianClient(session.config, session)
+
+    await client.make_request("GET", "https://api.atlassian.com/me")
+    await session.credentials.refresh_task
+    await client.make_request("GET", "https://api.atlassian.com/me")
+
+    assert seen == ["Bearer token-1", "Bearer token-2"]
+    assert len(token_posts) == 1
+
+
+async def test_latency_budget_fails_fast(make_session):
+    """A stuck upstream fails with a structured error once the budget is spent."""
+
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    session = make_session(handler)
+    session.config.latency_budgets = {"jira_get_issue": 0.05}
+    client = BaseAtlassianClient(session.config, session)
+
+    started = time.monotonic()
+    with pytest.raises(AtlassianError) as excinfo:
+        await client.make_request(
+            "GET", "https://api.atlassian.com/me", budget="jira_get_issue"
+        )
+
+    assert excinfo.value.error_code == "LATENCY_BUDGET_EXCEEDED"
+    assert time.monotonic() - started < 0.5
+    assert client.latency_budget("bulk_export") == 300.0
+    assert client.latency_budget(None) is None
+
+
+async def test_transport_timeout_is_structured(make_client):
+    """httpx timeouts surface as REQUEST_TIMEOUT errors."""
+
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = make_client(handler)
+    with pytest.raises(AtlassianError) as excinfo:
+        await client.make_request("GET", "https://api.atlassian.com/me")
+    assert excinfo.value.error_code == "REQUEST_TIMEOUT"
+
+
+async def test_cloud_id_warm_start_from_persistent_cache(
+    tmp_path, make_config, make_client
+):
+    """A restarted session reuses the persisted cloud ID for the same token."""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return resources_response()
+
+    def restart():
+        config = make_config()
+        config.persistent_cache = True
+        config.persistent_cache_path = str(tmp_path / "cache.sqlite3")
+        return make_client(handler, config=config)
+
+    assert await restart().get_cloud_id() == CLOUD_ID
+    assert await restart().get_cloud_id() == CLOUD_ID
+    assert calls == [RESOURCES_URL]
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Unit tests for client-side response caches."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianError,
+    JiraClient,
+    NewIssue,
+    ServiceDeskClient,
+)
+from atlassian_mcp_server.clients.cache import ReferenceCache, ValidatorCache
+
+PAGE_URL = "https://api.atlassian.com/ex/confluence/cloud-123/wiki/api/v2/pages/42"
+
+
+async def test_conditional_get_serves_304_from_cache(make_client):
+    """Repeat GETs send If-None-Match and reuse the cached body on 304."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"title": "Page"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    params = {"body-format": "storage"}
+    first = await client.make_request("GET", PAGE_URL, params=params)
+    second = await client.make_request("GET", PAGE_URL, params=params)
+
+    assert seen == [None, '"v1"']
+    assert second.status_code == 200
+    assert second.json() == first.json() == {"title": "Page"}
+    metrics = client.session.metrics
+    assert metrics.get("http_cache_hits") == 1
+    assert metrics.get("http_cache_misses") == 1
+    assert metrics.get("http_cache_bytes_saved") == len(first.content)
+
+
+async def test_write_invalidates_cached_reads(make_client):
+    """A successful PUT drops cached GETs of the same resource."""
+
+    def handler(request):
+        return httpx.Response(200, json={}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    await client.make_request("GET", PAGE_URL, params={"body-format": "storage"})
+    assert len(client.session.validator_cache) == 1
+
+    await client.make_request("PUT", PAGE_URL, json={})
+    assert len(client.session.validator_cache) == 0
+
+
+def test_validator_cache_is_size_bounded():
+    """The least recently used bodies are evicted past the byte limit."""
+    cache = ValidatorCache(max_bytes=10)
+    request = httpx.Request("GET", PAGE_URL)
+    for name in ("a", "b", "c"):
+        cache.store(
+            name,
+            httpx.Response(
+                200, content=b"12345", headers={"ETag": name}, request=request
+            ),
+        )
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.size == 10
+
+
+async def test_cache_disabled_with_zero_bytes(make_client):
+    """Setting the cache size to zero turns conditional requests off."""
+    client = make_client(lambda request: httpx.Response(200), http_cache_bytes=0)
+    await client.make_request("GET", PAGE_URL)
+    assert client.session.validator_cache is None
+
+
+async def test_reference_cache_single_flight_and_ttl():
+    """Concurrent misses share one load; expired entries are reloaded."""
+    cache = ReferenceCache(max_bytes=1024, ttls={"project": 60})
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return [{"id": "10001", "name": "Task"}]
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("project", "PROJ", loader) for _ in range(5))
+    )
+    assert len(loads) == 1
+    assert all(result == results[0] for result in results)
+
+    cache.ttls["project"] = 0
+    cache.set("project", "PROJ", [])
+    await cache.get_or_load("project", "PROJ", loader)
+    assert len(loads) == 2
+
+
+def test_reference_cache_memory_bound():
+    """Entries are evicted least recently used first once over the byte bound."""
+    cache = ReferenceCache(max_bytes=40)
+    cache.set("space", "A", "x" * 15)
+    cache.set("space", "B", "x" * 15)
+    cache.get("space", "A")
+    cache.set("space", "C", "x" * 15)
+    assert cache.get("space", "B") == (False, None)
+    assert cache.get("space", "A")[0]
+    assert cache.size <= 40
+
+
+async def test_create_issue_reuses_cached_create_metadata(make_client):
+    """Creating several issues looks up the project's create metadata once."""
+    project_lookups = []
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/accessible-resources"):
+            return httpx.Response(
+                200, json=[{"id": "cloud-123", "url": "https://example.atlassian.net"}]
+            )
+        if path.endswith("/createmeta/PROJ/issuetypes"):
+            project_lookups.append(request)
+            return httpx.Response(
+                200, json={"issueTypes": [{"id": "10001", "name": "Task"}], "total": 1}
+            )
+        if path.endswith("/createmeta/PROJ/issuetypes/10001"):
+            project_lookups.append(request)
+            return httpx.Response(200, json={"fields": [], "total": 0})
+        return httpx.Response(201, json={"key": "PROJ-1"})
+
+    client = make_client(handler, JiraClient)
+    for _ in range(3):
+        await client.jira_create_issue(
+            NewIssue(project_key="PROJ", summary="Summary", description="D")
+        )
+
+    assert len(project_lookups) == 2
+
+
+async def test_failed_reference_lookup_is_not_cached(make_client):
+    """An error response raises instead of caching an empty result."""
+    statuses = [403, 200]
+
+    def handler(request):
+        if request.url.path.endswith("/accessible-resources"):
+            return httpx.Response(
+                200, json=[{"id": "cloud-123", "url": "https://example.atlassian.net"}]
+            )
+        status = statuses.pop(0)
+        return httpx.Response(status, json={"values": [{"id": "1"}]})
+
+    client = make_client(handler, ServiceDeskClient)
+    with pytest.raises(AtlassianError) as excinfo:
+        await client.servicedesk_list_request_types("7")
+    assert excinfo.value.error_code == "REQUEST_TYPES_FAILED"
+
+    assert await client.servicedesk_list_request_types("7") == [{"id": "1"}]
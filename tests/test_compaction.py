@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Unit tests for Jira response pruning and flattening."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients.compaction import compact_response
+
+SELF = "https://api.atlassian.com/ex/jira/cloud/rest/api/3"
+
+
+def user(name):
+    return {
+        "self": f"{SELF}/user?accountId=acc-{name}",
+        "accountId": f"acc-{name}",
+        "avatarUrls": {"48x48": "a", "24x24": "b", "16x16": "c", "32x32": "d"},
+        "displayName": name,
+        "active": True,
+        "timeZone": "UTC",
+    }
+
+
+def issue():
+    description = {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Hi"}]}],
+    }
+    return {
+        "expand": "renderedFields,names",
+        "self": f"{SELF}/issue/10001",
+        "id": "10001",
+        "key": "PROJ-1",
+        "fields": {
+            "status": {
+                "self": f"{SELF}/status/1",
+                "name": "Open",
+                "iconUrl": "icon",
+                "statusCategory": {"self": f"{SELF}/statuscategory/2", "name": "To Do"},
+            },
+            "priority": {"self": f"{SELF}/priority/3", "name": "High", "iconUrl": "i"},
+            "assignee": user("Ada"),
+            "reporter": None,
+            "components": [{"self": f"{SELF}/component/1", "id": "1", "name": "API"}],
+            "customfield_10020": [user("Bob"), user("Cy")],
+            "description": description,
+            "comment": {
+                "comments": [{"id": "1", "author": user("Bob"), "body": description}],
+                "self": f"{SELF}/issue/10001/comment",
+            },
+        },
+    }
+
+
+def test_prune_drops_noise_and_keeps_shape():
+    """Links, avatars, icons and expand hints go; objects keep their structure."""
+    result = compact_response(issue(), "prune")
+    fields = result["fields"]
+
+    assert set(result) == {"id", "key", "fields"}
+    assert fields["status"] == {"name": "Open", "statusCategory": {"name": "To Do"}}
+    assert fields["assignee"] == {
+        "accountId": "acc-Ada",
+        "displayName": "Ada",
+        "active": True,
+    }
+    assert fields["description"]["type"] == "doc"
+    assert fields["comment"] == {
+        "comments": [
+            {
+                "id": "1",
+                "author": {
+                    "accountId": "acc-Bob",
+                    "displayName": "Bob",
+                    "active": True,
+                },
+                "body": fields["description"],
+            }
+        ]
+    }
+
+
+def test_flatten_reduces_common_objects_to_scalars():
+    """Status, priority, users and component lists become names."""
+    result = compact_response(issue(), "flatten", "markdown")
+    fields = result["fields"]
+
+    assert fields["status"] == "Open"
+    assert fields["priority"] == "High"
+    assert fields["assignee"] == "Ada"
+    assert fields["reporter"] is None
+    assert fields["components"] == ["API"]
+    assert fields["customfield_10020"] == ["Bob", "Cy"]
+    assert fields["description"] == "Hi"
+    assert fields["comment"]["comments"][0] == {
+        "id": "1",
+        "author": "Bob",
+        "body": "Hi",
+    }
+
+
+def test_none_leaves_response_untouched():
+    original = issue()
+    assert compact_response(issue(), "none") == original
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Unit tests for the local issue store and incremental JQL sync."""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianError,
+    JiraClient,
+    JiraSync,
+)
+from atlassian_mcp_server.clients.jira_sync import updated_since
+from atlassian_mcp_server.storage import IssueStore
+
+RESOURCES = [{"id": "cloud-123", "url": "https://example.atlassian.net"}]
+
+
+class FakeJira:
+    """Search endpoint over a mutable set of issues."""
+
+    def __init__(self, count):
+        self.issues = {
+            f"PROJ-{i}": {"updated": f"2024-01-01T00:00:{i:02d}.000+0000"}
+            for i in range(1, count + 1)
+        }
+        self.queries = []
+
+    def __call__(self, request):
+        if request.url.path.endswith("/accessible-resources"):
+            return httpx.Response(200, json=RESOURCES)
+        body = json.loads(request.content)
+        self.queries.append(body["jql"])
+        keys = list(self.issues)
+        if "updated >=" in body["jql"]:
+            keys = [k for k, v in self.issues.items() if v.get("changed")]
+        issues = [
+            {"id": key.split("-")[1], "key": key, "fields": dict(self.issues[key])}
+            for key in keys
+        ]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+
+@pytest.fixture
+def make_sync(make_client, tmp_path):
+    """Factory for a JiraSync over ``fake`` with a store under ``tmp_path``."""
+
+    def factory(fake, **config):
+        client = make_client(
+            fake,
+            JiraClient,
+            issue_store_path=str(tmp_path / "issues.sqlite3"),
+            **config,
+        )
+        return JiraSync(client)
+
+    return factory
+
+
+def test_updated_since_keeps_order_by():
+    """The watermark clause is ANDed in front of any ORDER BY."""
+    assert (
+        updated_since("project = PROJ order by rank", 5)
+        == '(project = PROJ) AND updated >= "-5m" ORDER BY rank'
+    )
+    assert updated_since("ORDER BY key", 5) == 'updated >= "-5m" ORDER BY key'
+
+
+def test_updated_since_ignores_order_by_in_strings():
+    """ORDER BY inside quoted text, escaped quotes included, is left alone."""
+    assert (
+        updated_since('summary ~ "sort order by date" ORDER BY created DESC', 5)
+        == '(summary ~ "sort order by date") AND updated >= "-5m" '
+        "ORDER BY created DESC"
+    )
+    assert (
+        updated_since("text ~ 'say \\'order by\\' twice'", 5)
+        == "(text ~ 'say \\'order by\\' twice') AND updated >= \"-5m\""
+    )
+
+
+async def test_backfill_then_incremental_sync(make_sync):
+    """After the backfill only recently updated issues are fetched."""
+    fake = FakeJira(3)
+    sync = make_sync(fake)
+
+    first = await sync.sync("project = PROJ")
+    assert first["mode"] == "backfill"
+    assert first["issue_count"] == 3
+
+    fake.issues["PROJ-2"] = {"updated": "2024-01-02T00:00:00.000+0000", "changed": 1}
+    second = await sync.sync("project  =  PROJ")
+    assert second["mode"] == "incremental"
+    assert second["fetched"] == 1
+    assert fake.queries[-1] == '(project  =  PROJ) AND updated >= "-3m"'
+
+    result = await sync.query("project = PROJ", max_age=3600)
+    assert [i["key"] for i in result["issues"]] == ["PROJ-2", "PROJ-3", "PROJ-1"]
+    assert len(fake.queries) == 2
+
+
+async def test_reconcile_removes_deleted_issues(make_sync):
+    """A due reconcile drops issues that Jira no longer returns."""
+    fake = FakeJira(3)
+    sync = make_sync(fake, sync_reconcile_seconds=0)
+    await sync.sync("project = PROJ")
+
+    del fake.issues["PROJ-1"]
+    stats = await sync.sync("project = PROJ")
+
+    assert stats["reconciled"] and stats["removed"] == 1
+    result = await sync.query("project = PROJ")
+    assert {i["key"] for i in result["issues"]} == {"PROJ-2", "PROJ-3"}
+
+
+async def test_failed_sync_leaves_store_untouched(make_sync):
+    """A failed reconcile listing raises before anything is written."""
+    fake = FakeJira(3)
+    await make_sync(fake).sync("project = PROJ")
+
+    def failing_listing(request):
+        if json.loads(request.content or b"{}").get("fields") == ["id"]:
+            message = "The value 'PROJ' does not exist for the field 'project'."
+            return httpx.Response(400, json={"errorMessages": [message]})
+        return fake(request)
+
+    sync = make_sync(failing_listing, sync_reconcile_seconds=0)
+    state = sync.store.sync_state("project = PROJ")
+    fake.issues["PROJ-2"] = {"updated": "2024-01-02T00:00:00.000+0000", "changed": 1}
+    with pytest.raises(AtlassianError, match="does not exist"):
+        await sync.sync("project = PROJ")
+
+    assert sync.store.sync_state("project = PROJ") == state
+    issues = sync.store.query("project = PROJ")
+    assert [i["key"] for i in issues] == ["PROJ-3", "PROJ-2", "PROJ-1"]
+    assert issues[1]["fields"]["updated"] == "2024-01-01T00:00:02.000+0000"
+
+
+def adf(text):
+    """Single-paragraph ADF document."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+async def test_local_search_ranks_and_updates_incrementally(make_sync):
+    """Summary matches outrank comment matches and edits replace old text."""
+    fake = FakeJira(3)
+    fake.issues["PROJ-1"].update(summary="Login page crashes", description=adf("x"))
+    fake.issues["PROJ-2"].update(
+        summary="Unrelated",
+        description=adf("Steps to reproduce"),
+        comment={"comments": [{"body": adf("Also seen when the login times out")}]},
+    )
+    fake.issues["PROJ-3"].update(summary="Billing export", description=adf("CSV"))
+    sync = make_sync(fake)
+    await sync.sync("project = PROJ")
+
+    results = await sync.search("login")
+    assert [r["key"] for r in results] == ["PROJ-1", "PROJ-2"]
+    assert "[login]" in results[1]["snippet"]
+    assert await sync.search("logi*") and await sync.search('"unbalanced') == []
+
+    fake.issues["PROJ-3"].update(description=adf("Login audit export"), changed=1)
+    await sync.sync("project = PROJ")
+    assert {r["key"] for r in await sync.search("login")} == {
+        "PROJ-1",
+        "PROJ-2",
+        "PROJ-3",
+    }
+    assert await sync.search("CSV") == []
+
+
+def test_search_index_survives_vacuum(tmp_path):
+    """Index entries stay with their issues when VACUUM compacts the file."""
+    store = IssueStore("https://example.atlassian.net", tmp_path / "issues.sqlite3")
+    issues = [{"id": str(i), "key": f"PROJ-{i}"} for i in range(1, 4)]
+    texts = {f"PROJ-{i}": (f"summary{i}", "", "") for i in range(1, 4)}
+    store.upsert("project = PROJ", issues, texts)
+    store.reconcile("project = PROJ", ["PROJ-2", "PROJ-3"])
+
+    conn = sqlite3.connect(store.path)
+    conn.execute("VACUUM")
+    conn.close()
+
+    assert [r["key"] for r in store.search("summary3")] == ["PROJ-3"]
+    assert [r["key"] for r in store.search("summary2")] == ["PROJ-2"]
@@ -0,0 +1,1057 @@
+#!/usr/bin/env python3
+"""Unit tests for JiraClient request shaping and pagination."""
+
+import asyncio
+import json
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianError,
+    IssueView,
+    JiraClient,
+    NewIssue,
+    Traversal,
+)
+
+RESOURCES = [{"id": "cloud-123", "url": "https://example.atlassian.net"}]
+
+
+@pytest.fixture
+def make_jira(make_client):
+    """Factory for a JiraClient whose Jira traffic is served by ``handler``."""
+
+    def factory(handler):
+        def route(request):
+            if request.url.path.endswith("/accessible-resources"):
+                return httpx.Response(200, json=RESOURCES)
+            return handler(request)
+
+        return make_client(route, JiraClient)
+
+    return factory
+
+
+def createmeta(request):
+    """Serve create metadata for project PROJ (Task and Bug types)."""
+    path = request.url.path
+    if path.endswith("/createmeta/PROJ/issuetypes"):
+        types = [{"id": "10001", "name": "Task"}, {"id": "10004", "name": "Bug"}]
+        return httpx.Response(200, json={"issueTypes": types, "total": 2})
+    if path.endswith("/createmeta/PROJ/issuetypes/10004"):
+        fields = [
+            {"fieldId": "summary", "name": "Summary", "required": True},
+            {
+                "fieldId": "priority",
+                "name": "Priority",
+                "required": True,
+                "allowedValues": [
+                    {"id": "1", "name": "High"},
+                    {"id": "2", "name": "Low"},
+                ],
+            },
+        ]
+        return httpx.Response(200, json={"fields": fields, "total": 2})
+    if "/createmeta/PROJ/issuetypes/" in path:
+        return httpx.Response(200, json={"fields": [], "total": 0})
+    return httpx.Response(404, json={"errorMessages": ["No project"]})
+
+
+def search_pages(total, page_size):
+    """Handler serving ``total`` issues from /search/jql in token-linked pages."""
+    requests = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        start = int(body.get("nextPageToken") or 0)
+        end = min(start + body["maxResults"], total, start + page_size)
+        page = {"issues": [{"key": f"PROJ-{i}"} for i in range(start, end)]}
+        if end < total:
+            page["nextPageToken"] = str(end)
+        else:
+            page["isLast"] = True
+        return httpx.Response(200, json=page)
+
+    return handler, requests
+
+
+async def test_search_follows_next_page_token(make_jira):
+    """Results past the first page are returned, up to max_results."""
+    handler, requests = search_pages(total=250, page_size=100)
+    jira = make_jira(handler)
+
+    issues = await jira.jira_search("project = PROJ", max_results=220)
+
+    assert [i["key"] for i in issues] == [f"PROJ-{i}" for i in range(220)]
+    assert [r.get("nextPageToken") for r in requests] == [None, "100", "200"]
+    assert [r["maxResults"] for r in requests] == [100, 100, 20]
+
+
+async def test_search_stops_at_last_page(make_jira):
+    """An uncapped search ends when Jira reports the last page."""
+    handler, requests = search_pages(total=130, page_size=100)
+    jira = make_jira(handler)
+
+    keys = [i["key"] async for i in jira.iter_jira_search("project = PROJ")]
+
+    assert len(keys) == 130
+    assert len(requests) == 2
+
+
+async def test_search_stops_prefetching_when_consumer_stops(make_jira):
+    """Breaking out of the iterator fetches at most one page ahead."""
+    handler, requests = search_pages(total=1000, page_size=100)
+    jira = make_jira(handler)
+
+    search = jira.iter_jira_search("project = PROJ")
+    async for issue in search:
+        if issue["key"] == "PROJ-5":
+            break
+    await search.aclose()
+
+    assert len(requests) <= 2
+
+
+async def test_search_rejects_invalid_jql(make_jira):
+    """Jira's error messages for an invalid query are raised, not swallowed."""
+    message = "Error in the JQL Query: Expecting ')' but got the end of the query."
+    jira = make_jira(
+        lambda request: httpx.Response(400, json={"errorMessages": [message]})
+    )
+
+    with pytest.raises(AtlassianError, match=re.escape(message)) as excinfo:
+        await jira.jira_search("project = PROJ AND (status = Done")
+    assert excinfo.value.error_code == "JQL_SEARCH_FAILED"
+    assert excinfo.value.context == {
+        "jql": "project = PROJ AND (status = Done",
+        "status_code": 400,
+    }
+
+
+async def test_search_uses_compact_profile_and_resolves_names(make_jira):
+    """Display names map to field ids through one cached field lookup."""
+    field_lookups = []
+    bodies = []
+
+    def handler(request):
+        if request.url.path.endswith("/rest/api/3/field"):
+            field_lookups.append(request)
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": "summary", "name": "Summary"},
+                    {"id": "customfield_10016", "name": "Story Points"},
+                ],
+            )
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"issues": [], "isLast": True})
+
+    jira = make_jira(handler)
+    await jira.jira_search("project = PROJ")
+    await jira.jira_search(
+        "project = PROJ", view=IssueView(fields=["summary", "Story Points"])
+    )
+    await jira.jira_search(
+        "project = PROJ", view=IssueView(fields=["story points"], expand=["names"])
+    )
+
+    assert "description" not in bodies[0]["fields"]
+    assert bodies[1]["fields"] == ["summary", "customfield_10016"]
+    assert bodies[2] == {
+        "jql": "project = PROJ",
+        "fields": ["customfield_10016"],
+        "expand": "names",
+        "maxResults": 50,
+    }
+    assert len(field_lookups) == 1
+
+
+async def test_get_issue_requests_profile_fields(make_jira):
+    """jira_get_issue asks for every field unless a profile narrows them."""
+    params = []
+
+    def handler(request):
+        params.append(dict(request.url.params))
+        return httpx.Response(200, json={"key": "PROJ-1"})
+
+    jira = make_jira(handler)
+    await jira.jira_get_issue("PROJ-1", view=IssueView(profile="standard"))
+    await jira.jira_get_issue("PROJ-1", view=IssueView(expand=["changelog"]))
+
+    assert "description" in params[0]["fields"].split(",")
+    assert "comment" not in params[0]["fields"].split(",")
+    assert params[1] == {"fields": "*all", "expand": "changelog"}
+
+
+async def test_get_issue_raises_on_error_response(make_jira):
+    """A missing issue raises instead of being shaped as an issue."""
+    message = "Issue does not exist or you do not have permission to see it."
+    jira = make_jira(
+        lambda request: httpx.Response(404, json={"errorMessages": [message]})
+    )
+
+    with pytest.raises(AtlassianError, match=re.escape(message)) as excinfo:
+        await jira.jira_get_issue("PROJ-404")
+    assert excinfo.value.error_code == "ISSUE_FETCH_FAILED"
+    assert excinfo.value.context == {"issue_key": "PROJ-404", "status_code": 404}
+
+
+async def test_get_issues_chunks_and_keeps_input_order(make_jira):
+    """Keys are fetched 100 at a time and returned in the order requested."""
+    chunks = []
+
+    def handler(request):
+        keys = json.loads(request.content)["issueIdsOrKeys"]
+        chunks.append(keys)
+        issues = [
+            {"id": str(10000 + int(key.split("-")[1])), "key": key}
+            for key in keys
+            if key != "PROJ-7"
+        ]
+        # bulkfetch returns issues sorted by id, not in request order
+        return httpx.Response(
+            200, json={"issues": sorted(issues, key=lambda i: i["id"])}
+        )
+
+    jira = make_jira(handler)
+    keys = [f"PROJ-{i}" for i in range(250, 0, -1)]
+    result = await jira.jira_get_issues(keys + ["PROJ-3"])
+
+    assert sorted(len(chunk) for chunk in chunks) == [50, 100, 100]
+    assert [i["key"] for i in result["issues"]] == [k for k in keys if k != "PROJ-7"]
+    assert [e["key"] for e in result["errors"]] == ["PROJ-7"]
+
+
+async def test_get_issues_reports_failed_chunk_per_key(make_jira):
+    """A rejected chunk turns into per-key errors rather than an exception."""
+
+    def handler(request):
+        return httpx.Response(400, json={"errorMessages": ["Bad request"]})
+
+    jira = make_jira(handler)
+    result = await jira.jira_get_issues(["PROJ-1", "PROJ-2"])
+
+    assert result["issues"] == []
+    assert result["errors"] == [
+        {"key": "PROJ-1", "error": "Bad request"},
+        {"key": "PROJ-2", "error": "Bad request"},
+    ]
+
+
+async def test_create_issues_batches_and_reports_per_item(make_jira):
+    """Items go out 50 per request with one project lookup and per-item results."""
+    project_lookups = []
+    batches = []
+
+    def handler(request):
+        if "/createmeta/" in request.url.path:
+            project_lookups.append(request)
+            return createmeta(request)
+        updates = json.loads(request.content)["issueUpdates"]
+        offset = sum(len(b) for b in batches)
+        batches.append(updates)
+        issues, errors = [], []
+        for n, update in enumerate(updates):
+            if update["fields"]["summary"] == "bad":
+                errors.append(
+                    {
+                        "failedElementNumber": n,
+                        "elementErrors": {"errors": {"summary": "Invalid"}},
+                        "status": 400,
+                    }
+                )
+            else:
+                issues.append({"id": str(offset + n), "key": f"PROJ-{offset + n}"})
+        return httpx.Response(201, json={"issues": issues, "errors": errors})
+
+    jira = make_jira(handler)
+    items = [{"project_key": "PROJ", "summary": f"Issue {i}"} for i in range(120)]
+    items[3]["summary"] = "bad"
+    items[60]["summary"] = ""
+    results = await jira.jira_create_issues(items)
+
+    assert len(project_lookups) == 2
+    assert [len(batch) for batch in batches] == [50, 50, 19]
+    assert results[3] == {"index": 3, "success": False, "error": "summary: Invalid"}
+    assert results[60] == {
+        "index": 60,
+        "success": False,
+        "error": "summary is required",
+    }
+    assert results[4]["success"] and results[4]["key"] == "PROJ-4"
+    assert sum(r["success"] for r in results) == 118
+
+
+async def test_create_issue_rejects_invalid_payload_locally(make_jira):
+    """Unknown types, missing required fields and bad values never reach Jira."""
+    creates = []
+
+    def handler(request):
+        if "/createmeta/" in request.url.path:
+            return createmeta(request)
+        creates.append(json.loads(request.content))
+        return httpx.Response(201, json={"key": "PROJ-1"})
+
+    jira = make_jira(handler)
+    for issue_type, fields, message in [
+        ("Epic", None, "Available types: Task, Bug"),
+        ("Bug", None, "Priority (priority) is required"),
+        ("Bug", {"priority": {"name": "Urgent"}}, "not an allowed value"),
+        ("Task", {"labels": ["ops"]}, "cannot be set"),
+    ]:
+        with pytest.raises(ValueError, match=re.escape(message)):
+            await jira.jira_create_issue(
+                NewIssue(
+                    project_key="PROJ",
+                    summary="S",
+                    description="D",
+                    issue_type=issue_type,
+                    fields=fields,
+                )
+            )
+    assert creates == []
+
+    await jira.jira_create_issue(
+        NewIssue(
+            project_key="PROJ",
+            summary="S",
+            issue_type="bug",
+            fields={"priority": {"name": "High"}},
+        )
+    )
+    assert creates[0]["fields"]["issuetype"] == {"id": "10004"}
+    assert creates[0]["fields"]["priority"] == {"name": "High"}
+
+
+async def test_count_uses_approximate_count(make_jira):
+    """Count mode is a single approximate-count call."""
+
+    def handler(request):
+        assert request.url.path.endswith("/search/approximate-count")
+        return httpx.Response(200, json={"count": 153})
+
+    jira = make_jira(handler)
+    assert await jira.jira_count("project = PROJ") == 153
+
+
+async def test_count_raises_on_error_response(make_jira):
+    """Jira's error messages, or the status code, surface as JQL_COUNT_FAILED."""
+    message = "Unbounded JQL queries are not allowed here."
+
+    def handler(request):
+        if json.loads(request.content)["jql"] == "order by created":
+            return httpx.Response(400, json={"errorMessages": [message]})
+        return httpx.Response(403)
+
+    jira = make_jira(handler)
+    with pytest.raises(AtlassianError, match=re.escape(message)) as excinfo:
+        await jira.jira_count("order by created")
+    assert excinfo.value.error_code == "JQL_COUNT_FAILED"
+    assert excinfo.value.context["status_code"] == 400
+
+    with pytest.raises(AtlassianError, match="Issue count failed: HTTP 403"):
+        await jira.jira_count("project = SECRET")
+
+
+async def test_facets_stop_at_max_issues_and_label_missing_values(make_jira):
+    """Grouped counts scan at most max_issues and report truncation."""
+
+    def handler(request):
+        assert request.url.path.endswith("/search/jql")
+        body = json.loads(request.content)
+        issues = [
+            {"key": f"PROJ-{i}", "fields": {"labels": ["a", "b"] if i % 2 else []}}
+            for i in range(body["maxResults"])
+        ]
+        return httpx.Response(200, json={"issues": issues, "nextPageToken": "more"})
+
+    jira = make_jira(handler)
+    result = await jira.jira_facets("project = PROJ", ["labels"], max_issues=5)
+
+    assert result["issues_scanned"] == 5
+    assert result["truncated"] is True
+    assert result["facets"]["labels"] == {"(none)": 3, "a": 2, "b": 2}
+
+
+async def test_facets_stream_counts_over_pages(make_jira):
+    """Facets page through results requesting only the grouped fields."""
+    requested_fields = []
+    people = [{"displayName": "Ada"}, {"displayName": "Bob"}, None]
+
+    def handler(request):
+        body = json.loads(request.content)
+        requested_fields.append(body["fields"])
+        start = int(body.get("nextPageToken") or 0)
+        issues = [
+            {
+                "key": f"PROJ-{i}",
+                "fields": {
+                    "status": {"name": "Done" if i % 2 else "Open"},
+                    "assignee": people[i % 3],
+                },
+            }
+            for i in range(start, start + 100)
+        ]
+        page = {"issues": issues}
+        if start + 100 < 300:
+            page["nextPageToken"] = str(start + 100)
+        return httpx.Response(200, json=page)
+
+    jira = make_jira(handler)
+    result = await jira.jira_facets("project = PROJ", ["status", "assignee"])
+
+    assert requested_fields == [["status", "assignee"]] * 3
+    assert result["issues_scanned"] == 300
+    assert result["facets"]["status"] == {"Open": 150, "Done": 150}
+    assert result["facets"]["assignee"] == {"Ada": 100, "Bob": 100, "(none)": 100}
+
+
+async def test_get_issue_renders_adf_bodies(make_jira):
+    """body_format renders the description and comment bodies."""
+
+    def body(value):
+        return {
+            "type": "doc",
+            "version": 1,
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": value}]}
+            ],
+        }
+
+    def handler(request):
+        fields = {
+            "summary": "S",
+            "description": body("Details"),
+            "comment": {"comments": [{"id": "1", "body": body("Looks good")}]},
+        }
+        return httpx.Response(200, json={"key": "PROJ-1", "fields": fields})
+
+    jira = make_jira(handler)
+    issue = await jira.jira_get_issue("PROJ-1", view=IssueView(body_format="markdown"))
+
+    assert issue["fields"]["description"] == "Details"
+    assert issue["fields"]["comment"]["comments"][0]["body"] == "Looks good"
+    assert (await jira.jira_get_issue("PROJ-1"))["fields"]["description"] == body(
+        "Details"
+    )
+
+
+async def test_write_paths_convert_markdown(make_jira):
+    """Descriptions and comments are sent as structured ADF, not one paragraph."""
+    sent = []
+
+    def handler(request):
+        if "/createmeta/" in request.url.path:
+            return createmeta(request)
+        sent.append(json.loads(request.content))
+        return httpx.Response(201, json={"id": "1", "key": "PROJ-1"})
+
+    jira = make_jira(handler)
+    markdown = "## Steps\n\n1. Open\n2. Click\n\n```\ntrace\n```"
+    await jira.jira_create_issue(
+        NewIssue(project_key="PROJ", summary="S", description=markdown)
+    )
+    await jira.jira_update_issue("PROJ-1", description=markdown)
+    await jira.jira_add_comment("PROJ-1", markdown)
+
+    bodies = [
+        sent[0]["fields"]["description"],
+        sent[1]["fields"]["description"],
+        sent[2]["body"],
+    ]
+    for body in bodies:
+        assert [node["type"] for node in body["content"]] == [
+            "heading",
+            "orderedList",
+            "codeBlock",
+        ]
+
+
+async def test_get_issue_prunes_by_default_and_flattens_on_request(make_jira):
+    """The configured compaction applies unless a call asks for another mode."""
+
+    def handler(request):
+        fields = {
+            "status": {"self": "https://x/status/1", "name": "Open", "iconUrl": "i"},
+            "assignee": {
+                "accountId": "acc-1",
+                "displayName": "Ada",
+                "avatarUrls": {"48x48": "a"},
+            },
+        }
+        return httpx.Response(
+            200, json={"self": "https://x/issue/1", "key": "PROJ-1", "fields": fields}
+        )
+
+    jira = make_jira(handler)
+    pruned = await jira.jira_get_issue("PROJ-1")
+    flat = await jira.jira_get_issue("PROJ-1", view=IssueView(compaction="flatten"))
+    raw = await jira.jira_get_issue("PROJ-1", view=IssueView(compaction="none"))
+
+    assert pruned == {
+        "key": "PROJ-1",
+        "fields": {
+            "status": {"name": "Open"},
+            "assignee": {"accountId": "acc-1", "displayName": "Ada"},
+        },
+    }
+    assert flat["fields"] == {"status": "Open", "assignee": "Ada"}
+    assert raw["self"] == "https://x/issue/1"
+    with pytest.raises(ValueError, match="compaction mode"):
+        await jira.jira_get_issue("PROJ-1", view=IssueView(compaction="tiny"))
+
+
+def user_bulk(request, known=None):
+    """Serve /user/bulk for every requested id (or only ``known`` ones)."""
+    ids = request.url.params.get_list("accountId")
+    values = [
+        {"accountId": a, "displayName": f"Name {a}", "avatarUrls": {}}
+        for a in ids
+        if known is None or a in known
+    ]
+    return httpx.Response(200, json={"values": values, "isLast": True})
+
+
+async def test_resolve_users_batches_and_caches(make_jira):
+    """Ids are looked up 100 per request, once, unknown ids included."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return user_bulk(request, known={f"acc-{i}" for i in range(0, 250, 2)})
+
+    jira = make_jira(handler)
+    ids = [f"acc-{i}" for i in range(250)]
+    first, again = await asyncio.gather(
+        jira.resolve_users(ids), jira.resolve_users(ids[:10])
+    )
+
+    assert sorted(len(r.url.params.get_list("accountId")) for r in requests) == [
+        50,
+        100,
+        100,
+    ]
+    assert len(first) == 125 and first["acc-4"]["displayName"] == "Name acc-4"
+    assert set(again) == {f"acc-{i}" for i in range(0, 10, 2)}
+    assert await jira.resolve_users(ids) == first
+    assert len(requests) == 3
+
+
+async def test_search_names_mentions_and_users_in_one_lookup(make_jira):
+    """Unnamed mentions and users across results are resolved in one request."""
+    user_requests = []
+
+    def handler(request):
+        if request.url.path.endswith("/user/bulk"):
+            user_requests.append(request)
+            return user_bulk(request)
+        mention = {"type": "mention", "attrs": {"id": "acc-2"}}
+        issues = [
+            {
+                "id": str(n),
+                "key": f"PROJ-{n}",
+                "fields": {
+                    "assignee": {"accountId": f"acc-{n}"},
+                    "description": {
+                        "type": "doc",
+                        "version": 1,
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [{"type": "text", "text": "cc "}, mention],
+                            }
+                        ],
+                    },
+                },
+            }
+            for n in (1, 3)
+        ]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    jira = make_jira(handler)
+    issues = await jira.jira_search(
+        "project = PROJ", view=IssueView(body_format="markdown")
+    )
+
+    assert len(user_requests) == 1
+    assert sorted(user_requests[0].url.params.get_list("accountId")) == [
+        "acc-1",
+        "acc-2",
+        "acc-3",
+    ]
+    assert issues[0]["fields"]["assignee"]["displayName"] == "Name acc-1"
+    assert issues[1]["fields"]["description"] == "cc @Name acc-2"
+
+
+async def test_failed_user_lookup_leaves_results_unchanged(make_jira):
+    """Enrichment is best effort; the search itself still succeeds."""
+
+    def handler(request):
+        if request.url.path.endswith("/user/bulk"):
+            return httpx.Response(403, json={})
+        issue = {"id": "1", "key": "PROJ-1", "fields": {"assignee": {"accountId": "a"}}}
+        return httpx.Response(200, json={"issues": [issue], "isLast": True})
+
+    jira = make_jira(handler)
+    issues = await jira.jira_search("project = PROJ")
+
+    assert issues[0]["fields"]["assignee"] == {"accountId": "a"}
+
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "clauseNames": ["summary"]},
+    {
+        "id": "customfield_10016",
+        "name": "Story Points",
+        "custom": True,
+        "clauseNames": ["cf[10016]", "Story Points"],
+    },
+    {"id": "customfield_10001", "name": "Team", "custom": True},
+    {"id": "customfield_10002", "name": "Team", "custom": True},
+]
+
+
+async def test_field_names_translate_both_ways(make_jira):
+    """Names and aliases resolve to ids; responses come back keyed by name."""
+    field_lookups = []
+    requests = []
+
+    def handler(request):
+        if request.url.path.endswith("/rest/api/3/field"):
+            field_lookups.append(request)
+            return httpx.Response(200, json=FIELDS)
+        requests.append(request)
+        fields = {
+            "summary": "S",
+            "customfield_10016": 5,
+            "customfield_10001": "Red",
+            "customfield_10002": "Blue",
+        }
+        return httpx.Response(200, json={"key": "PROJ-1", "fields": fields})
+
+    jira = make_jira(handler)
+    issue = await jira.jira_get_issue(
+        "PROJ-1",
+        IssueView(fields=["summary", "story_points", "customfield_10001"]),
+    )
+    raw = await jira.jira_get_issue(
+        "PROJ-1", view=IssueView(fields=["summary", "customfield_10016"])
+    )
+    named = await jira.jira_get_issue(
+        "PROJ-1", view=IssueView(fields=["summary"], field_names=True)
+    )
+
+    assert requests[0].url.params["fields"] == (
+        "summary,customfield_10016,customfield_10001"
+    )
+    assert issue["fields"] == {
+        "summary": "S",
+        "Story Points": 5,
+        "Team (customfield_10001)": "Red",
+        "Team (customfield_10002)": "Blue",
+    }
+    assert "customfield_10016" in raw["fields"]
+    assert named["fields"]["Story Points"] == 5
+    assert len(field_lookups) == 1
+
+    with pytest.raises(ValueError, match="ambiguous.*customfield_10001"):
+        await jira.jira_get_issue("PROJ-1", view=IssueView(fields=["Team"]))
+    with pytest.raises(ValueError, match="Unknown Jira field 'Sprint'"):
+        await jira.jira_get_issue("PROJ-1", view=IssueView(fields=["Sprint"]))
+    assert len(requests) == 3
+
+
+async def test_update_issue_sets_fields_by_name(make_jira):
+    """Update values given by display name are sent under the field id."""
+    sent = []
+
+    def handler(request):
+        if request.url.path.endswith("/rest/api/3/field"):
+            return httpx.Response(200, json=FIELDS)
+        sent.append(json.loads(request.content))
+        if len(sent) > 1:
+            return httpx.Response(
+                400, json={"errors": {"customfield_10016": "Number expected"}}
+            )
+        return httpx.Response(204)
+
+    jira = make_jira(handler)
+    await jira.jira_update_issue(
+        "PROJ-1", summary="New", fields={"Story Points": 8, "labels": ["ops"]}
+    )
+    with pytest.raises(AtlassianError, match="Number expected"):
+        await jira.jira_update_issue("PROJ-1", fields={"story points": "x"})
+
+    assert sent[0] == {
+        "fields": {"customfield_10016": 8, "labels": ["ops"], "summary": "New"}
+    }
+
+
+def graph_issue(key, parent=None, subtask=False, links=()):
+    """Issue with the fields a traversal reads."""
+    fields = {
+        "summary": f"Summary {key}",
+        "status": {"name": "Open"},
+        "issuetype": {"name": "Sub-task" if subtask else "Story", "subtask": subtask},
+        "issuelinks": [
+            {
+                "type": {
+                    "name": "Blocks",
+                    "inward": "is blocked by",
+                    "outward": "blocks",
+                },
+                direction: {"key": other},
+            }
+            for direction, other in links
+        ],
+    }
+    if parent:
+        fields["parent"] = {"key": parent}
+    return {"id": key, "key": key, "fields": fields}
+
+
+GRAPH = {
+    "EPIC-1": graph_issue("EPIC-1"),
+    "S-1": graph_issue("S-1", "EPIC-1", links=[("outwardIssue", "X-1")]),
+    "S-2": graph_issue("S-2", "EPIC-1"),
+    "T-1": graph_issue("T-1", "S-1", subtask=True),
+    "X-1": graph_issue("X-1", links=[("inwardIssue", "S-1")]),
+}
+
+
+def graph_handler(jql_log):
+    """Serve GRAPH through bulkfetch and "parent in (...)" searches."""
+
+    def handler(request):
+        body = json.loads(request.content)
+        if request.url.path.endswith("/issue/bulkfetch"):
+            keys = body["issueIdsOrKeys"]
+            issues = [GRAPH[k.upper()] for k in keys if k.upper() in GRAPH]
+            errors = [
+                {"id": k, "errorMessage": "No access"} for k in keys if k not in GRAPH
+            ]
+            return httpx.Response(200, json={"issues": issues, "issueErrors": errors})
+        jql_log.append(body["jql"])
+        parents = re.findall(r'"([^"]+)"', body["jql"])
+        children = [
+            issue
+            for issue in GRAPH.values()
+            if issue["fields"].get("parent", {}).get("key") in parents
+        ]
+        return httpx.Response(
+            200, json={"issues": children[: body["maxResults"]], "isLast": True}
+        )
+
+    return handler
+
+
+async def test_traverse_walks_hierarchy_and_links_by_level(make_jira):
+    """One JQL query per level finds children; links are followed by type."""
+    jql_log = []
+    jira = make_jira(graph_handler(jql_log))
+
+    tree = await jira.jira_traverse("s-1", Traversal(link_types=["blocks"]))
+
+    nodes = {node["key"]: node for node in tree["nodes"]}
+    assert tree["root"] == "S-1" and not tree["truncated"]
+    assert [n["key"] for n in tree["nodes"]][:1] == ["S-1"]
+    assert {key: n["depth"] for key, n in nodes.items()} == {
+        "S-1": 0,
+        "T-1": 1,
+        "EPIC-1": 1,
+        "X-1": 1,
+        "S-2": 2,
+    }
+    assert nodes["S-1"]["edges"] == {
+        "parent": ["EPIC-1"],
+        "blocks": ["X-1"],
+        "subtasks": ["T-1"],
+    }
+    assert nodes["EPIC-1"]["edges"] == {"children": ["S-1", "S-2"]}
+    assert nodes["X-1"]["edges"] == {"is blocked by": ["S-1"]}
+    assert jql_log[:2] == [
+        'parent in ("S-1")',
+        'parent in ("T-1", "EPIC-1", "X-1")',
+    ]
+
+
+async def test_traverse_respects_limits_and_relations(make_jira):
+    """Depth, node limits and relation choice bound the walk."""
+    jql_log = []
+    jira = make_jira(graph_handler(jql_log))
+
+    down = await jira.jira_traverse(
+        "EPIC-1", Traversal(relations=["children"], max_depth=1)
+    )
+    assert [n["key"] for n in down["nodes"]] == ["EPIC-1", "S-1", "S-2"]
+    assert "X-1" not in {n["key"] for n in down["nodes"]}
+
+    capped = await jira.jira_traverse("EPIC-1", Traversal(max_nodes=2))
+    assert len(capped["nodes"]) == 2 and capped["truncated"]
+
+    up = await jira.jira_traverse("T-1", Traversal(relations=["parent"]))
+    assert [n["key"] for n in up["nodes"]] == ["T-1", "S-1", "EPIC-1"]
+    assert len(jql_log) == 2
+
+    linked = await jira.jira_traverse("X-1", Traversal(relations=[], link_types=["*"]))
+    assert [n["key"] for n in linked["nodes"]] == ["X-1", "S-1"]
+
+    GRAPH["S-2"]["fields"]["issuelinks"] = [
+        {"type": {"name": "Relates"}, "outwardIssue": {"key": "SECRET-1"}}
+    ]
+    try:
+        hidden = await jira.jira_traverse(
+            "S-2", Traversal(relations=[], link_types=["relates"])
+        )
+    finally:
+        GRAPH["S-2"]["fields"]["issuelinks"] = []
+    assert hidden["errors"] == [{"key": "SECRET-1", "error": "No access"}]
+
+    with pytest.raises(ValueError, match="Unknown relation 'siblings'"):
+        await jira.jira_traverse("EPIC-1", Traversal(relations=["siblings"]))
+    with pytest.raises(AtlassianError, match="No access"):
+        await jira.jira_traverse("NOPE-1")
+
+
+async def test_status_times_streams_changelogs_in_batches(make_jira):
+    """Changelogs come from bulk requests and are reduced to hours per status."""
+    changelog_bodies = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        if request.url.path.endswith("/changelog/bulkfetch"):
+            changelog_bodies.append(body)
+            if "nextPageToken" not in body:
+                logs = [
+                    {
+                        "issueId": "1",
+                        "changeHistories": [
+                            {
+                                "created": "2026-01-01T10:00:00.000+0000",
+                                "author": {"accountId": "a", "avatarUrls": {}},
+                                "items": [
+                                    {
+                                        "fieldId": "status",
+                                        "fromString": "To Do",
+                                        "toString": "In Progress",
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ]
+                return httpx.Response(
+                    200, json={"issueChangeLogs": logs, "nextPageToken": "p2"}
+                )
+            logs = [
+                {
+                    "issueId": "1",
+                    "changeHistories": [
+                        {
+                            "created": "2026-01-01T14:00:00.000+0000",
+                            "items": [
+                                {
+                                    "fieldId": "status",
+                                    "fromString": "In Progress",
+                                    "toString": "Done",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ]
+            return httpx.Response(200, json={"issueChangeLogs": logs})
+        issues = [
+            {
+                "id": str(n),
+                "key": f"PROJ-{n}",
+                "fields": {
+                    "created": "2026-01-01T08:00:00.000+0000",
+                    "status": {"name": "Done" if n == 1 else "To Do"},
+                },
+            }
+            for n in (1, 2)
+        ]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    jira = make_jira(handler)
+    report = await jira.jira_status_times("project = PROJ")
+
+    assert changelog_bodies[0]["issueIdsOrKeys"] == ["1", "2"]
+    assert changelog_bodies[0]["fieldIds"] == ["status"]
+    assert changelog_bodies[1]["nextPageToken"] == "p2"
+    assert report["issues_scanned"] == 2 and not report["truncated"]
+    first = report["issues"][0]
+    assert first["key"] == "PROJ-1"
+    assert first["hours_in_status"]["To Do"] == 2.0
+    assert first["hours_in_status"]["In Progress"] == 4.0
+    assert report["statuses"]["In Progress"]["issues"] == 1
+    assert report["statuses"]["To Do"]["issues"] == 2
+
+    brief = await jira.jira_status_times("project = PROJ", include_issues=False)
+    assert "issues" not in brief
+
+
+async def test_changelogs_follow_next_page_token(make_jira):
+    """Histories split over bulkfetch pages are merged per issue, in order."""
+    bodies = []
+
+    def change(issue_id, created, to_status):
+        return {
+            "issueId": issue_id,
+            "changeHistories": [
+                {
+                    "created": created,
+                    "items": [{"fieldId": "status", "toString": to_status}],
+                }
+            ],
+        }
+
+    pages = {
+        None: ([change("1", "2026-01-01T10:00:00.000+0000", "A")], "p2"),
+        "p2": ([change("2", "2026-01-02T10:00:00.000+0000", "B")], "p3"),
+        "p3": ([change("1", "2026-01-03T10:00:00.000+0000", "C")], None),
+    }
+
+    def handler(request):
+        body = json.loads(request.content)
+        if not request.url.path.endswith("/changelog/bulkfetch"):
+            issues = [{"id": "1", "key": "PROJ-1"}, {"id": 2, "key": "PROJ-2"}]
+            return httpx.Response(200, json={"issues": issues, "isLast": True})
+        bodies.append(body)
+        logs, token = pages[body.get("nextPageToken")]
+        page = {"issueChangeLogs": logs}
+        if token:
+            page["nextPageToken"] = token
+        return httpx.Response(200, json=page)
+
+    jira = make_jira(handler)
+    results = [result async for result in jira.iter_changelogs("project = PROJ")]
+
+    assert [body.get("nextPageToken") for body in bodies] == [None, "p2", "p3"]
+    assert all(body["issueIdsOrKeys"] == ["1", "2"] for body in bodies)
+    assert [issue["key"] for issue, _ in results] == ["PROJ-1", "PROJ-2"]
+    assert [h["items"][0]["to"] for h in results[0][1]] == ["A", "C"]
+    assert [h["items"][0]["to"] for h in results[1][1]] == ["B"]
+
+
+async def test_changelog_errors_are_structured(make_jira):
+    def handler(request):
+        if request.url.path.endswith("/changelog/bulkfetch"):
+            return httpx.Response(403)
+        issues = [{"id": "1", "key": "PROJ-1"}]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    jira = make_jira(handler)
+    with pytest.raises(AtlassianError) as excinfo:
+        await jira.jira_status_times("project = PROJ")
+    assert excinfo.value.error_code == "CHANGELOG_FAILED"
+
+
+async def test_status_times_without_transitions_count_current_status(make_jira):
+    """Issues that never changed status spend their whole life in it."""
+    created = (datetime.now(timezone.utc) - timedelta(hours=3)).strftime(
+        "%Y-%m-%dT%H:%M:%S.000+0000"
+    )
+
+    def handler(request):
+        if request.url.path.endswith("/changelog/bulkfetch"):
+            return httpx.Response(200, json={"issueChangeLogs": []})
+        issues = [
+            {
+                "id": str(n),
+                "key": f"PROJ-{n}",
+                "fields": {"created": created, "status": {"name": "Backlog"}},
+            }
+            for n in (1, 2)
+        ]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    jira = make_jira(handler)
+    report = await jira.jira_status_times("project = PROJ")
+
+    assert report["issues_scanned"] == 2
+    assert [row["hours_in_status"] for row in report["issues"]] == [
+        {"Backlog": 3.0},
+        {"Backlog": 3.0},
+    ]
+    assert report["statuses"]["Backlog"]["issues"] == 2
+    assert report["statuses"]["Backlog"]["total_hours"] == 6.0
+
+
+async def test_worklog_summary_filters_to_jql_issues_and_window(make_jira):
+    """Updated-worklog pages are listed in bulk and totalled per user."""
+    since_params = []
+    listed = []
+
+    def worklog(wid, issue_id, account, started, hours):
+        return {
+            "id": str(wid),
+            "issueId": issue_id,
+            "author": {"accountId": account, "displayName": account.upper()},
+            "started": started,
+            "timeSpentSeconds": hours * 3600,
+        }
+
+    logs = {
+        1: worklog(1, "10", "ada", "2026-09-02T09:00:00.000+0000", 2),
+        2: worklog(2, "11", "bob", "2026-09-03T09:00:00.000+0000", 3),
+        3: worklog(3, "99", "ada", "2026-09-03T09:00:00.000+0000", 5),
+        4: worklog(4, "10", "ada", "2026-08-20T09:00:00.000+0000", 7),
+        5: worklog(5, "10", "ada", "2026-09-04T09:00:00.000+0000", 1),
+    }
+
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/worklog/updated"):
+            since_params.append(request.url.params["since"])
+            if len(since_params) == 1:
+                return httpx.Response(
+                    200,
+                    json={
+                        "values": [{"worklogId": 1}, {"worklogId": 2}],
+                        "until": 1000,
+                        "lastPage": False,
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "values": [{"worklogId": i} for i in (3, 4, 5)],
+                    "until": 2000,
+                    "lastPage": True,
+                },
+            )
+        body = json.loads(request.content)
+        if path.endswith("/worklog/list"):
+            listed.append(body["ids"])
+            return httpx.Response(200, json=[logs[i] for i in body["ids"]])
+        issues = [{"id": "10", "key": "PROJ-1"}, {"id": "11", "key": "PROJ-2"}]
+        return httpx.Response(200, json={"issues": issues, "isLast": True})
+
+    jira = make_jira(handler)
+    summary = await jira.jira_worklog_summary(
+        "project = PROJ", "2026-09-01", "2026-09-04"
+    )
+
+    assert since_params == ["1788220800000", "1000"]
+    assert sorted(listed) == [[1, 2], [3, 4, 5]]
+    assert summary["worklogs"] == 2
+    assert summary["total_hours"] == 5.0
+    assert summary["by_user"] == [
+        {"account_id": "bob", "name": "BOB", "hours": 3.0, "worklogs": 1},
+        {"account_id": "ada", "name": "ADA", "hours": 2.0, "worklogs": 1},
+    ]
+    assert summary["by_issue"] == {"PROJ-2": 3.0, "PROJ-1": 2.0}
+
+    with pytest.raises(ValueError, match="Invalid date"):
+        await jira.jira_worklog_summary("project = PROJ", "last week")
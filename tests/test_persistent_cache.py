@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Unit tests for the persistent warm-start cache."""
+
+import sys
+import threading
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients.cache import ReferenceCache
+from atlassian_mcp_server.storage import PersistentCache
+
+SITE = "https://example.atlassian.net"
+
+
+def test_entries_are_versioned_and_expire(tmp_path):
+    """Rewrites bump the version stamp; expired rows are not returned."""
+    cache = PersistentCache(SITE, tmp_path / "cache.sqlite3")
+    cache.put("project", "PROJ", [{"id": "1"}], ttl=60)
+    cache.put("project", "PROJ", [{"id": "2"}], ttl=60)
+
+    value, seconds_left, version = cache.get("project", "PROJ")
+    assert value == [{"id": "2"}]
+    assert 0 < seconds_left <= 60
+    assert version == 2
+
+    cache.put("space", "DOCS", "123", ttl=-1)
+    assert cache.get("space", "DOCS") is None
+
+
+def test_processes_share_entries_by_site(tmp_path):
+    """Separate cache instances on one file see each other's writes per site."""
+    path = tmp_path / "cache.sqlite3"
+    PersistentCache(SITE, path).put("space", "DOCS", "123", ttl=60)
+
+    assert PersistentCache(SITE, path).get("space", "DOCS")[0] == "123"
+    assert (
+        PersistentCache("https://other.atlassian.net", path).get("space", "DOCS")
+        is None
+    )
+
+
+def test_concurrent_writers(tmp_path):
+    """Parallel writers do not fail with database-locked errors."""
+    path = tmp_path / "cache.sqlite3"
+    errors = []
+
+    def writer(n):
+        cache = PersistentCache(SITE, path)
+        try:
+            for i in range(20):
+                cache.put("project", f"P{i}", {"writer": n}, ttl=60)
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert PersistentCache(SITE, path).get("project", "P19")[2] == 4
+
+
+async def test_reference_cache_warm_start(tmp_path):
+    """A new in-memory cache is filled from disk instead of calling the API."""
+    path = tmp_path / "cache.sqlite3"
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return [{"id": "10001", "name": "Task"}]
+
+    first = ReferenceCache(1024, backing=PersistentCache(SITE, path))
+    await first.get_or_load("project", "PROJ", loader)
+
+    restarted = ReferenceCache(1024, backing=PersistentCache(SITE, path))
+    value = await restarted.get_or_load("project", "PROJ", loader)
+
+    assert value == [{"id": "10001", "name": "Task"}]
+    assert len(loads) == 1
+    assert restarted.metrics.get("persistent_cache_hits") == 1
+
+
+async def test_cloud_id_warm_start_survives_token_refresh(make_client, tmp_path):
+    """A cloud ID saved under an older access token is reused after a refresh."""
+    lookups = []
+
+    def handler(request):
+        if request.url.path.endswith("/accessible-resources"):
+            lookups.append(request.headers["Authorization"])
+            return httpx.Response(200, json=[{"id": "cloud-123", "url": SITE}])
+        return httpx.Response(200, json={})
+
+    path = str(tmp_path / "cache.sqlite3")
+    first = make_client(handler, persistent_cache=True, persistent_cache_path=path)
+    assert await first.get_cloud_id() == "cloud-123"
+
+    restarted = make_client(
+        handler,
+        persistent_cache=True,
+        persistent_cache_path=path,
+        access_token="token-2",
+    )
+    assert await restarted.get_cloud_id() == "cloud-123"
+    assert lookups == ["Bearer token-1"]
+
+    await restarted.invalidate_cloud_id()
+    assert PersistentCache(SITE, Path(path)).get("cloud_id", SITE) is None
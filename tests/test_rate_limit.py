@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Unit tests for retry and rate limiting in the base client."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import (
+    AtlassianError,
+)
+from atlassian_mcp_server.clients.concurrency import AdaptiveLimiter, traffic_class
+from atlassian_mcp_server.clients.rate_limit import (
+    RetryPolicy,
+    RetryRequest,
+    TokenBucket,
+    retry_after_seconds,
+)
+
+URL = "https://api.atlassian.com/ex/jira/cloud-123/rest/api/3/myself"
+
+
+@pytest.fixture
+def make_client(make_client):
+    """Clients with fast backoff whose traffic is served by ``handler``."""
+
+    def factory(handler):
+        client = make_client(handler)
+        client.session.traffic.retry_policy = RetryPolicy(
+            max_retries=2, backoff_base=0.001
+        )
+        return client
+
+    return factory
+
+
+def test_retry_after_parsing():
+    """Retry-After accepts seconds and HTTP dates; reset accepts ISO 8601."""
+    assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+    assert retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert retry_after_seconds({"X-RateLimit-Reset": "2015-10-21T07:28:00Z"}) == 0
+    assert retry_after_seconds({}) is None
+
+
+def test_retry_policy_respects_idempotency():
+    """5xx is only retried for idempotent requests; 429 always."""
+    policy = RetryPolicy(max_retries=3)
+    assert policy.should_retry("GET", 503, 0, None)
+    assert not policy.should_retry("POST", 503, 0, None)
+    assert policy.should_retry("POST", 503, 0, True)
+    assert policy.should_retry("POST", 429, 0, None)
+    assert not policy.should_retry("GET", 429, 3, None)
+    assert not policy.should_retry("GET", 404, 0, None)
+
+
+def test_retry_delay_gives_up_on_long_waits_and_deadlines():
+    """Waits above max_retry_after or past the deadline end the retries."""
+    policy = RetryPolicy(max_retry_after=10.0, backoff_base=0.0)
+    get = RetryRequest("GET")
+    assert policy.retry_delay(get, 429, {"Retry-After": "2"}, 0) == 2.0
+    assert policy.retry_delay(get, 429, {"Retry-After": "60"}, 0) is None
+    assert policy.retry_delay(RetryRequest("POST"), 503, {}, 0) is None
+    soon = RetryRequest("GET", deadline=time.monotonic() + 1)
+    assert policy.retry_delay(soon, 429, {"Retry-After": "2"}, 0) is None
+
+
+async def test_429_is_retried_and_counted(make_client):
+    """A throttled request is retried after Retry-After and reported."""
+    responses = iter(
+        [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200)]
+    )
+    client = make_client(lambda request: next(responses))
+
+    response = await client.make_request("GET", URL)
+
+    assert response.status_code == 200
+    metrics = client.session.metrics
+    assert metrics.get("retries") == 1
+    assert metrics.get("retries_http_429") == 1
+    assert metrics.get("requests") == 2
+
+
+async def test_persistent_429_raises_structured_error(make_client):
+    """Exhausted retries surface a RATE_LIMITED error instead of the body."""
+    client = make_client(
+        lambda request: httpx.Response(429, headers={"Retry-After": "0"})
+    )
+
+    with pytest.raises(AtlassianError) as excinfo:
+        await client.make_request("GET", URL)
+
+    assert excinfo.value.error_code == "RATE_LIMITED"
+    assert excinfo.value.context["retries"] == 2
+
+
+async def test_post_503_is_not_retried(make_client):
+    """Non-idempotent writes are not replayed on 503."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = make_client(handler)
+    with pytest.raises(AtlassianError) as excinfo:
+        await client.make_request("POST", URL, json={})
+
+    assert excinfo.value.error_code == "SERVICE_UNAVAILABLE"
+    assert len(calls) == 1
+
+
+async def test_token_bucket_paces_after_burst():
+    """Once the burst is spent, acquire waits for the refill rate."""
+    bucket = TokenBucket(rate=1000, capacity=2)
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() > 0
+
+    bucket.observe({"X-RateLimit-NearLimit": "true"})
+    assert bucket.tokens <= 0
+
+
+def test_traffic_classes():
+    """Jira, Confluence and Assets paths get separate limiters."""
+    base = "https://api.atlassian.com/ex"
+    assert traffic_class(f"{base}/jira/c/rest/api/3/issue/X-1") == "jira"
+    assert traffic_class(f"{base}/confluence/c/wiki/api/v2/pages") == "confluence"
+    assert (
+        traffic_class(f"{base}/jira/c/rest/servicedeskapi/assets/workspace") == "assets"
+    )
+    assert traffic_class("https://api.atlassian.com/me") == "default"
+
+
+async def test_adaptive_limiter_caps_in_flight():
+    """Callers beyond the limit wait until a slot is released."""
+    limiter = AdaptiveLimiter("jira", initial=2, cooldown=0)
+    tasks = [asyncio.ensure_future(limiter.acquire()) for _ in range(4)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+    assert sum(task.done() for task in tasks) == 2
+
+    limiter.release(200, 0.01)
+    await asyncio.sleep(0)
+    assert sum(task.done() for task in tasks) == 3
+    for task in tasks:
+        task.cancel()
+
+
+def test_adaptive_limiter_aimd():
+    """Healthy responses grow the limit; 429s and latency spikes cut it."""
+    limiter = AdaptiveLimiter("jira", initial=4, max_limit=10, cooldown=0)
+    for _ in range(12):
+        limiter.in_flight += 1
+        limiter.release(200, 0.1)
+    grown = limiter.limit
+    assert grown > 4
+
+    limiter.in_flight += 1
+    limiter.release(429, 0.1)
+    assert limiter.limit == pytest.approx(grown / 2)
+
+    limiter.in_flight += 1
+    limiter.release(200, 5.0)
+    assert limiter.limit == pytest.approx(grown / 4)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared session transport and its environment settings."""
+
+import logging
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from atlassian_mcp_server.clients import AtlassianSession
+from atlassian_mcp_server.server import load_http_settings
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch):
+    """Capture the keyword arguments the session builds its HTTP client with."""
+    captured = {}
+
+    class RecordingClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+    return captured
+
+
+async def test_http2_enabled_when_h2_installed(make_config, tmp_path, client_kwargs):
+    pytest.importorskip("h2")
+    session = AtlassianSession(
+        make_config(http2=True), credentials_file=tmp_path / "credentials.json"
+    )
+    try:
+        assert client_kwargs["http2"] is True
+    finally:
+        await session.aclose()
+
+
+async def test_http2_falls_back_without_h2(
+    make_config, tmp_path, client_kwargs, monkeypatch, caplog
+):
+    # A None entry makes ``import h2`` raise ImportError
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with caplog.at_level(logging.WARNING):
+        session = AtlassianSession(
+            make_config(http2=True), credentials_file=tmp_path / "credentials.json"
+        )
+    try:
+        assert client_kwargs["http2"] is False
+        assert "falling back to HTTP/1.1" in caplog.text
+    finally:
+        await session.aclose()
+
+
+async def test_http2_off_by_default(make_config, tmp_path, client_kwargs, caplog):
+    session = AtlassianSession(
+        make_config(), credentials_file=tmp_path / "credentials.json"
+    )
+    try:
+        assert client_kwargs["http2"] is False
+        assert client_kwargs["limits"].max_keepalive_connections == 20
+        assert "h2" not in caplog.text
+    finally:
+        await session.aclose()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("1", True), ("true", True), (" On ", True), ("0", False), ("no", False)],
+)
+def test_http2_flag_parsed_from_environment(monkeypatch, value, expected):
+    monkeypatch.setenv("ATLASSIAN_HTTP2", value)
+    assert load_http_settings()["http2"] is expected
+
+
+def test_http2_flag_unset_leaves_default(monkeypatch):
+    monkeypatch.delenv("ATLASSIAN_HTTP2", raising=False)
+    assert "http2" not in load_http_settings()
+
+
+def test_invalid_http2_flag_rejected(monkeypatch):
+    monkeypatch.setenv("ATLASSIAN_HTTP2", "maybe")
+    with pytest.raises(ValueError, match="ATLASSIAN_HTTP2"):
+        load_http_settings()